@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline do scraper, usando o corpus gravado em .cache/html.
+
+Responsável por:
+- Reproduzir as páginas do cache em cada etapa do pipeline
+  (listagem, scrape_details, classify_blocks, extrair_datas,
+  arquivador, gravação do JSON e gerar_html), sem acessar a rede
+- Comparar o json da biblioteca padrão com o orjson (se instalado)
+  serializando e lendo o arquivo completo publicado em docs/api_output
+- Medir vazão, percentis de latência e pico de memória por etapa
+- Gravar os resultados em JSON
+- Comparar com um resultado anterior (baseline) e apontar regressões
+
+Uso:
+    python benchmarks/benchmark.py
+    python benchmarks/benchmark.py --repeticoes 5 --saida resultado.json
+    python benchmarks/benchmark.py --comparar benchmarks/resultados/anterior.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# o cache e os templates usam caminhos relativos à raiz do projeto
+os.chdir(RAIZ)
+sys.path.insert(0, RAIZ)
+
+from bs4 import BeautifulSoup  # noqa: E402
+from scraping import codec  # noqa: E402
+from scraping.archiver import ArquivadorEventos  # noqa: E402
+from scraping.cache import load_html  # noqa: E402
+from scraping.date_extractor import extrair_datas  # noqa: E402
+from scraping.html_generator import gerar_html  # noqa: E402
+from scraping.images import RegistroImagens  # noqa: E402
+from scraping.models import Evento, para_json  # noqa: E402
+from scraping.parser import clean_text_simple, norm_text  # noqa: E402
+from scraping.processor import classify_blocks, preproc_content  # noqa: E402
+from scraping.sources import fonte_padrao  # noqa: E402
+from scraping.storage import gerar_id_evento, salvar_lista_json  # noqa: E402
+
+PASTA_RESULTADOS = os.path.join(RAIZ, "benchmarks", "resultados")
+
+# variação tolerada antes de considerar regressão (20%: medições
+# repetidas na mesma máquina oscilam em torno de 10%)
+TOLERANCIA_PADRAO = 0.20
+
+
+# ---------------------------------------------------------
+# Corpus: páginas lidas direto do cache (sem TTL e sem rede)
+# ---------------------------------------------------------
+def ler_cache(url):
+    # bytes, como o fetch entrega ao parser
+    entrada = load_html(url, ttl=None)
+    return entrada[0] if entrada else None
+
+
+def carregar_corpus(fonte):
+    """
+    Retorna (listagens, artigos):
+    - listagens: HTML das páginas da listagem, na ordem
+    - artigos: [(card, HTML do artigo)] para os cards com artigo no cache
+    """
+    listagens = []
+    artigos = []
+
+    pagina = 1
+    while True:
+        html = ler_cache(fonte.url_pagina(pagina))
+        if html is None:
+            break
+        listagens.append(html)
+
+        for bloco in fonte.extrair_cards(BeautifulSoup(html, "html.parser")):
+            card = fonte.extrair_card(bloco)
+            if not card:
+                continue
+            html_artigo = ler_cache(card["link_evento"])
+            if html_artigo is not None:
+                artigos.append((card, html_artigo))
+
+        pagina += 1
+
+    return listagens, artigos
+
+
+# ---------------------------------------------------------
+# Medição de uma etapa
+# ---------------------------------------------------------
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def medir(entradas, funcao, repeticoes, memoria=True, itens_por_entrada=1):
+    """
+    Executa funcao(entrada) para cada entrada, `repeticoes` vezes.
+    A latência é medida por entrada; a vazão é a mediana das repetições.
+    O pico de memória é medido numa passada extra, com tracemalloc
+    (fora da cronometragem, que ele deixaria mais lenta).
+    """
+    latencias = []
+    duracoes = []
+
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for entrada in entradas:
+            t = time.perf_counter()
+            funcao(entrada)
+            latencias.append(time.perf_counter() - t)
+        duracoes.append(time.perf_counter() - inicio)
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        for entrada in entradas:
+            funcao(entrada)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    itens = len(entradas) * itens_por_entrada
+    duracao = statistics.median(duracoes)
+
+    return {
+        "itens": itens,
+        "duracao_s": round(duracao, 4),
+        "itens_por_s": round(itens / duracao, 2) if duracao else None,
+        "p50_ms": round(percentil(latencias, 50) * 1000, 3),
+        "p90_ms": round(percentil(latencias, 90) * 1000, 3),
+        "p99_ms": round(percentil(latencias, 99) * 1000, 3),
+        "max_ms": round(max(latencias) * 1000, 3) if latencias else 0.0,
+        "pico_memoria_kb": round(pico / 1024, 1) if pico is not None else None
+    }
+
+
+# ---------------------------------------------------------
+# Etapas do pipeline
+# ---------------------------------------------------------
+def executar(repeticoes, memoria=True):
+    fonte = fonte_padrao()
+    listagens, artigos = carregar_corpus(fonte)
+
+    if not listagens:
+        raise SystemExit("❌ Nenhuma página da listagem encontrada em .cache/html.")
+
+    etapas = {}
+
+    def etapa(nome, *args, **kwargs):
+        print(f"⏱️  {nome}...", flush=True)
+        etapas[nome] = medir(*args, repeticoes, memoria, **kwargs)
+
+    # 1. listagem: parse + cards
+    def parse_listagem(html):
+        soup = BeautifulSoup(html, "html.parser")
+        return [fonte.extrair_card(b) for b in fonte.extrair_cards(soup)]
+
+    etapa("listagem", listagens, parse_listagem)
+
+    # 2. scrape_details: parse do artigo + extração dos blocos (sem rede)
+    def detalhes(entrada):
+        card, html = entrada
+        evento_id = gerar_id_evento({"titulo": norm_text(card["titulo"]), "link_evento": card["link_evento"]})
+        soup = BeautifulSoup(html, "html.parser")
+        return fonte.extrair_detalhes(soup, RegistroImagens(), evento_id)
+
+    etapa("scrape_details", artigos, detalhes)
+
+    # 3. classify_blocks isolado (artigos já parseados e pré-processados)
+    def preparar(html):
+        article = BeautifulSoup(html, "html.parser").find("article", class_="noticia-conteudo")
+        return article, preproc_content(article, base=fonte.url_base) if article else []
+
+    preparados = [preparar(html) for _, html in artigos]
+    preparados = [(a, imgs) for a, imgs in preparados if a is not None]
+
+    etapa("classify_blocks", preparados, lambda e: classify_blocks(*e))
+
+    # eventos completos, usados pelas etapas seguintes
+    eventos = []
+    for card, html in artigos:
+        blocos = detalhes((card, html))
+        if not blocos:
+            continue
+        eventos.append(Evento(
+            titulo=norm_text(card["titulo"]),
+            tag_evento=norm_text(card["tag_evento"]),
+            blocos_conteudo=blocos,
+            imagem_url=card["imagem_url"],
+            link_evento=card["link_evento"],
+            fonte=fonte.nome,
+            data_exibicao=card["data_exibicao"]
+        ))
+
+    # 4. extrair_datas sobre o texto de cada evento
+    textos = [
+        " ".join([ev["data_exibicao"]] + [clean_text_simple(b.get("content", "")) for b in ev["blocos_conteudo"]])
+        for ev in eventos
+    ]
+    etapa("extrair_datas", textos, extrair_datas)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 5. arquivador: separação dos eventos por ano
+        arquivador = ArquivadorEventos(
+            caminho_principal=os.path.join(tmp, "eventos.json"),
+            pasta_arquivo=os.path.join(tmp, "arquivo")
+        )
+        etapa("arquivador", [eventos], arquivador.separar, itens_por_entrada=len(eventos))
+
+        # 6. gravação do eventos.json
+        caminho_json = os.path.join(tmp, "eventos_bench.json")
+        etapa(
+            "json",
+            [eventos],
+            lambda evs: salvar_lista_json(evs, caminho_json),
+            itens_por_entrada=len(eventos)
+        )
+
+        # 7. gerar_html (pasta nova a cada chamada: sem atalho do manifesto)
+        contador = iter(range(10 ** 6))
+
+        def html_completo(evs):
+            pasta = os.path.join(tmp, f"html_{next(contador)}")
+            gerar_html(evs, caminho=os.path.join(pasta, "index.html"), pasta_paginas=os.path.join(pasta, "eventos"))
+
+        etapa("gerar_html", [eventos], html_completo, itens_por_entrada=len(eventos))
+
+    # 8. codec JSON sobre o arquivo completo publicado (todos os anos)
+    arquivo = [ev for lista in ArquivadorEventos().carregar_publicados().values() for ev in lista]
+    aceleracao = None
+
+    if arquivo:
+        def dump_json(evs):
+            return json.dumps(evs, ensure_ascii=False, indent=2, default=para_json).encode("utf-8")
+
+        serializado = dump_json(arquivo)
+        etapa("dump_json", [arquivo], dump_json, itens_por_entrada=len(arquivo))
+        etapa("load_json", [serializado], json.loads, itens_por_entrada=len(arquivo))
+
+        if codec.orjson is not None:
+            if codec.dumps_bytes(arquivo) != serializado:
+                raise SystemExit("❌ orjson e json produziram saídas diferentes.")
+
+            etapa("dump_orjson", [arquivo], codec.dumps_bytes, itens_por_entrada=len(arquivo))
+            etapa("load_orjson", [serializado], codec.loads, itens_por_entrada=len(arquivo))
+
+            aceleracao = {
+                operacao: round(etapas[f"{operacao}_json"]["duracao_s"] / etapas[f"{operacao}_orjson"]["duracao_s"], 2)
+                for operacao in ("dump", "load")
+            }
+
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "corpus": {
+            "listagens": len(listagens),
+            "artigos": len(artigos),
+            "eventos": len(eventos),
+            "arquivo": len(arquivo)
+        },
+        "codec": {"backend": codec.BACKEND, "aceleracao": aceleracao},
+        "etapas": etapas
+    }
+
+
+# ---------------------------------------------------------
+# Comparação com baseline
+# ---------------------------------------------------------
+def comparar(atual, baseline, tolerancia=TOLERANCIA_PADRAO):
+    """
+    Retorna a lista de regressões: vazão menor, p50 maior ou
+    pico de memória maior que o baseline além da tolerância.
+    """
+    regressoes = []
+
+    # (métrica, True se maior é melhor)
+    metricas = [("itens_por_s", True), ("p50_ms", False), ("pico_memoria_kb", False)]
+
+    for nome, medidas in atual["etapas"].items():
+        anterior = baseline.get("etapas", {}).get(nome)
+        if not anterior:
+            continue
+
+        for metrica, maior_melhor in metricas:
+            novo, velho = medidas.get(metrica), anterior.get(metrica)
+            if not novo or not velho:
+                continue
+
+            variacao = (novo - velho) / velho
+            piorou = -variacao if maior_melhor else variacao
+            if piorou > tolerancia:
+                regressoes.append((nome, metrica, velho, novo, variacao))
+
+    return regressoes
+
+
+def imprimir(resultado):
+    print()
+    print(f"{'etapa':<16}{'itens':>7}{'itens/s':>11}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'memória KB':>12}")
+    for nome, m in resultado["etapas"].items():
+        memoria = m["pico_memoria_kb"] if m["pico_memoria_kb"] is not None else "-"
+        print(
+            f"{nome:<16}{m['itens']:>7}{m['itens_por_s']:>11}"
+            f"{m['p50_ms']:>10}{m['p90_ms']:>10}{m['p99_ms']:>10}{memoria:>12}"
+        )
+
+    aceleracao = resultado.get("codec", {}).get("aceleracao")
+    if aceleracao:
+        print(f"\n⚡ orjson vs json: {aceleracao['dump']}x na gravação, {aceleracao['load']}x na leitura")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline do scraper (corpus de .cache/html).")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Repetições de cada etapa (padrão: 3)")
+    parser.add_argument("--sem-memoria", action="store_true", help="Não mede o pico de memória (mais rápido)")
+    parser.add_argument("--saida", help="Arquivo JSON de resultado (padrão: benchmarks/resultados/<data>.json)")
+    parser.add_argument("--comparar", metavar="BASELINE", help="Resultado anterior para detectar regressões")
+    parser.add_argument(
+        "--tolerancia",
+        type=float,
+        default=TOLERANCIA_PADRAO,
+        help=f"Piora relativa tolerada (padrão: {TOLERANCIA_PADRAO})"
+    )
+    args = parser.parse_args()
+
+    # os logs das etapas distorceriam as medições
+    logging.disable(logging.WARNING)
+
+    resultado = executar(args.repeticoes, memoria=not args.sem_memoria)
+    imprimir(resultado)
+
+    saida = args.saida or os.path.join(
+        PASTA_RESULTADOS, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"💾 Resultado salvo em {saida}")
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressoes = comparar(resultado, baseline, args.tolerancia)
+        if not regressoes:
+            print(f"✅ Sem regressões em relação a {args.comparar}.")
+            return
+
+        print(f"❌ {len(regressoes)} regressões em relação a {args.comparar}:")
+        for nome, metrica, velho, novo, variacao in regressoes:
+            print(f"   {nome}.{metrica}: {velho} → {novo} ({variacao:+.0%})")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,39 @@ Script principal do projeto Funcultural Scraper.
 
 Responsável por:
 - Oferecer uma interface de linha de comando (CLI)
-- Executar a raspagem de eventos
+- Executar a raspagem de eventos (com checkpoint e retomada)
+- Publicar só o índice da listagem (modo --lite) e hidratar os
+  detalhes depois, em lotes (--hidratar)
+- Coletar por prioridade dentro de um orçamento de tempo (--agendar)
+- Distribuir a coleta entre vários processos (--coordenar / --worker)
 - Arquivar eventos antigos
 - Gerar o HTML final
+- Exportar os eventos para SQLite
+- Gerar as facetas de tags
+- Acompanhar as fontes continuamente (modo --watch)
+- Servir a API localmente via HTTP (modo --servir)
+- Gravar ou reproduzir as respostas HTTP (--transporte)
+- Gravar o relatório de métricas de cada execução
 - Controlar o nível de logs (modo normal e modo debug)
 """
 
 import argparse
 import logging
-import json
 import os
 
-from scraping.runner import scrape_all
-from scraping.archiver import ArquivadorEventos
-from scraping.html_generator import gerar_html
+# Apenas módulos leves aqui: cada comando importa o que usa
+# (requests, bs4, gerador de HTML...) dentro da própria função,
+# para que --arquivar ou --gerar-html não paguem pela raspagem.
 from scraping.logging_config import configurar_logging
+from scraping.metrics import salvar_relatorio
+from scraping.config import (
+    FILA_TRABALHO_FILE, RELATORIO_EXECUCAO, SERVIDOR_HOST, SERVIDOR_PORTA,
+    TRANSPORTE_ARQUIVO, WATCH_INTERVALO, WATCH_INTERVALO_COMPLETO
+)
+
+# nomes aceitos por --transporte: as chaves de scraping.transport.TRANSPORTES
+# (repetidas aqui para --help não importar o módulo; tests/test_cli.py confere)
+TRANSPORTES = ("gravar", "http", "reproduzir")
 
 
 # ---------------------------------------------------------
@@ -25,26 +43,40 @@ from scraping.logging_config import configurar_logging
 # ---------------------------------------------------------
 def salvar_eventos(eventos, caminho="docs/api_output/eventos.json"):
     """
-    Salva a lista de eventos no arquivo JSON principal.
+    Salva os eventos (lista ou iterável) no arquivo JSON principal,
+    gravando um evento por vez.
     """
-    os.makedirs(os.path.dirname(caminho), exist_ok=True)
-
-    with open(caminho, "w", encoding="utf-8") as f:
-        json.dump(eventos, f, ensure_ascii=False, indent=2)
+    from scraping.storage import salvar_lista_json
 
-    logging.info("✅ %d eventos salvos em %s", len(eventos), caminho)
+    quantidade = salvar_lista_json(eventos, caminho)
+    logging.info("✅ %d eventos salvos em %s", quantidade, caminho)
 
 
 # ---------------------------------------------------------
 # Comando: raspagem de eventos
 # ---------------------------------------------------------
-def comando_atualizar():
+def comando_atualizar(retomar=False):
     """
-    Executa a raspagem de eventos e atualiza o arquivo eventos.json.
+    Executa a raspagem de eventos e atualiza os arquivos
+    eventos.json e images.json.
+
+    Cada card processado vai para o checkpoint JSONL; com
+    retomar=True a raspagem continua de onde a anterior parou.
+    O eventos.json final é montado a partir do checkpoint.
     """
+    from scraping.images import RegistroImagens
+    from scraping.runner import ColetaIncompleta, coletar_com_checkpoint
+
     logging.info("🚀 Iniciando raspagem de eventos...")
-    eventos = scrape_all()
-    salvar_eventos(eventos)
+    registro = RegistroImagens()
+    try:
+        checkpoint = coletar_com_checkpoint(registro, retomar)
+    except ColetaIncompleta:
+        raise SystemExit(1)
+
+    salvar_eventos(checkpoint.eventos())
+    registro.salvar()
+    checkpoint.concluir()
     logging.info("✅ Raspagem concluída.")
 
 
@@ -55,6 +87,8 @@ def comando_arquivar():
     """
     Executa o processo de arquivamento de eventos antigos.
     """
+    from scraping.archiver import ArquivadorEventos
+
     logging.info("📦 Arquivando eventos antigos...")
     ArquivadorEventos().arquivar()
     logging.info("✅ Arquivamento concluído.")
@@ -65,32 +99,203 @@ def comando_arquivar():
 # ---------------------------------------------------------
 def comando_gerar_html():
     """
-    Gera o HTML final a partir do arquivo eventos.json.
+    Gera as páginas mensais e o índice a partir de eventos.json
+    e dos arquivos por ano.
     """
+    from scraping.archiver import ArquivadorEventos
+    from scraping.html_generator import gerar_html
+
     logging.info("🖥️ Gerando HTML final...")
 
-    caminho = "docs/api_output/eventos.json"
-    if not os.path.exists(caminho):
+    arquivador = ArquivadorEventos()
+    if not os.path.exists(arquivador.caminho_principal):
         logging.error("❌ eventos.json não encontrado. Rode --atualizar primeiro.")
         return
 
-    with open(caminho, "r", encoding="utf-8") as f:
-        eventos = json.load(f)
+    eventos = [
+        ev
+        for lista in arquivador.carregar_publicados().values()
+        for ev in lista
+    ]
 
     gerar_html(eventos)
     logging.info("✅ HTML gerado com sucesso.")
 
 
+# ---------------------------------------------------------
+# Comando: exportar eventos para SQLite
+# ---------------------------------------------------------
+def comando_exportar_sqlite():
+    """
+    Exporta eventos.json e os arquivos por ano para eventos.sqlite.
+    """
+    from scraping.archiver import ArquivadorEventos
+    from scraping.sqlite_export import exportar_sqlite
+
+    logging.info("🗄️ Exportando eventos para SQLite...")
+    eventos_por_ano = ArquivadorEventos().carregar_publicados()
+    exportar_sqlite(eventos_por_ano)
+    logging.info("✅ Exportação SQLite concluída.")
+
+
+# ---------------------------------------------------------
+# Comando: gerar facetas de tags
+# ---------------------------------------------------------
+def comando_facetas():
+    """
+    Gera tags.json (índice e contagens de tags por ano)
+    a partir de eventos.json e dos arquivos por ano.
+    """
+    from scraping.archiver import ArquivadorEventos
+    from scraping.tags import gerar_facetas, salvar_facetas
+
+    logging.info("🏷️ Gerando facetas de tags...")
+    eventos_por_ano = ArquivadorEventos().carregar_publicados()
+    salvar_facetas(gerar_facetas(eventos_por_ano))
+    logging.info("✅ Facetas geradas.")
+
+
 # ---------------------------------------------------------
 # Comando: executar tudo em sequência
 # ---------------------------------------------------------
-def comando_tudo():
+def comando_tudo(retomar=False):
+    """
+    Executa raspagem, arquivamento, exportação SQLite,
+    facetas de tags e geração de HTML em sequência.
+
+    Os eventos passam de uma etapa para outra em memória
+    (Pipeline) e cada arquivo de saída é gravado uma vez.
+    """
+    from scraping.pipeline import Pipeline
+    from scraping.runner import ColetaIncompleta
+
+    logging.info("🚀 Iniciando pipeline completo...")
+    try:
+        pipeline = Pipeline().coletar(retomar)
+    except ColetaIncompleta:
+        raise SystemExit(1)
+
+    pipeline.arquivar().publicar()
+    logging.info("✅ Pipeline concluído.")
+
+
+# ---------------------------------------------------------
+# Comando: coleta leve (só as páginas da listagem)
+# ---------------------------------------------------------
+def comando_lite():
+    """
+    Publica eventos_index.json a partir das páginas da listagem,
+    sem abrir os artigos (uma requisição por página).
+    """
+    from scraping.lite import coletar_indice, salvar_indice
+
+    logging.info("📇 Iniciando coleta leve...")
+    salvar_indice(coletar_indice())
+    logging.info("✅ Coleta leve concluída.")
+
+
+# ---------------------------------------------------------
+# Comando: hidratação dos detalhes do índice
+# ---------------------------------------------------------
+def comando_hidratar(orcamento=None, limite=None):
+    """
+    Coleta os detalhes (blocos_conteudo) dos eventos de
+    eventos_index.json que ainda não foram publicados, dentro do
+    orçamento de tempo e do limite de eventos, e os publica.
+    Uma hidratação interrompida continua na próxima execução.
+    """
+    from scraping.lite import Hidratador
+
+    logging.info("💧 Iniciando hidratação dos detalhes...")
+    Hidratador(orcamento, limite).executar()
+
+
+# ---------------------------------------------------------
+# Comando: coleta priorizada com orçamento de tempo
+# ---------------------------------------------------------
+def comando_agendar(orcamento=None, limite=None):
     """
-    Executa raspagem, arquivamento e geração de HTML em sequência.
+    Coleta a listagem, processa primeiro os links novos, depois a
+    revalidação dos artigos recentes e por fim o histórico, até o
+    orçamento acabar. Publica o que foi concluído e guarda o resto
+    da fila para a próxima execução.
     """
-    comando_atualizar()
-    comando_arquivar()
-    comando_gerar_html()
+    from scraping.scheduler import Agendador
+
+    logging.info("🗓️ Iniciando coleta agendada...")
+    Agendador(orcamento, limite).executar()
+
+
+# ---------------------------------------------------------
+# Comando: trabalhador da coleta distribuída
+# ---------------------------------------------------------
+def comando_worker(fila=FILA_TRABALHO_FILE):
+    """
+    Processa tarefas da fila compartilhada (páginas da listagem e
+    artigos) até ela terminar. Vários trabalhadores podem rodar ao
+    mesmo tempo, em processos ou contêineres diferentes.
+    """
+    from scraping.worker import Trabalhador
+    from scraping.workqueue import FilaTrabalho
+
+    Trabalhador(FilaTrabalho(fila)).executar()
+
+
+# ---------------------------------------------------------
+# Comando: coordenador da coleta distribuída
+# ---------------------------------------------------------
+def comando_coordenar(trabalhadores=0, fila=FILA_TRABALHO_FILE, argumentos=()):
+    """
+    Semeia a fila, sobe `trabalhadores` processos --worker locais,
+    espera a fila terminar e publica os eventos coletados
+    (arquivos por ano, SQLite, facetas e HTML).
+    """
+    from scraping.worker import Coordenador
+    from scraping.workqueue import FilaTrabalho
+
+    logging.info("🧵 Iniciando coleta distribuída...")
+    coordenador = Coordenador(trabalhadores, FilaTrabalho(fila), argumentos=argumentos)
+    coordenador.executar()
+
+    # a fila foi mantida: a próxima execução tenta de novo as falhas
+    if coordenador.falhas:
+        raise SystemExit(1)
+
+    logging.info("✅ Coleta distribuída concluída.")
+
+
+# ---------------------------------------------------------
+# Comando: modo watch (processo contínuo)
+# ---------------------------------------------------------
+def comando_watch(intervalo=WATCH_INTERVALO, intervalo_completo=WATCH_INTERVALO_COMPLETO):
+    """
+    Consulta a primeira página da listagem a cada `intervalo` segundos
+    e publica apenas os eventos novos; a cada `intervalo_completo`
+    segundos roda o pipeline completo. Encerra com Ctrl+C.
+    """
+    from scraping.watch import Vigia
+
+    try:
+        Vigia(intervalo, intervalo_completo).executar()
+    except KeyboardInterrupt:
+        logging.info("👋 Modo watch encerrado.")
+
+
+# ---------------------------------------------------------
+# Comando: servidor HTTP local da API
+# ---------------------------------------------------------
+def comando_servir(host=SERVIDOR_HOST, porta=SERVIDOR_PORTA):
+    """
+    Serve os eventos publicados como API JSON filtrável.
+    Os índices são recarregados quando o pipeline regrava os arquivos.
+    Encerra com Ctrl+C.
+    """
+    from scraping.server import servir
+
+    try:
+        servir(host, porta)
+    except KeyboardInterrupt:
+        logging.info("👋 Servidor encerrado.")
 
 
 # ---------------------------------------------------------
@@ -107,10 +312,22 @@ def main():
             "Ferramenta CLI para o scraper da Funcultural.\n\n"
             "Como usar:\n"
             "  python scraper.py --atualizar\n"
+            "  python scraper.py --atualizar --retomar\n"
             "  python scraper.py --arquivar\n"
             "  python scraper.py --gerar-html\n"
+            "  python scraper.py --exportar-sqlite\n"
+            "  python scraper.py --facetas\n"
             "  python scraper.py --tudo\n"
-            "  python scraper.py --tudo --debug\n\n"
+            "  python scraper.py --tudo --debug\n"
+            "  python scraper.py --lite\n"
+            "  python scraper.py --hidratar --orcamento 300 --limite 50\n"
+            "  python scraper.py --agendar --orcamento 1200\n"
+            "  python scraper.py --coordenar --trabalhadores 4\n"
+            "  python scraper.py --worker\n"
+            "  python scraper.py --watch --intervalo 300\n"
+            "  python scraper.py --servir --porta 8000\n"
+            "  python scraper.py --tudo --transporte gravar\n"
+            "  python scraper.py --tudo --transporte reproduzir --latencia 0.2 --taxa-erro 0.05\n\n"
             "Observação:\n"
             "  No Windows, sempre execute usando 'python scraper.py ...'.\n"
         ),
@@ -120,7 +337,13 @@ def main():
     parser.add_argument(
         "--atualizar",
         action="store_true",
-        help="Executa o scraping e atualiza eventos.json"
+        help="Executa o scraping e atualiza eventos.json e images.json"
+    )
+    parser.add_argument(
+        "--retomar",
+        action="store_true",
+        help="Retoma a raspagem interrompida a partir do checkpoint\n"
+             "(com --atualizar ou --tudo)"
     )
     parser.add_argument(
         "--arquivar",
@@ -132,10 +355,147 @@ def main():
         action="store_true",
         help="Gera o HTML final"
     )
+    parser.add_argument(
+        "--exportar-sqlite",
+        action="store_true",
+        help="Exporta eventos.json e arquivos por ano para eventos.sqlite"
+    )
+    parser.add_argument(
+        "--facetas",
+        action="store_true",
+        help="Gera tags.json com índice e contagens de tags"
+    )
     parser.add_argument(
         "--tudo",
         action="store_true",
-        help="Executa scraping + arquivamento + HTML"
+        help="Executa scraping + arquivamento + SQLite + facetas + HTML"
+    )
+    parser.add_argument(
+        "--lite",
+        action="store_true",
+        help="Coleta só as páginas da listagem e publica eventos_index.json"
+    )
+    parser.add_argument(
+        "--hidratar",
+        action="store_true",
+        help="Coleta os detalhes dos eventos do índice ainda não publicados\n"
+             "(retomável; limitado por --orcamento e --limite)"
+    )
+    parser.add_argument(
+        "--agendar",
+        action="store_true",
+        help="Coleta priorizada (novos, revalidação, histórico) dentro\n"
+             "de --orcamento; o que sobrar fica para a próxima execução"
+    )
+    parser.add_argument(
+        "--orcamento", "--budget",
+        type=float,
+        help="Segundos disponíveis (--hidratar e --agendar)"
+    )
+    parser.add_argument(
+        "--limite",
+        type=int,
+        help="Máximo de eventos coletados por execução (--hidratar e --agendar)"
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Trabalhador da coleta distribuída: processa tarefas\n"
+             "da fila compartilhada até ela terminar"
+    )
+    parser.add_argument(
+        "--coordenar",
+        action="store_true",
+        help="Coleta distribuída: semeia a fila, sobe --trabalhadores\n"
+             "locais e publica o resultado quando a fila termina"
+    )
+    parser.add_argument(
+        "--trabalhadores",
+        type=int,
+        default=0,
+        help="Processos --worker locais iniciados por --coordenar\n"
+             "(padrão: 0, só trabalhadores externos)"
+    )
+    parser.add_argument(
+        "--fila",
+        default=FILA_TRABALHO_FILE,
+        help=f"Arquivo SQLite da fila distribuída (padrão: {FILA_TRABALHO_FILE})"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Processo contínuo: publica eventos novos da página 1\n"
+             "e roda o pipeline completo periodicamente"
+    )
+    parser.add_argument(
+        "--intervalo",
+        type=int,
+        default=WATCH_INTERVALO,
+        help=f"Segundos entre consultas da página 1 (padrão: {WATCH_INTERVALO})"
+    )
+    parser.add_argument(
+        "--intervalo-completo",
+        type=int,
+        default=WATCH_INTERVALO_COMPLETO,
+        help=f"Segundos entre coletas completas (padrão: {WATCH_INTERVALO_COMPLETO})"
+    )
+    parser.add_argument(
+        "--servir",
+        action="store_true",
+        help="Sobe a API HTTP local (eventos filtráveis, ETag, gzip)"
+    )
+    parser.add_argument(
+        "--host",
+        default=SERVIDOR_HOST,
+        help=f"Endereço do servidor (padrão: {SERVIDOR_HOST})"
+    )
+    parser.add_argument(
+        "--porta",
+        type=int,
+        default=SERVIDOR_PORTA,
+        help=f"Porta do servidor (padrão: {SERVIDOR_PORTA})"
+    )
+    parser.add_argument(
+        "--transporte",
+        choices=TRANSPORTES,
+        default="http",
+        help="http: rede real (padrão)\n"
+             "gravar: rede real, gravando as respostas em --gravacao\n"
+             "reproduzir: responde a partir de --gravacao, sem rede"
+    )
+    parser.add_argument(
+        "--gravacao",
+        default=TRANSPORTE_ARQUIVO,
+        help=f"Arquivo da gravação (padrão: {TRANSPORTE_ARQUIVO})"
+    )
+    parser.add_argument(
+        "--latencia",
+        type=float,
+        default=0.0,
+        help="Reprodução: atraso fixo por requisição, em segundos"
+    )
+    parser.add_argument(
+        "--variacao",
+        type=float,
+        default=0.0,
+        help="Reprodução: atraso extra aleatório (0 a N segundos)"
+    )
+    parser.add_argument(
+        "--taxa-erro",
+        type=float,
+        default=0.0,
+        help="Reprodução: fração de requisições com erro de rede"
+    )
+    parser.add_argument(
+        "--taxa-5xx",
+        type=float,
+        default=0.0,
+        help="Reprodução: fração de requisições respondidas com 503"
+    )
+    parser.add_argument(
+        "--semente",
+        type=int,
+        help="Reprodução: semente dos atrasos e erros injetados"
     )
     parser.add_argument(
         "--debug",
@@ -145,6 +505,13 @@ def main():
 
     args = parser.parse_args()
 
+    # cada processo abriria (e truncaria) o mesmo arquivo de gravação
+    if args.transporte == "gravar" and (args.worker or args.coordenar):
+        parser.error(
+            "--transporte gravar não pode ser usado com --worker/--coordenar "
+            "(os processos gravariam no mesmo arquivo); grave com --tudo"
+        )
+
     # Ativa modo debug via flag ou variável de ambiente
     modo_debug = args.debug or os.getenv("DEBUG") == "1"
     configurar_logging(debug=modo_debug)
@@ -152,15 +519,116 @@ def main():
     if modo_debug:
         logging.debug("Modo debug ativado.")
 
-    # Executa o comando solicitado
+    transporte = configurar_transporte(args)
+
+    comando = nome_comando(args)
+    sucesso = False
+
+    try:
+        executar_comando(parser, args)
+        sucesso = True
+    finally:
+        if transporte is not None:
+            transporte.fechar()
+
+        if comando:
+            salvar_relatorio(comando, sucesso)
+            logging.info("📊 Relatório da execução salvo em %s", RELATORIO_EXECUCAO)
+
+
+# ---------------------------------------------------------
+# Troca o transporte HTTP, se pedido (o padrão já é o real)
+# ---------------------------------------------------------
+def configurar_transporte(args):
+    if args.transporte == "http":
+        return None
+
+    from scraping.transport import criar_transporte, definir_transporte
+
+    opcoes = {}
+    if args.transporte == "reproduzir":
+        opcoes = {
+            "latencia": args.latencia,
+            "variacao": args.variacao,
+            "taxa_erro": args.taxa_erro,
+            "taxa_5xx": args.taxa_5xx,
+            "semente": args.semente
+        }
+
+    transporte = criar_transporte(args.transporte, args.gravacao, **opcoes)
+    definir_transporte(transporte)
+    return transporte
+
+
+# ---------------------------------------------------------
+# Opções repassadas aos trabalhadores locais de --coordenar
+# ---------------------------------------------------------
+def argumentos_trabalhador(args):
+    argumentos = ["--transporte", args.transporte, "--gravacao", args.gravacao]
+
+    if args.transporte == "reproduzir":
+        argumentos += [
+            "--latencia", str(args.latencia),
+            "--variacao", str(args.variacao),
+            "--taxa-erro", str(args.taxa_erro),
+            "--taxa-5xx", str(args.taxa_5xx)
+        ]
+        if args.semente is not None:
+            argumentos += ["--semente", str(args.semente)]
+
+    if args.debug:
+        argumentos.append("--debug")
+
+    return argumentos
+
+
+# ---------------------------------------------------------
+# Nome do comando escolhido (ex: "--gerar-html"), ou None
+# ---------------------------------------------------------
+COMANDOS = (
+    "atualizar", "arquivar", "gerar_html", "exportar_sqlite",
+    "facetas", "tudo", "lite", "hidratar", "agendar", "worker", "coordenar",
+    "watch", "servir"
+)
+
+
+def nome_comando(args):
+    for comando in COMANDOS:
+        if getattr(args, comando):
+            return "--" + comando.replace("_", "-")
+    return None
+
+
+# ---------------------------------------------------------
+# Executa o comando escolhido na linha de comando
+# ---------------------------------------------------------
+def executar_comando(parser, args):
     if args.atualizar:
-        comando_atualizar()
+        comando_atualizar(retomar=args.retomar)
     elif args.arquivar:
         comando_arquivar()
     elif args.gerar_html:
         comando_gerar_html()
+    elif args.exportar_sqlite:
+        comando_exportar_sqlite()
+    elif args.facetas:
+        comando_facetas()
     elif args.tudo:
-        comando_tudo()
+        comando_tudo(retomar=args.retomar)
+    elif args.lite:
+        comando_lite()
+    elif args.hidratar:
+        comando_hidratar(args.orcamento, args.limite)
+    elif args.agendar:
+        comando_agendar(args.orcamento, args.limite)
+    elif args.worker:
+        comando_worker(args.fila)
+    elif args.coordenar:
+        comando_coordenar(args.trabalhadores, args.fila, argumentos_trabalhador(args))
+    elif args.watch:
+        comando_watch(args.intervalo, args.intervalo_completo)
+    elif args.servir:
+        comando_servir(args.host, args.porta)
     else:
         parser.print_help()
 
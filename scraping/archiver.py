@@ -7,14 +7,21 @@ Responsável por:
 - Separar eventos por ano
 - Arquivar eventos antigos em arquivos individuais
 - Manter apenas os eventos do ano atual em eventos.json
+- Gravar um arquivo por evento (eventos/<id>.json)
+- Recarregar todos os eventos publicados, agrupados por ano
 """
 
-import json
+import glob
 import os
 import re
 import logging
-from datetime import datetime, timedelta
-from scraping.date_extractor import extrair_datas
+from collections.abc import Mapping
+from datetime import datetime
+from scraping.date_extractor import resolver_data_evento
+from scraping import codec
+from scraping.metrics import metricas
+from scraping.models import Evento
+from scraping.storage import gerar_id_evento, salvar_eventos_individuais
 
 
 class ArquivadorEventos:
@@ -26,10 +33,12 @@ class ArquivadorEventos:
     def __init__(
         self,
         caminho_principal="docs/api_output/eventos.json",
-        pasta_arquivo="docs/api_output/arquivo"
+        pasta_arquivo="docs/api_output/arquivo",
+        pasta_eventos="docs/api_output/eventos"
     ):
         self.caminho_principal = caminho_principal
         self.pasta_arquivo = pasta_arquivo
+        self.pasta_eventos = pasta_eventos
         self.ano_atual = datetime.now().year
 
     # ---------------------------------------------------------
@@ -42,56 +51,11 @@ class ArquivadorEventos:
         2. Datas explícitas dentro dos blocos de conteúdo
         3. Datas relativas (ex: "há 3 meses")
         4. Fallback: ano atual
-        """
 
-        agora = datetime.now()
-
-        # 1. Datas explícitas no campo data_exibicao
-        datas = extrair_datas(data_str)
-        if datas:
-            return datas[0].year
-
-        # 2. Datas explícitas dentro dos blocos de conteúdo
-        textos = []
-
-        if blocos_conteudo:
-            for bloco in blocos_conteudo:
-                if isinstance(bloco, str):
-                    textos.append(bloco)
-                elif isinstance(bloco, dict):
-                    conteudo = bloco.get("conteudo")
-                    if isinstance(conteudo, str):
-                        textos.append(conteudo)
-
-        if textos:
-            texto_completo = " ".join(textos)
-            datas = extrair_datas(texto_completo)
-            if datas:
-                return datas[0].year
-
-        # 3. Datas relativas ("há X meses")
-        match = re.search(r"há (\d+) (ano|anos|mês|meses|dia|dias)", data_str)
-        if match:
-            valor = int(match.group(1))
-            unidade = match.group(2)
-
-            if "ano" in unidade:
-                return agora.year - valor
-
-            if "mês" in unidade:
-                novo_mes = agora.month - valor
-                novo_ano = agora.year
-                while novo_mes <= 0:
-                    novo_mes += 12
-                    novo_ano -= 1
-                return novo_ano
-
-            if "dia" in unidade:
-                nova_data = agora - timedelta(days=valor)
-                return nova_data.year
-
-        # 4. Fallback seguro
-        return agora.year
+        A resolução fica em date_extractor.resolver_data_evento,
+        compartilhada com o gerador de HTML.
+        """
+        return resolver_data_evento(data_str, blocos_conteudo).year
 
     # ---------------------------------------------------------
     # Arquiva eventos antigos e mantém apenas os do ano atual
@@ -103,16 +67,28 @@ class ArquivadorEventos:
             logging.warning("⚠️ Arquivo eventos.json não encontrado.")
             return
 
-        with open(self.caminho_principal, "r", encoding="utf-8") as f:
-            eventos = json.load(f)
+        eventos = codec.carregar(self.caminho_principal)
+
+        eventos_atuais, eventos_por_ano = self.separar(eventos)
+        self.salvar(eventos_atuais, eventos_por_ano)
+
+        logging.info("📂 Arquivamento concluído.")
 
+    # ---------------------------------------------------------
+    # Separa os eventos do ano atual dos eventos antigos
+    # ---------------------------------------------------------
+    @metricas.cronometrado("archiver.separar")
+    def separar(self, eventos):
+        """
+        Retorna (eventos_atuais, {ano: [eventos antigos]}).
+        """
         eventos_atuais = []
         eventos_por_ano = {}
 
         for ev in eventos:
 
             # Ignora itens inválidos (ex: números, strings, None)
-            if not isinstance(ev, dict):
+            if not isinstance(ev, Mapping):
                 logging.warning("⚠️ Evento inválido ignorado: %s", ev)
                 continue
 
@@ -126,16 +102,85 @@ class ArquivadorEventos:
             else:
                 eventos_por_ano.setdefault(ano, []).append(ev)
 
+        return eventos_atuais, eventos_por_ano
+
+    # ---------------------------------------------------------
+    # Grava os arquivos por ano, o eventos.json do ano atual
+    # e os arquivos por evento
+    # ---------------------------------------------------------
+    @metricas.cronometrado("archiver.salvar")
+    def salvar(self, eventos_atuais, eventos_por_ano):
         os.makedirs(self.pasta_arquivo, exist_ok=True)
 
         for ano, lista in eventos_por_ano.items():
             caminho_ano = os.path.join(self.pasta_arquivo, f"eventos_de_{ano}.json")
-            with open(caminho_ano, "w", encoding="utf-8") as f:
-                json.dump(lista, f, ensure_ascii=False, indent=2)
+            codec.gravar(lista, caminho_ano)
             logging.info("📁 Arquivado %d eventos em eventos_de_%d.json", len(lista), ano)
 
-        with open(self.caminho_principal, "w", encoding="utf-8") as f:
-            json.dump(eventos_atuais, f, ensure_ascii=False, indent=2)
+        codec.gravar(eventos_atuais, self.caminho_principal)
 
         logging.info("✅ Mantidos %d eventos de %d em eventos.json", len(eventos_atuais), self.ano_atual)
-        logging.info("📂 Arquivamento concluído.")
+
+        # todos os publicados (inclusive arquivos por ano que esta
+        # coleta não regravou): o que não estiver neles é apagado
+        publicados = self.carregar_publicados()
+        salvar_eventos_individuais(
+            [ev for lista in publicados.values() for ev in lista],
+            self.pasta_eventos
+        )
+
+    # ---------------------------------------------------------
+    # Carrega todos os eventos publicados, agrupados por ano
+    # ---------------------------------------------------------
+    @metricas.cronometrado("archiver.carregar_publicados")
+    def carregar_publicados(self):
+        """
+        Lê eventos.json e os arquivos por ano e retorna um dict
+        {ano: [eventos]}. O ano dos arquivos vem do nome do arquivo;
+        o de eventos.json é calculado com extrair_ano.
+
+        Um mesmo evento pode sobrar em arquivos de anos diferentes
+        (arquivos antigos não são apagados); vale a primeira ocorrência,
+        começando por eventos.json e depois pelos arquivos por ano,
+        do ano mais recente para o mais antigo.
+        """
+        eventos_por_ano = {}
+        vistos = set()
+
+        def adicionar(ano, dados):
+            try:
+                ev = Evento.de_dict(dados)
+            except ValueError:
+                return
+            ev_id = gerar_id_evento(ev)
+            if ev_id in vistos:
+                return
+            vistos.add(ev_id)
+            eventos_por_ano.setdefault(ano, []).append(ev)
+
+        if os.path.exists(self.caminho_principal):
+            for ev in codec.carregar(self.caminho_principal):
+                if not isinstance(ev, dict):
+                    continue
+                ano = self.extrair_ano(
+                    ev.get("data_exibicao", ""),
+                    ev.get("blocos_conteudo", [])
+                )
+                adicionar(ano, ev)
+
+        # ordem pelo ano do nome do arquivo (não pela data de modificação,
+        # que muda com checkout, cópia ou restauração de backup)
+        padrao = os.path.join(self.pasta_arquivo, "eventos_de_*.json")
+        arquivos = []
+        for caminho in glob.glob(padrao):
+            match = re.search(r"eventos_de_(\d{4})\.json$", caminho)
+            if match:
+                arquivos.append((int(match.group(1)), caminho))
+        arquivos.sort(reverse=True)
+
+        for ano, caminho in arquivos:
+            for ev in codec.carregar(caminho):
+                if isinstance(ev, dict):
+                    adicionar(ano, ev)
+
+        return dict(sorted(eventos_por_ano.items(), reverse=True))
@@ -5,41 +5,114 @@ Responsável por:
 - Salvar HTML baixado para evitar requisições repetidas
 - Ler HTML do cache quando disponível
 - Controlar expiração do cache
+
+O arquivo de cada página é o sha256 da chave canônica da URL
+(urls.chave_url): variações do mesmo link usam a mesma entrada.
+Entradas antigas (sha256 da URL crua) são lidas e renomeadas.
+
+O HTML é guardado como os bytes recebidos, sem decodificar. O charset
+declarado pelo servidor (se houver) fica num arquivo ao lado
+(<hash>.charset); sem ele, o parser usa o <meta charset> da página.
 """
 
 import os
 import time
 import hashlib
 
+from scraping.metrics import metricas
+from scraping.urls import chave_url
+
 CACHE_DIR = ".cache/html"
-os.makedirs(CACHE_DIR, exist_ok=True)
 
 # Expiração do cache em segundos (1 dia)
 CACHE_TTL = 60 * 60 * 24
 
+# expiração usada quando load_html não recebe ttl (ver definir_ttl)
+_ttl_padrao = CACHE_TTL
+_PADRAO = object()
+
 
 def _hash_url(url):
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
 def cache_path(url):
-    return os.path.join(CACHE_DIR, _hash_url(url) + ".html")
+    return os.path.join(CACHE_DIR, _hash_url(chave_url(url)) + ".html")
+
+
+def _migrar_entrada_antiga(url, path):
+    """
+    Renomeia a entrada gravada com a URL crua para o caminho
+    canônico (o mtime é mantido, e com ele o TTL).
+    """
+    antigo = os.path.join(CACHE_DIR, _hash_url(url) + ".html")
+    if antigo == path or not os.path.exists(antigo):
+        return
+
+    os.replace(antigo, path)
+    if os.path.exists(_charset_path(antigo)):
+        os.replace(_charset_path(antigo), _charset_path(path))
+
 
+def _charset_path(path):
+    return path[:-len(".html")] + ".charset"
 
-def save_html(url, content):
+
+@metricas.cronometrado("cache.gravacao")
+def save_html(url, conteudo, encoding=None):
     path = cache_path(url)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(conteudo)
+
+    charset = _charset_path(path)
+    if encoding:
+        with open(charset, "w", encoding="ascii") as f:
+            f.write(encoding)
+    elif os.path.exists(charset):
+        os.remove(charset)
+
+
+# ---------------------------------------------------------
+# Expiração padrão (ex.: menor durante a reconciliação do --watch)
+# ---------------------------------------------------------
+def definir_ttl(ttl):
+    """
+    Troca a expiração usada por load_html sem ttl e retorna a anterior.
+    """
+    global _ttl_padrao
+    anterior, _ttl_padrao = _ttl_padrao, ttl
+    return anterior
 
 
-def load_html(url):
+@metricas.cronometrado("cache.leitura")
+def load_html(url, ttl=_PADRAO):
+    """
+    Retorna (bytes, encoding declarado ou None), ou None se a página
+    não estiver no cache ou tiver expirado. ttl=None ignora a expiração;
+    sem ttl, vale a expiração padrão (CACHE_TTL, ou a de definir_ttl).
+    """
+    if ttl is _PADRAO:
+        ttl = _ttl_padrao
+
     path = cache_path(url)
     if not os.path.exists(path):
-        return None
+        _migrar_entrada_antiga(url, path)
 
-    # Verifica expiração
-    if time.time() - os.path.getmtime(path) > CACHE_TTL:
+    try:
+        # Verifica expiração
+        if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+            return None
+
+        with open(path, "rb") as f:
+            conteudo = f.read()
+    except FileNotFoundError:
         return None
 
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    try:
+        with open(_charset_path(path), "r", encoding="ascii") as f:
+            encoding = f.read().strip() or None
+    except FileNotFoundError:
+        encoding = None
+
+    return conteudo, encoding
@@ -0,0 +1,186 @@
+"""
+Checkpoint da raspagem em JSONL.
+
+Responsável por:
+- Registrar cada card processado assim que ele é concluído
+- Sobreviver a falhas no meio da coleta (uma linha por card)
+- Informar, para cada fonte, de onde a raspagem deve ser retomada
+- Reler os eventos coletados em streaming, sem carregar tudo na memória
+"""
+
+import json
+import logging
+import os
+import threading
+
+from scraping.config import CHECKPOINT_FILE
+from scraping.models import Evento, para_json
+from scraping.urls import chave_url
+
+# fonte assumida em checkpoints gravados antes do suporte a várias fontes
+FONTE_PADRAO = "funcultural"
+
+
+class CheckpointJSONL:
+    """
+    Cada linha do arquivo representa um card da listagem:
+    {"fonte": "funcultural", "pagina": 3, "card": 7, "evento": {...} ou null}
+
+    Cards descartados também são gravados (evento null), para que a
+    retomada saiba exatamente onde parou. Quando uma fonte termina,
+    uma linha {"fonte": ..., "concluida": true} é gravada.
+    """
+
+    def __init__(self, caminho=CHECKPOINT_FILE):
+        self.caminho = caminho
+        self._arquivo = None
+
+        # várias fontes gravam no mesmo arquivo, cada uma em sua thread
+        self._lock = threading.Lock()
+
+    def existe(self):
+        return os.path.exists(self.caminho)
+
+    # ---------------------------------------------------------
+    # Começa um checkpoint novo (descarta o anterior)
+    # ---------------------------------------------------------
+    def iniciar(self):
+        self.fechar()
+        os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+        self._arquivo = open(self.caminho, "w", encoding="utf-8")
+
+    # ---------------------------------------------------------
+    # Reabre um checkpoint existente para continuar gravando
+    # ---------------------------------------------------------
+    def reabrir(self):
+        self.fechar()
+        self._descartar_linha_incompleta()
+        self._arquivo = open(self.caminho, "a", encoding="utf-8")
+
+    def _descartar_linha_incompleta(self):
+        """
+        Uma falha no meio da gravação deixa a última linha sem "\\n";
+        a próxima linha gravada ficaria colada nela e as duas seriam
+        perdidas. O trecho incompleto é cortado antes de continuar.
+        """
+        with open(self.caminho, "rb+") as f:
+            fim = f.seek(0, os.SEEK_END)
+            if fim == 0:
+                return
+            posicao = fim
+
+            # procura o último "\n" de trás para frente, em blocos
+            while posicao > 0:
+                inicio = max(0, posicao - 4096)
+                f.seek(inicio)
+                bloco = f.read(posicao - inicio)
+
+                if posicao == fim and bloco.endswith(b"\n"):
+                    return
+
+                quebra = bloco.rfind(b"\n")
+                if quebra >= 0:
+                    f.truncate(inicio + quebra + 1)
+                    break
+                posicao = inicio
+            else:
+                f.truncate(0)
+
+        logging.warning("⚠️ Linha incompleta descartada no fim do checkpoint.")
+
+    # ---------------------------------------------------------
+    # Registra um card processado
+    # ---------------------------------------------------------
+    def registrar(self, fonte, pagina, card, evento):
+        self._gravar({"fonte": fonte, "pagina": pagina, "card": card, "evento": evento})
+
+    # ---------------------------------------------------------
+    # Marca uma fonte como concluída
+    # ---------------------------------------------------------
+    def concluir_fonte(self, fonte):
+        self._gravar({"fonte": fonte, "concluida": True})
+
+    def _gravar(self, registro):
+        linha = json.dumps(registro, ensure_ascii=False, default=para_json)
+
+        with self._lock:
+            self._arquivo.write(linha + "\n")
+
+            # garante que a linha chegue ao disco antes do próximo card
+            self._arquivo.flush()
+
+    def fechar(self):
+        if self._arquivo:
+            self._arquivo.close()
+            self._arquivo = None
+
+    # ---------------------------------------------------------
+    # Lê os registros válidos do arquivo
+    # ---------------------------------------------------------
+    def _registros(self):
+        if not self.existe():
+            return
+
+        with open(self.caminho, "r", encoding="utf-8") as f:
+            for linha in f:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    # última linha truncada por uma falha: ignorada
+                    logging.warning("⚠️ Linha inválida ignorada no checkpoint.")
+                    continue
+
+                registro.setdefault("fonte", FONTE_PADRAO)
+                yield registro
+
+    # ---------------------------------------------------------
+    # Posição (página, card) onde a fonte deve continuar
+    # Retorna None se a fonte já foi concluída
+    # ---------------------------------------------------------
+    def proxima_posicao(self, fonte=FONTE_PADRAO):
+        ultimo = None
+        for registro in self._registros():
+            if registro["fonte"] == fonte:
+                ultimo = registro
+
+        if not ultimo:
+            return 1, 0
+
+        if ultimo.get("concluida"):
+            return None
+
+        return ultimo["pagina"], ultimo["card"] + 1
+
+    # ---------------------------------------------------------
+    # Eventos coletados, agrupados por fonte (ordem alfabética)
+    # e na ordem em que foram gravados; links repetidos (cards que
+    # mudaram de página durante a coleta, ou o mesmo artigo com
+    # outra grafia do link) são ignorados pela chave canônica
+    # ---------------------------------------------------------
+    def eventos(self):
+        fontes = sorted({r["fonte"] for r in self._registros()})
+        links = set()
+
+        for fonte in fontes:
+            for registro in self._registros():
+                evento = registro.get("evento")
+                if registro["fonte"] != fonte or not evento:
+                    continue
+
+                link = chave_url(evento.get("link_evento") or "")
+                if link in links:
+                    continue
+                links.add(link)
+
+                try:
+                    yield Evento.de_dict(evento)
+                except ValueError as e:
+                    logging.warning("⚠️ Evento inválido ignorado no checkpoint: %s", e)
+
+    # ---------------------------------------------------------
+    # Remove o checkpoint após a publicação dos resultados
+    # ---------------------------------------------------------
+    def concluir(self):
+        self.fechar()
+        if self.existe():
+            os.remove(self.caminho)
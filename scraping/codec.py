@@ -0,0 +1,93 @@
+"""
+Codificação JSON dos arquivos de eventos.
+
+Responsável por:
+- Usar o orjson quando estiver instalado (bem mais rápido)
+- Voltar ao json da biblioteca padrão quando não estiver
+- Produzir a mesma saída, byte a byte, nos dois casos
+  (equivalente a json.dumps(..., ensure_ascii=False, indent=2))
+
+O que o orjson não representa igual ao json (chaves que não são
+texto, inteiros maiores que 64 bits) cai automaticamente no json.
+Surrogates soltos ("\\ud800") não existem em UTF-8: nesse caso o texto
+inteiro sai com escapes ASCII (ensure_ascii=True), que continua sendo
+JSON válido; o orjson recusa esses escapes na leitura e loads()
+volta ao json. Floats não são usados nos eventos:
+o orjson os escreve em outro formato (1e16 em vez de 1e+16).
+
+SCRAPER_JSON=json no ambiente força a biblioteca padrão.
+"""
+
+import json
+import os
+
+from scraping.models import para_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if os.environ.get("SCRAPER_JSON") == "json":
+    orjson = None
+
+# nome do backend em uso (aparece nos logs e no benchmark)
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+# ---------------------------------------------------------
+# Serialização
+# ---------------------------------------------------------
+def dumps_bytes(obj, ordenar=False):
+    """
+    Serializa obj em UTF-8, com indentação de 2 espaços.
+    ordenar=True ordena as chaves (saída estável, boa para diffs).
+    """
+    if orjson is not None:
+        opcoes = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if ordenar else 0)
+        try:
+            return orjson.dumps(obj, default=para_json, option=opcoes)
+        except TypeError:
+            # JSONEncodeError é um TypeError: tenta com o json
+            pass
+
+    texto = json.dumps(
+        obj, ensure_ascii=False, indent=2, sort_keys=ordenar, default=para_json
+    )
+    try:
+        return texto.encode("utf-8")
+    except UnicodeEncodeError:
+        # surrogate solto: só é representável como escape \uXXXX
+        return json.dumps(
+            obj, ensure_ascii=True, indent=2, sort_keys=ordenar, default=para_json
+        ).encode("ascii")
+
+
+def dumps(obj, ordenar=False):
+    return dumps_bytes(obj, ordenar).decode("utf-8")
+
+
+def gravar(obj, caminho, ordenar=False):
+    with open(caminho, "wb") as f:
+        f.write(dumps_bytes(obj, ordenar))
+
+
+# ---------------------------------------------------------
+# Leitura
+# ---------------------------------------------------------
+def loads(dados):
+    """
+    Aceita str ou bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(dados)
+        except orjson.JSONDecodeError:
+            # surrogate solto escapado: só o json aceita
+            pass
+    return json.loads(dados)
+
+
+def carregar(caminho):
+    with open(caminho, "rb") as f:
+        return loads(f.read())
@@ -4,13 +4,21 @@ Configurações gerais do scraper da Funcultural.
 Contém:
 - URLs base utilizadas pelo scraper
 - Caminhos de saída para os arquivos JSON gerados
+- Checkpoints da raspagem e da hidratação
+- Relatório da execução (run_report.json e métricas do Prometheus)
+- Arquivo padrão de gravação/reprodução do transporte HTTP
+- Fronteira e janela de revalidação da coleta agendada (--agendar)
+- Fila compartilhada da coleta distribuída (--worker / --coordenar)
+- Intervalos do modo --watch
+- Endereço do servidor local da API
 - Nome do lockfile para evitar execuções simultâneas
 """
 
 # ---------------------------------------------------------
-# URL base da listagem de notícias
+# URL base do portal e da listagem de notícias (Funcultural)
 # ---------------------------------------------------------
-URL_NOTICIAS = "https://funcultural.portovelho.ro.gov.br/noticias"
+URL_BASE = "https://funcultural.portovelho.ro.gov.br"
+URL_NOTICIAS = f"{URL_BASE}/noticias"
 
 
 # ---------------------------------------------------------
@@ -20,6 +28,70 @@ API_DIR = "docs/api_output"
 
 API_LIST_FILE = f"{API_DIR}/eventos.json"   # lista completa de eventos
 API_INDEX_FILE = f"{API_DIR}/index.json"    # índice resumido
+API_EVENTOS_INDEX_FILE = f"{API_DIR}/eventos_index.json"  # índice da listagem (--lite)
+API_EVENTOS_DIR = f"{API_DIR}/eventos"         # um arquivo por evento (<id>.json)
+API_SQLITE_FILE = f"{API_DIR}/eventos.sqlite"  # banco para consumo offline
+API_IMAGES_FILE = f"{API_DIR}/images.json"     # manifesto de imagens
+API_TAGS_FILE = f"{API_DIR}/tags.json"         # facetas de tags
+
+
+# ---------------------------------------------------------
+# Checkpoint da raspagem (permite retomar com --retomar)
+# ---------------------------------------------------------
+CHECKPOINT_FILE = ".cache/checkpoint_raspagem.jsonl"
+
+# checkpoint da hidratação dos detalhes (--hidratar)
+HIDRATACAO_FILE = ".cache/checkpoint_hidratacao.jsonl"
+
+
+# ---------------------------------------------------------
+# Relatório de cada execução (JSON e textfile do Prometheus)
+# ---------------------------------------------------------
+RELATORIO_EXECUCAO = "logs/run_report.json"
+PROMETHEUS_TEXTFILE = "logs/scraper.prom"
+
+
+# ---------------------------------------------------------
+# Gravação de respostas HTTP (--transporte gravar / reproduzir)
+# ---------------------------------------------------------
+TRANSPORTE_ARQUIVO = ".cache/gravacao.jsonl"
+
+
+# ---------------------------------------------------------
+# Coleta agendada (--agendar): o que não coube no orçamento fica
+# na fronteira; artigos dos últimos N dias são revalidados
+# ---------------------------------------------------------
+AGENDADOR_FRONTEIRA_FILE = ".cache/fronteira.json"
+AGENDADOR_DIAS_RECENTES = 7
+
+
+# ---------------------------------------------------------
+# Coleta distribuída (--worker / --coordenar): fila SQLite
+# compartilhada, prazo das reservas (segundos, renovado pelo
+# heartbeat) e reservas por tarefa antes de marcá-la como falha
+# ---------------------------------------------------------
+FILA_TRABALHO_FILE = ".cache/fila_trabalho.sqlite"
+FILA_RESERVA = 60
+FILA_TENTATIVAS = 3
+
+
+# ---------------------------------------------------------
+# Modo --watch: intervalos (segundos) entre verificações da
+# primeira página e entre reconciliações completas
+# ---------------------------------------------------------
+WATCH_INTERVALO = 300
+WATCH_INTERVALO_COMPLETO = 6 * 60 * 60
+
+# validade (segundos) do cache de HTML durante a reconciliação;
+# 0 baixa tudo de novo (edições feitas no portal aparecem)
+WATCH_TTL_RECONCILIACAO = 0
+
+
+# ---------------------------------------------------------
+# Servidor local da API (--servir)
+# ---------------------------------------------------------
+SERVIDOR_HOST = "127.0.0.1"
+SERVIDOR_PORTA = 8000
 
 
 # ---------------------------------------------------------
@@ -5,11 +5,13 @@ Responsável por:
 - Identificar datas explícitas no formato dd/mm/yyyy
 - Identificar datas por extenso (ex: "12 de agosto de 2023")
 - Retornar todas as datas encontradas como objetos datetime
+- Resolver a data de um evento (datas explícitas ou relativas)
 - Servir como base para o arquivamento inteligente de eventos
 """
 
 import re
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 
 # ---------------------------------------------------------
 # Mapeamento de meses por extenso para número
@@ -25,6 +27,10 @@ MESES = {
 # ---------------------------------------------------------
 REGEX_DDMMYYYY = r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b"
 REGEX_EXTENSO = r"(\d{1,2}) de ([a-zç]+) de (\d{4})"
+REGEX_RELATIVA = (
+    r"há (\d+) (ano|anos|mês|meses|semana|semanas|dia|dias|"
+    r"hora|horas|minuto|minutos)"
+)
 
 
 # ---------------------------------------------------------
@@ -54,3 +60,94 @@ def extrair_datas(texto):
                 pass
 
     return datas
+
+
+# ---------------------------------------------------------
+# Data de "há <valor> <unidade>" em relação a agora
+# ---------------------------------------------------------
+def _data_relativa(valor, unidade, agora):
+    if "ano" in unidade:
+        return agora.replace(year=agora.year - valor, day=min(agora.day, 28))
+
+    if "mês" in unidade or "mes" in unidade:
+        novo_mes = agora.month - valor
+        novo_ano = agora.year
+        while novo_mes <= 0:
+            novo_mes += 12
+            novo_ano -= 1
+        return agora.replace(year=novo_ano, month=novo_mes, day=min(agora.day, 28))
+
+    if "semana" in unidade:
+        return agora - timedelta(weeks=valor)
+
+    if "dia" in unidade:
+        return agora - timedelta(days=valor)
+
+    if "hora" in unidade:
+        return agora - timedelta(hours=valor)
+
+    return agora - timedelta(minutes=valor)
+
+
+# ---------------------------------------------------------
+# Datas explícitas dos blocos de conteúdo
+# ---------------------------------------------------------
+def _datas_do_conteudo(blocos_conteudo):
+    textos = []
+
+    for bloco in blocos_conteudo or ():
+        if isinstance(bloco, str):
+            textos.append(bloco)
+        elif isinstance(bloco, Mapping):
+            conteudo = bloco.get("content")
+            if isinstance(conteudo, str):
+                textos.append(conteudo)
+
+    return extrair_datas(" ".join(textos)) if textos else []
+
+
+# ---------------------------------------------------------
+# Resolve a data de um evento
+# ---------------------------------------------------------
+def resolver_data_evento(data_str, blocos_conteudo=None, agora=None):
+    """
+    Determina a data (aproximada) do evento usando:
+    1. Datas explícitas no campo data_exibicao
+    2. Datas relativas (ex: "há 3 meses", "há 2 semanas"); uma data
+       do conteúdo só as substitui se cair na janela que a relativa
+       indica ("há 2 meses": entre 3 e 2 meses atrás), porque o texto
+       cita também datas históricas ("fundada em 1848")
+    3. Sem data no card: datas explícitas dentro dos blocos de conteúdo
+    4. Fallback: agora
+    """
+    agora = agora or datetime.now()
+    data_str = data_str or ""
+
+    # 1. Datas explícitas no campo data_exibicao
+    datas = extrair_datas(data_str)
+    if datas:
+        return datas[0]
+
+    datas_conteudo = _datas_do_conteudo(blocos_conteudo)
+
+    # 2. Datas relativas ("há X meses"), refinadas pelo conteúdo
+    match = re.search(REGEX_RELATIVA, data_str)
+    if match:
+        valor = int(match.group(1))
+        unidade = match.group(2)
+
+        relativa = _data_relativa(valor, unidade, agora)
+        inicio = _data_relativa(valor + 1, unidade, agora).date()
+
+        for data in datas_conteudo:
+            if inicio <= data.date() <= relativa.date():
+                return data
+
+        return relativa
+
+    # 3. Datas explícitas dentro dos blocos de conteúdo
+    if datas_conteudo:
+        return datas_conteudo[0]
+
+    # 4. Fallback seguro
+    return agora
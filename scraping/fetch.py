@@ -4,61 +4,146 @@ Módulo de fetch da Funcultural.
 Responsável por:
 - Fazer requisições HTTP com segurança
 - Retornar o HTML como BeautifulSoup
+- Entregar ao parser os bytes recebidos (sem adivinhar o charset)
 - Resolver URLs relativas para URLs absolutas
 - Utilizar cache local para acelerar o scraper
+- Fazer requisições condicionais (ETag / Last-Modified) sem cache
+- Acessar a rede apenas pelo transporte ativo (real, gravação ou reprodução)
+- Registrar métricas de cache, download e parse
 """
 
 import logging
-import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 from scraping.cache import load_html, save_html
+from scraping.config import URL_BASE
+from scraping.metrics import metricas
+from scraping.transport import ErroTransporte, obter_transporte
+from scraping.urls import resolver_url
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
 
 
 # ---------------------------------------------------------
 # Faz requisição HTTP e retorna o HTML como BeautifulSoup
 # ---------------------------------------------------------
-def get_soup(url):
+def get_soup(url, limitador=None):
+    """
+    Retorna o BeautifulSoup da URL, usando o cache quando possível.
+    limitador (opcional) é chamado antes de cada acesso à rede,
+    para respeitar o limite de requisições da fonte.
+    """
+    transporte = obter_transporte()
+
     # 1. tenta carregar do cache
-    cached = load_html(url)
-    if cached:
-        logging.info("📦 Cache HIT: %s", url)
-        return BeautifulSoup(cached, "html.parser")
+    cached = load_html(url) if transporte.usa_cache else None
+    if cached and cached[0]:
+        logging.info("📦 Cache HIT: %s", url, extra={"agregar": "📦 Cache HIT"})
+        metricas.incrementar("cache_hits")
+        return parse_html(*cached)
+
+    logging.info("🌐 Cache MISS: baixando %s", url, extra={"agregar": "🌐 Cache MISS"})
+    metricas.incrementar("cache_misses")
 
-    logging.info("🌐 Cache MISS: baixando %s", url)
+    if limitador is not None:
+        limitador()
 
     try:
-        resp = requests.get(
-            url,
-            timeout=10,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            }
-        )
-
-        if resp.status_code != 200:
-            logging.warning("⚠️ Resposta inválida (%s) para %s", resp.status_code, url)
+        with metricas.cronometrar("fetch.download"):
+            resp = transporte.obter(url, HEADERS)
+
+        if resp.status != 200:
+            logging.warning("⚠️ Resposta inválida (%s) para %s", resp.status, url)
+            metricas.incrementar("respostas_invalidas")
             return None
 
-        html = resp.text
+        metricas.incrementar("bytes_baixados", len(resp.conteudo))
 
         # salva no cache
-        save_html(url, html)
+        if transporte.usa_cache:
+            save_html(url, resp.conteudo, resp.encoding)
 
-        return BeautifulSoup(html, "html.parser")
+        return parse_html(resp.conteudo, resp.encoding)
 
-    except requests.RequestException as e:
+    except ErroTransporte as e:
         logging.error("❌ Erro de rede ao acessar %s: %s", url, e)
+        metricas.incrementar("erros_rede")
         return None
 
     except Exception as e:
         logging.error("❌ Erro inesperado ao acessar %s: %s", url, e)
+        metricas.incrementar("erros_inesperados")
         return None
 
 
+# ---------------------------------------------------------
+# Parse dos bytes da página
+# ---------------------------------------------------------
+def parse_html(conteudo, encoding=None):
+    """
+    Sem encoding declarado, o BeautifulSoup usa o <meta charset>
+    da própria página.
+    """
+    with metricas.cronometrar("fetch.parse"):
+        return BeautifulSoup(conteudo, "html.parser", from_encoding=encoding)
+
+
+# ---------------------------------------------------------
+# Requisição condicional (ignora o cache)
+# ---------------------------------------------------------
+def get_condicional(url, etag=None, ultima_modificacao=None, limitador=None):
+    """
+    Faz um GET com If-None-Match / If-Modified-Since.
+
+    Retorna (status, resposta, etag, ultima_modificacao):
+    - status 304: nada mudou (resposta é None)
+    - status 200: resposta com o html novo em bytes (também salvo no cache)
+    - status None: erro de rede
+    """
+    headers = dict(HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if ultima_modificacao:
+        headers["If-Modified-Since"] = ultima_modificacao
+
+    if limitador is not None:
+        limitador()
+
+    transporte = obter_transporte()
+    metricas.incrementar("requisicoes_condicionais")
+
+    try:
+        with metricas.cronometrar("fetch.condicional"):
+            resp = transporte.obter(url, headers)
+    except ErroTransporte as e:
+        logging.error("❌ Erro de rede ao acessar %s: %s", url, e)
+        metricas.incrementar("erros_rede")
+        return None, None, etag, ultima_modificacao
+
+    if resp.status == 304:
+        metricas.incrementar("respostas_304")
+        return 304, None, etag, ultima_modificacao
+
+    if resp.status != 200:
+        logging.warning("⚠️ Resposta inválida (%s) para %s", resp.status, url)
+        metricas.incrementar("respostas_invalidas")
+        return resp.status, None, etag, ultima_modificacao
+
+    metricas.incrementar("bytes_baixados", len(resp.conteudo))
+    if transporte.usa_cache:
+        save_html(url, resp.conteudo, resp.encoding)
+
+    return (
+        200,
+        resp,
+        resp.cabecalho("ETag"),
+        resp.cabecalho("Last-Modified")
+    )
+
+
 # ---------------------------------------------------------
 # Converte URLs relativas para absolutas
 # ---------------------------------------------------------
-def complete_url(relative_url):
-    base = "https://funcultural.portovelho.ro.gov.br"
-    return urljoin(base, relative_url)
+def complete_url(relative_url, base=URL_BASE):
+    return resolver_url(relative_url, base)
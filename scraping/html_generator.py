@@ -3,105 +3,381 @@ Gerador de HTML para exibição dos eventos coletados.
 
 Responsável por:
 - Criar HTML limpo usando arquivos externos (CSS/JS)
-- Agrupar eventos por mês
-- Gerar cards organizados
-- Inserir o conteúdo no template base
+- Agrupar eventos por mês/ano (data resolvida de cada evento)
+- Gerar uma página por mês e um índice com links para elas
+- Gerar cards organizados, com campos escapados
+- Escrever o resultado em streaming, sem montar a página em memória
+- Regerar apenas as páginas cujo conteúdo mudou (manifesto de hashes)
+- Otimizar o carregamento das imagens (lazy, dimensões, preconnect)
 """
 
+import hashlib
+import json
+import logging
 import os
-from datetime import datetime
+from html import escape
+from urllib.parse import urlsplit
+
+from scraping import codec
+from scraping.config import API_IMAGES_FILE
+from scraping.date_extractor import resolver_data_evento
+from scraping.images import canonicalizar_url_imagem
+from scraping.metrics import metricas
+from scraping.models import para_json
+
+TEMPLATE_BASE = "docs/template_base.html"
+TEMPLATE_MES = "docs/template_mes.html"
+PASTA_PAGINAS = "docs/eventos"
+MANIFESTO = "manifest.json"
+
+PLACEHOLDER = "{{EVENTOS_HTML}}"
+PLACEHOLDER_TITULO = "{{TITULO}}"
+PLACEHOLDER_PRECONNECT = "{{PRECONNECT}}"
+
+# Incrementar sempre que o markup dos cards mudar,
+# para invalidar as páginas já geradas
+VERSAO_LAYOUT = 2
+
+# Quantos cards do topo da página carregam a imagem sem lazy loading
+CARDS_PRIORITARIOS = 2
+
+# Proporção aproximada das miniaturas geradas pelo portal, usada quando
+# o images.json não traz as dimensões. Com height: auto no CSS ela só
+# reserva espaço até a imagem chegar; a proporção real prevalece depois.
+DIMENSOES_POR_CAMINHO = [
+    ("/uploads/_thumbs/", (300, 200)),
+]
+
+MESES_NOME = [
+    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+]
 
 
 # ---------------------------------------------------------
-# Função principal: gera o HTML final
+# Função principal: gera as páginas mensais e o índice
 # ---------------------------------------------------------
-def gerar_html(eventos, caminho="docs/index.html"):
+@metricas.cronometrado("html.gerar")
+def gerar_html(
+    eventos,
+    caminho="docs/index.html",
+    template=TEMPLATE_BASE,
+    pasta_paginas=PASTA_PAGINAS,
+    template_mes=TEMPLATE_MES
+):
     """
-    Recebe a lista de eventos e gera o HTML final,
-    substituindo {{EVENTOS_HTML}} no template base.
+    Recebe a lista de eventos e gera:
+    - uma página por mês/ano em pasta_paginas (ex: eventos/2025-10.html)
+    - o índice (caminho), substituindo {{EVENTOS_HTML}} do template
+      base pela lista de meses
+
+    Páginas cujo hash no manifesto não mudou não são regeradas.
     """
 
-    # Agrupa eventos por mês
+    # Agrupa eventos por (ano, mês), mais recente primeiro
+    grupos = agrupar_por_mes(eventos)
+
+    manifesto_antigo = carregar_manifesto(pasta_paginas)
+    manifesto = {"paginas": {}, "indice": None}
+
+    inicio_mes, fim_mes = carregar_template_base(template_mes)
+    versao_mes = _hash_texto(inicio_mes + fim_mes)
+
+    dimensoes = carregar_dimensoes()
+
+    gerados = 0
+    pulados = 0
+
+    for mes_ano, lista in grupos.items():
+        nome = nome_pagina(mes_ano)
+        destino = os.path.join(pasta_paginas, nome)
+
+        imagens = [atributos_imagem(ev.get("imagem_url"), dimensoes) for ev in lista]
+
+        h = _hash_conteudo(versao_mes, [lista, imagens])
+        manifesto["paginas"][nome] = h
+
+        if manifesto_antigo["paginas"].get(nome) == h and os.path.exists(destino):
+            pulados += 1
+            continue
+
+        titulo = escape(nome_mes_ano(mes_ano))
+        inicio_pagina = (
+            inicio_mes
+            .replace(PLACEHOLDER_TITULO, titulo)
+            .replace(PLACEHOLDER_PRECONNECT, gerar_preconnect(imagens))
+        )
+        escrever_pagina(
+            destino,
+            inicio_pagina,
+            gerar_cards({mes_ano: lista}, dimensoes),
+            fim_mes.replace(PLACEHOLDER_TITULO, titulo)
+        )
+        gerados += 1
+
+    # Remove páginas de meses que deixaram de existir
+    for nome in manifesto_antigo["paginas"].keys() - manifesto["paginas"].keys():
+        destino = os.path.join(pasta_paginas, nome)
+        if os.path.exists(destino):
+            os.remove(destino)
+
+    # Índice com links para os meses
+    inicio, fim = carregar_template_base(template)
+    pasta_relativa = os.path.relpath(pasta_paginas, os.path.dirname(caminho) or ".")
+    contagens = [(mes_ano, len(lista)) for mes_ano, lista in grupos.items()]
+
+    h = _hash_conteudo(_hash_texto(inicio + fim), [pasta_relativa, contagens])
+    manifesto["indice"] = h
+
+    if manifesto_antigo["indice"] != h or not os.path.exists(caminho):
+        escrever_pagina(caminho, inicio, gerar_indice(contagens, pasta_relativa), fim)
+        gerados += 1
+    else:
+        pulados += 1
+
+    salvar_manifesto(pasta_paginas, manifesto)
+
+    metricas.incrementar("paginas_html_geradas", gerados)
+    metricas.incrementar("paginas_html_sem_alteracao", pulados)
+
+    logging.info("🖥️ Páginas HTML: %d geradas, %d sem alterações.", gerados, pulados)
+
+
+# ---------------------------------------------------------
+# Agrupa eventos por (ano, mês) da data resolvida
+# ---------------------------------------------------------
+def agrupar_por_mes(eventos):
     grupos = {}
     for ev in eventos:
-        data = ev.get("data_exibicao", "")
-        mes_ano = extrair_mes_ano(data)
+        mes_ano = extrair_mes_ano(
+            ev.get("data_exibicao", ""),
+            ev.get("blocos_conteudo")
+        )
         grupos.setdefault(mes_ano, []).append(ev)
 
-    # Ordena meses (mais recente primeiro)
-    grupos_ordenados = dict(sorted(
-        grupos.items(),
-        key=lambda x: ordenar_mes_ano(x[0]),
-        reverse=True
-    ))
+    return dict(sorted(grupos.items(), reverse=True))
+
 
-    # Gera os cards HTML
-    eventos_html = gerar_cards(grupos_ordenados)
+# ---------------------------------------------------------
+# Carrega um template e divide no placeholder
+# ---------------------------------------------------------
+def carregar_template_base(caminho=TEMPLATE_BASE):
+    """
+    Retorna (início, fim) do template, separados em {{EVENTOS_HTML}}.
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        template = f.read()
 
-    # Carrega o template base
-    template = carregar_template_base()
+    if PLACEHOLDER not in template:
+        raise ValueError(f"Placeholder {PLACEHOLDER} não encontrado em {caminho}")
 
-    # Substitui o placeholder pelo conteúdo real
-    html_final = template.replace("{{EVENTOS_HTML}}", eventos_html)
+    inicio, fim = template.split(PLACEHOLDER, 1)
+    return inicio, fim
 
-    # Garante que a pasta existe
-    os.makedirs(os.path.dirname(caminho), exist_ok=True)
 
-    # Salva o HTML final
+# ---------------------------------------------------------
+# Escreve uma página em streaming (arquivo temporário + troca)
+# ---------------------------------------------------------
+def escrever_pagina(caminho, inicio, trechos, fim):
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+
+    # nunca deixa uma página pela metade
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(inicio)
+        f.writelines(trechos)
+        f.write(fim)
+
+    os.replace(temporario, caminho)
+
+
+# ---------------------------------------------------------
+# Manifesto de hashes das páginas geradas
+# ---------------------------------------------------------
+def carregar_manifesto(pasta_paginas):
+    caminho = os.path.join(pasta_paginas, MANIFESTO)
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+        return {
+            "paginas": dict(dados.get("paginas") or {}),
+            "indice": dados.get("indice")
+        }
+    except (OSError, ValueError, AttributeError):
+        return {"paginas": {}, "indice": None}
+
+
+def salvar_manifesto(pasta_paginas, manifesto):
+    os.makedirs(pasta_paginas, exist_ok=True)
+    caminho = os.path.join(pasta_paginas, MANIFESTO)
     with open(caminho, "w", encoding="utf-8") as f:
-        f.write(html_final)
+        json.dump(manifesto, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def _hash_texto(texto):
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def _hash_conteudo(versao_template, dados):
+    texto = json.dumps(
+        [VERSAO_LAYOUT, versao_template, dados],
+        ensure_ascii=False, sort_keys=True, default=para_json
+    )
+    return _hash_texto(texto)
 
 
 # ---------------------------------------------------------
-# Carrega o template base (index.html)
+# Gera a lista de meses do índice
 # ---------------------------------------------------------
-def carregar_template_base():
-    caminho = "docs/index.html"
-    with open(caminho, "r", encoding="utf-8") as f:
-        return f.read()
+def gerar_indice(contagens, pasta_relativa):
+    yield "<ul>\n"
+
+    for mes_ano, quantidade in contagens:
+        href = escape(f"{pasta_relativa}/{nome_pagina(mes_ano)}")
+        rotulo = "evento" if quantidade == 1 else "eventos"
+        yield (
+            f'  <li><a href="{href}">{escape(nome_mes_ano(mes_ano))}</a>'
+            f'<span class="month-count">{quantidade} {rotulo}</span></li>\n'
+        )
+
+    yield "</ul>\n"
+
+
+# ---------------------------------------------------------
+# Dimensões conhecidas das imagens (images.json)
+# ---------------------------------------------------------
+def carregar_dimensoes(caminho=API_IMAGES_FILE):
+    """
+    Retorna {url canônica: (largura, altura)} para as imagens
+    do manifesto que têm as duas dimensões.
+    """
+    try:
+        imagens = codec.carregar(caminho).get("imagens", [])
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+    return {
+        img["url"]: (img["largura"], img["altura"])
+        for img in imagens
+        if img.get("largura") and img.get("altura")
+    }
+
+
+# ---------------------------------------------------------
+# URL absoluta e dimensões de uma imagem
+# ---------------------------------------------------------
+def atributos_imagem(url, dimensoes):
+    """
+    Retorna (src, largura, altura). As dimensões vêm do images.json
+    ou, na falta dele, do padrão do caminho (miniaturas do portal).
+    """
+    src = canonicalizar_url_imagem(url)
+    if not src:
+        return "", None, None
+
+    if src in dimensoes:
+        return (src, *dimensoes[src])
+
+    caminho = urlsplit(src).path
+    for prefixo, (largura, altura) in DIMENSOES_POR_CAMINHO:
+        if caminho.startswith(prefixo):
+            return src, largura, altura
+
+    return src, None, None
 
 
 # ---------------------------------------------------------
-# Gera os cards HTML agrupados por mês
+# Links de preconnect para as origens das imagens da página
 # ---------------------------------------------------------
-def gerar_cards(grupos):
-    html = ""
+def gerar_preconnect(imagens):
+    origens = []
 
-    for mes, eventos in grupos.items():
-        html += f'<div class="month-title">{mes}</div>\n'
+    for src, _, _ in imagens:
+        partes = urlsplit(src)
+        origem = f"{partes.scheme}://{partes.netloc}" if partes.netloc else ""
+        if origem and origem not in origens:
+            origens.append(origem)
+
+    return "\n  ".join(
+        f'<link rel="preconnect" href="{escape(o)}">\n'
+        f'  <link rel="dns-prefetch" href="{escape(o)}">'
+        for o in origens
+    )
+
+
+# ---------------------------------------------------------
+# Gera os cards HTML agrupados por mês (um trecho por vez)
+# ---------------------------------------------------------
+def gerar_cards(grupos, dimensoes=None):
+    dimensoes = dimensoes or {}
+    posicao = 0
+
+    for mes_ano, eventos in grupos.items():
+        yield f'<div class="month-title">{escape(nome_mes_ano(mes_ano))}</div>\n'
 
         for ev in eventos:
-            html += f"""
+            yield gerar_card(ev, dimensoes, prioritario=posicao < CARDS_PRIORITARIOS)
+            posicao += 1
+
+
+# ---------------------------------------------------------
+# Gera a tag <img> do card
+# ---------------------------------------------------------
+def gerar_img(url, dimensoes, prioritario=False):
+    src, largura, altura = atributos_imagem(url, dimensoes)
+
+    atributos = [f'src="{escape(src)}"', 'alt="Imagem do evento"']
+    if largura and altura:
+        atributos.append(f'width="{largura}" height="{altura}"')
+
+    # as primeiras imagens aparecem sem rolagem: carregam logo
+    if prioritario:
+        atributos.append('loading="eager" fetchpriority="high"')
+    else:
+        atributos.append('loading="lazy"')
+    atributos.append('decoding="async"')
+
+    return f"<img {' '.join(atributos)}>"
+
+
+# ---------------------------------------------------------
+# Gera o HTML de um único card
+# ---------------------------------------------------------
+def gerar_card(ev, dimensoes=None, prioritario=False):
+    return f"""
 <div class="event-card">
-    <img src="{ev.get('imagem_url', '')}" alt="Imagem do evento">
-    <div class="event-title">{ev.get('titulo')}</div>
-    <div class="event-tag">{ev.get('tag_evento')}</div>
-    <div class="event-content">
-        <a href="{ev.get('link_evento')}" target="_blank">Ver detalhes</a>
+    {gerar_img(ev.get('imagem_url'), dimensoes or {}, prioritario)}
+    <div class="event-info">
+        <div class="event-title">{escape(ev.get('titulo') or '')}</div>
+        <div class="event-tag">{escape(ev.get('tag_evento') or '')}</div>
+        <div class="event-content">
+            <a href="{escape(ev.get('link_evento') or '')}" target="_blank">Ver detalhes</a>
+        </div>
     </div>
 </div>
 """
 
-    return html
+
+# ---------------------------------------------------------
+# Extrai (ano, mês) da data do evento
+# Aceita "12/01/2025", datas por extenso e relativas ("há 3 meses")
+# ---------------------------------------------------------
+def extrair_mes_ano(data_str, blocos_conteudo=None):
+    data = resolver_data_evento(data_str, blocos_conteudo)
+    return data.year, data.month
 
 
 # ---------------------------------------------------------
-# Extrai "Janeiro 2025" a partir de "12/01/2025"
+# Nome legível do mês: (2025, 1) -> "Janeiro 2025"
 # ---------------------------------------------------------
-def extrair_mes_ano(data_str):
-    try:
-        d, m, a = data_str.split("/")
-        dt = datetime(int(a), int(m), int(d))
-        return dt.strftime("%B %Y").title()
-    except Exception:
-        return "Outros"
+def nome_mes_ano(mes_ano):
+    ano, mes = mes_ano
+    return f"{MESES_NOME[mes - 1]} {ano}"
 
 
 # ---------------------------------------------------------
-# Converte "Janeiro 2025" em número para ordenar
+# Nome do arquivo da página do mês: (2025, 1) -> "2025-01.html"
 # ---------------------------------------------------------
-def ordenar_mes_ano(mes_ano):
-    try:
-        return datetime.strptime(mes_ano, "%B %Y")
-    except Exception:
-        return datetime(1900, 1, 1)
+def nome_pagina(mes_ano):
+    ano, mes = mes_ano
+    return f"{ano:04d}-{mes:02d}.html"
@@ -0,0 +1,201 @@
+"""
+Registro de imagens dos eventos.
+
+Responsável por:
+- Canonicalizar URLs de imagens (relativas, http/https, percent-encoding)
+- Atribuir um id estável a cada imagem
+- Registrar largura/altura a partir do atributo style (ou width/height)
+- Publicar um images.json deduplicado, com os eventos que usam cada imagem
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from scraping.config import API_IMAGES_FILE
+from scraping.urls import canonicalizar_url
+
+
+REGEX_LARGURA = re.compile(r"(?<![-\w])width\s*:\s*(\d+)px", re.I)
+REGEX_ALTURA = re.compile(r"(?<![-\w])height\s*:\s*(\d+)px", re.I)
+
+
+# ---------------------------------------------------------
+# Canonicaliza a URL de uma imagem
+# ---------------------------------------------------------
+def canonicalizar_url_imagem(url):
+    """
+    Converte a URL em absoluta, força https, remove fragmento
+    e normaliza o percent-encoding do caminho (urls.canonicalizar_url).
+    """
+    return canonicalizar_url(url)
+
+
+# ---------------------------------------------------------
+# Id estável de uma imagem (derivado da URL canônica)
+# ---------------------------------------------------------
+def gerar_id_imagem(url_canonica):
+    return hashlib.sha1(url_canonica.encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------
+# Extrai largura/altura intrínsecas de uma tag <img>
+# ---------------------------------------------------------
+def extrair_dimensoes(img):
+    """
+    Lê as dimensões do style inline (ex: "width: 600px; height: 400px")
+    e, na falta dele, dos atributos width/height.
+    Retorna (largura, altura), com None quando não encontradas.
+    """
+    style = img.get("style") or ""
+
+    largura = REGEX_LARGURA.search(style)
+    altura = REGEX_ALTURA.search(style)
+
+    largura = int(largura.group(1)) if largura else _int_ou_none(img.get("width"))
+    altura = int(altura.group(1)) if altura else _int_ou_none(img.get("height"))
+
+    return largura, altura
+
+
+def _int_ou_none(valor):
+    try:
+        return int(str(valor).strip().removesuffix("px"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RegistroImagens:
+    """
+    Mantém as imagens encontradas durante a raspagem, deduplicadas
+    pela URL canônica, e os eventos que referenciam cada uma.
+    """
+
+    def __init__(self):
+        self.imagens = {}
+
+        # várias fontes podem registrar imagens ao mesmo tempo
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Registra uma imagem pela URL
+    # ---------------------------------------------------------
+    def registrar(self, url, evento_id=None, largura=None, altura=None):
+        """
+        Registra a imagem e retorna seu id (ou None se a URL for vazia).
+        Dimensões já conhecidas não são sobrescritas por valores vazios.
+        """
+        canonica = canonicalizar_url_imagem(url)
+        if not canonica:
+            return None
+
+        with self._lock:
+            return self._registrar(canonica, evento_id, largura, altura)
+
+    def _registrar(self, canonica, evento_id, largura, altura):
+        img = self.imagens.get(canonica)
+        if img is None:
+            img = {
+                "id": gerar_id_imagem(canonica),
+                "url": canonica,
+                "largura": None,
+                "altura": None,
+                "eventos": []
+            }
+            self.imagens[canonica] = img
+
+        if largura and not img["largura"]:
+            img["largura"] = largura
+        if altura and not img["altura"]:
+            img["altura"] = altura
+
+        if evento_id and evento_id not in img["eventos"]:
+            img["eventos"].append(evento_id)
+
+        return img["id"]
+
+    # ---------------------------------------------------------
+    # Recarrega um images.json publicado anteriormente
+    # ---------------------------------------------------------
+    def carregar(self, caminho=API_IMAGES_FILE):
+        if not os.path.exists(caminho):
+            return self
+
+        with open(caminho, "r", encoding="utf-8") as f:
+            imagens = json.load(f).get("imagens", [])
+
+        # mescla com o que já foi registrado nesta execução
+        with self._lock:
+            for img in imagens:
+                for evento_id in img.get("eventos", []):
+                    self._registrar(img["url"], evento_id, img.get("largura"), img.get("altura"))
+
+        return self
+
+    # ---------------------------------------------------------
+    # Registra uma tag <img> do BeautifulSoup
+    # ---------------------------------------------------------
+    def registrar_tag(self, img, evento_id=None):
+        if not img or not img.get("src"):
+            return None
+
+        largura, altura = extrair_dimensoes(img)
+        return self.registrar(img["src"], evento_id, largura, altura)
+
+    # ---------------------------------------------------------
+    # Registra as imagens de um evento já coletado
+    # (usado ao retomar uma raspagem a partir do checkpoint)
+    # ---------------------------------------------------------
+    def registrar_evento(self, ev, evento_id):
+        self.registrar(ev.get("imagem_url"), evento_id)
+
+        for bloco in ev.get("blocos_conteudo") or []:
+            if bloco.get("type") == "IMAGE_URL":
+                self.registrar(bloco.get("content"), evento_id)
+            elif "<img" in (bloco.get("content") or ""):
+                # só usado na retomada: html_generator importa este módulo sem precisar do bs4
+                from bs4 import BeautifulSoup
+
+                soup = BeautifulSoup(bloco["content"], "html.parser")
+                for img in soup.find_all("img"):
+                    self.registrar_tag(img, evento_id)
+
+    # ---------------------------------------------------------
+    # Remove as referências de um evento descartado
+    # ---------------------------------------------------------
+    def descartar_evento(self, evento_id):
+        with self._lock:
+            for img in self.imagens.values():
+                if evento_id in img["eventos"]:
+                    img["eventos"].remove(evento_id)
+
+    # ---------------------------------------------------------
+    # Lista final (apenas imagens usadas por algum evento)
+    # ---------------------------------------------------------
+    def listar(self):
+        return sorted(
+            (img for img in self.imagens.values() if img["eventos"]),
+            key=lambda img: img["id"]
+        )
+
+    # ---------------------------------------------------------
+    # Publica o manifesto images.json
+    # ---------------------------------------------------------
+    def salvar(self, caminho=API_IMAGES_FILE):
+        imagens = self.listar()
+        referencias = sum(len(img["eventos"]) for img in imagens)
+
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(
+                {"quantidade_imagens": len(imagens), "imagens": imagens},
+                f, ensure_ascii=False, indent=2
+            )
+
+        logging.info(
+            "🖼️ %d imagens únicas (%d referências) salvas em %s",
+            len(imagens), referencias, caminho
+        )
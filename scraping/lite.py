@@ -0,0 +1,332 @@
+"""
+Modo leve (--lite) e hidratação dos detalhes (--hidratar).
+
+Responsável por:
+- Publicar eventos_index.json direto das páginas da listagem
+  (uma requisição por página, sem abrir nenhum artigo)
+- Hidratar depois, numa passada separada, os eventos do índice
+  que ainda não foram publicados com blocos_conteudo
+- Limitar cada hidratação por tempo e por quantidade de eventos
+- Retomar uma hidratação interrompida a partir do seu checkpoint
+"""
+
+import logging
+import os
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+from scraping import codec
+from scraping.archiver import ArquivadorEventos
+from scraping.checkpoint import CheckpointJSONL
+from scraping.config import API_EVENTOS_INDEX_FILE, HIDRATACAO_FILE
+from scraping.images import RegistroImagens
+from scraping.metrics import metricas
+from scraping.models import Evento
+from scraping.parser import norm_text
+from scraping.pipeline import Pipeline
+from scraping.runner import extract_results, get_next_page, load_page, scrape_details
+from scraping.sources import obter_fontes
+from scraping.storage import gerar_id_evento
+from scraping.urls import chave_url
+
+
+# ---------------------------------------------------------
+# Registro do índice a partir de um card da listagem
+# ---------------------------------------------------------
+def registro_indice(card, fonte):
+    """
+    imagem_url é absoluta (para exibição direta pelo índice);
+    imagem_card é a URL como está no card, a mesma que a coleta
+    completa grava em eventos.json, e é a usada na hidratação.
+    """
+    titulo = norm_text(card["titulo"])
+    link = card["link_evento"]
+
+    return {
+        "id": gerar_id_evento({"titulo": titulo, "link_evento": link}),
+        "titulo": titulo,
+        "tag_evento": norm_text(card["tag_evento"]),
+        "imagem_url": fonte.complete_url(card["imagem_url"]) if card["imagem_url"] else "",
+        "imagem_card": card["imagem_url"],
+        "link_evento": link,
+        "fonte": fonte.nome,
+        "data_exibicao": card["data_exibicao"]
+    }
+
+
+# ---------------------------------------------------------
+# URL da imagem como está no card (a de eventos.json)
+# ---------------------------------------------------------
+def imagem_do_card(item, fonte):
+    """
+    Registros gravados antes de imagem_card existir (índice ou
+    fronteira antigos) só têm a URL absoluta: no host da fonte,
+    ela volta a ser relativa, como no card.
+    """
+    if "imagem_card" in item:
+        return item["imagem_card"]
+
+    imagem = item.get("imagem_url") or ""
+    base = urlsplit(fonte.url_base)
+    partes = urlsplit(imagem)
+    if partes.netloc and partes.netloc == base.netloc:
+        return urlunsplit(("", "", partes.path, partes.query, partes.fragment))
+    return imagem
+
+
+# ---------------------------------------------------------
+# Coleta leve: só as páginas da listagem
+# ---------------------------------------------------------
+def coletar_indice(fontes=None, prazo=None):
+    """
+    Percorre as listagens de cada fonte e retorna os registros do
+    índice (id, título, tag, imagem, link, fonte e data), na ordem
+    da listagem. Links repetidos entre páginas são ignorados.
+
+    prazo (time.monotonic()) interrompe a coleta entre uma página e outra.
+    """
+    registros = []
+    links = set()
+
+    for fonte in fontes or obter_fontes():
+        logging.info("📇 Coleta leve da %s...", fonte.nome)
+        pagina = 1
+        total = 0
+
+        while True:
+            soup = load_page(pagina, fonte)
+            if not soup:
+                logging.warning("⚠️ Falha ao carregar página %d. Encerrando.", pagina)
+                break
+
+            metricas.incrementar("paginas_listagem")
+
+            cards = extract_results(soup, fonte)
+            if not cards:
+                break
+
+            for bloco in cards:
+                card = fonte.extrair_card(bloco)
+                if not card:
+                    metricas.descartar("link_invalido")
+                    continue
+
+                chave = chave_url(card["link_evento"])
+                if chave in links:
+                    continue
+                links.add(chave)
+
+                registros.append(registro_indice(card, fonte))
+                total += 1
+
+            if not get_next_page(soup, pagina, fonte):
+                break
+
+            if prazo is not None and time.monotonic() >= prazo:
+                logging.info("⏸️ %s: prazo esgotado na página %d.", fonte.nome, pagina)
+                break
+
+            pagina += 1
+
+        logging.info("✅ %s: %d eventos em %d páginas.", fonte.nome, total, pagina)
+
+    return registros
+
+
+# ---------------------------------------------------------
+# Grava eventos_index.json
+# ---------------------------------------------------------
+def salvar_indice(registros, caminho=API_EVENTOS_INDEX_FILE):
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    codec.gravar(registros, caminho)
+    logging.info("📇 %d eventos salvos em %s", len(registros), caminho)
+
+
+# ---------------------------------------------------------
+# Lê o índice publicado (só registros com link)
+# ---------------------------------------------------------
+def carregar_indice(caminho=API_EVENTOS_INDEX_FILE):
+    if not os.path.exists(caminho):
+        return []
+
+    dados = codec.carregar(caminho)
+    if not isinstance(dados, list):
+        return []
+
+    return [r for r in dados if isinstance(r, dict) and r.get("link_evento")]
+
+
+# ---------------------------------------------------------
+# Hidratação: detalhes dos eventos do índice, em lotes
+# ---------------------------------------------------------
+class CheckpointHidratacao(CheckpointJSONL):
+    """
+    Uma linha por evento processado na hidratação:
+    {"fonte": "funcultural", "link": "...", "evento": {...} ou null}
+
+    null marca um artigo sem conteúdo, que não é tentado de novo
+    até o fim desta hidratação.
+    """
+
+    def __init__(self, caminho=HIDRATACAO_FILE):
+        super().__init__(caminho)
+
+    def registrar_link(self, fonte, link, evento):
+        self._gravar({"fonte": fonte, "link": link, "evento": evento})
+
+    def links(self):
+        """
+        Chaves canônicas (urls.chave_url) dos links processados.
+        """
+        return {chave_url(r["link"]) for r in self._registros() if r.get("link")}
+
+
+class Hidratador:
+    """
+    Preenche blocos_conteudo dos eventos do índice que ainda não
+    estão publicados, do mais recente para o mais antigo:
+
+        Hidratador(orcamento=300, limite=50).executar()
+
+    - orcamento: segundos disponíveis (nenhum artigo novo começa depois disso)
+    - limite: máximo de eventos hidratados nesta execução
+
+    Cada evento vai para o checkpoint assim que é hidratado; se o
+    processo cair, a próxima execução continua de onde parou. No fim,
+    os eventos hidratados são incorporados aos publicados.
+    """
+
+    def __init__(self, orcamento=None, limite=None, arquivador=None, fontes=None, checkpoint=None):
+        self.orcamento = orcamento
+        self.limite = limite
+        self.arquivador = arquivador or ArquivadorEventos()
+        self.fontes = {f.nome: f for f in fontes or obter_fontes()}
+        self.checkpoint = checkpoint or CheckpointHidratacao()
+
+        # início da passada e itens que ficaram para a próxima
+        self.inicio = None
+        self.restantes = None
+
+    # ---------------------------------------------------------
+    # Índice de onde saem os eventos a hidratar
+    # ---------------------------------------------------------
+    def carregar(self):
+        indice = carregar_indice()
+        if not indice:
+            logging.warning("⚠️ eventos_index.json vazio ou ausente. Rode --lite primeiro.")
+        return indice
+
+    # ---------------------------------------------------------
+    # Eventos do índice que ainda precisam dos detalhes
+    # ---------------------------------------------------------
+    def pendentes(self, indice):
+        publicados = {
+            chave_url(ev["link_evento"])
+            for lista in self.arquivador.carregar_publicados().values()
+            for ev in lista
+        }
+        processados = self.checkpoint.links()
+
+        return [
+            r for r in indice
+            if chave_url(r["link_evento"]) not in publicados
+            and chave_url(r["link_evento"]) not in processados
+            and r.get("fonte") in self.fontes
+        ]
+
+    # ---------------------------------------------------------
+    # Hidrata um registro do índice (None se o artigo estiver vazio)
+    # ---------------------------------------------------------
+    def hidratar(self, item, registro_imagens):
+        fonte = self.fontes[item["fonte"]]
+        link = item["link_evento"]
+        evento_id = gerar_id_evento(item)
+        imagem = imagem_do_card(item, fonte)
+
+        registro_imagens.registrar(imagem, evento_id)
+
+        blocks = scrape_details(link, registro_imagens, evento_id, fonte)
+        if not blocks:
+            logging.warning("⚠️ Conteúdo detalhado vazio: %s", link)
+            registro_imagens.descartar_evento(evento_id)
+            return None
+
+        return Evento(
+            titulo=item["titulo"],
+            tag_evento=item["tag_evento"],
+            blocos_conteudo=blocks,
+            imagem_url=imagem,
+            link_evento=link,
+            fonte=fonte.nome,
+            data_exibicao=item["data_exibicao"]
+        )
+
+    # ---------------------------------------------------------
+    # Motivo para parar antes do próximo artigo (ou None)
+    # ---------------------------------------------------------
+    def esgotado(self, hidratados=0):
+        if self.limite is not None and hidratados >= self.limite:
+            return f"limite de {self.limite} eventos"
+        if self.orcamento is not None and time.monotonic() - self.inicio >= self.orcamento:
+            return f"orçamento de {self.orcamento:g}s"
+        return None
+
+    # ---------------------------------------------------------
+    # Executa uma passada de hidratação e publica o resultado
+    # ---------------------------------------------------------
+    def executar(self):
+        self.inicio = time.monotonic()
+
+        indice = self.carregar()
+        if not indice:
+            return 0
+
+        registro = RegistroImagens()
+
+        if self.checkpoint.existe():
+            logging.info("⏩ Retomando hidratação interrompida.")
+            for ev in self.checkpoint.eventos():
+                registro.registrar_evento(ev, gerar_id_evento(ev))
+            self.checkpoint.reabrir()
+        else:
+            self.checkpoint.iniciar()
+
+        pendentes = self.pendentes(indice)
+        logging.info("💧 %d eventos do índice aguardando detalhes.", len(pendentes))
+
+        hidratados = 0
+        processados = 0
+
+        try:
+            for item in pendentes:
+                motivo = self.esgotado(hidratados)
+                if motivo:
+                    logging.info("⏸️ Hidratação pausada (%s).", motivo)
+                    break
+
+                ev = self.hidratar(item, registro)
+                fonte = self.fontes[item["fonte"]]
+                self.checkpoint.registrar_link(fonte.chave, item["link_evento"], ev)
+
+                processados += 1
+                if ev:
+                    hidratados += 1
+                    metricas.incrementar("eventos_hidratados")
+        finally:
+            self.checkpoint.fechar()
+
+        self.restantes = pendentes[processados:]
+
+        eventos = list(self.checkpoint.eventos())
+        if eventos:
+            logging.info("📦 Publicando %d eventos hidratados...", len(eventos))
+            Pipeline(self.arquivador).incorporar(eventos, registro).arquivar().publicar()
+
+        # só descarta o checkpoint depois da publicação
+        self.checkpoint.concluir()
+
+        logging.info(
+            "✅ Hidratação: %d eventos publicados, %d ainda pendentes.",
+            len(eventos), len(self.restantes)
+        )
+        return len(eventos)
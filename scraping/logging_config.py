@@ -3,20 +3,42 @@ Configuração centralizada de logging.
 
 Responsável por:
 - Criar logs no terminal (com cores simples)
-- Criar logs detalhados em arquivo
+- Criar logs estruturados (JSON, uma linha por registro) em arquivo,
+  com rotação por tamanho
+- Gravar os logs numa thread separada (QueueHandler/QueueListener),
+  para que o scraper não espere pelo disco nem pelo terminal
+- Agregar mensagens repetitivas (ex: cache HIT) em uma linha de resumo
 - Controlar nível de log (INFO ou DEBUG)
 - Padronizar formato e saída
 """
 
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOG_DIR, "scraper.log")
 
+# rotação do arquivo de log: 5 MB por arquivo, 3 arquivos antigos
+LOG_TAMANHO_MAXIMO = 5 * 1024 * 1024
+LOG_ARQUIVOS_ANTIGOS = 3
+
+# mensagens agregadas geram no máximo uma linha de resumo a cada N segundos
+INTERVALO_AGREGACAO = 30.0
+
+# atributos padrão de um LogRecord (o resto veio de extra=... e vai para o JSON)
+_ATRIBUTOS_PADRAO = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
 
 class ColorFormatter(logging.Formatter):
     """
@@ -37,33 +59,184 @@ class ColorFormatter(logging.Formatter):
         return f"{color}{message}{self.RESET}"
 
 
+class FormatadorJSON(logging.Formatter):
+    """
+    Uma linha JSON por registro: data, nível, mensagem, origem
+    e os campos passados em extra=...
+    """
+
+    def format(self, record):
+        dados = {
+            "data": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "mensagem": record.getMessage(),
+            "modulo": record.module,
+            "thread": record.threadName
+        }
+
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO and chave not in dados:
+                dados[chave] = valor
+
+        # vindo do FilaHandler, o traceback já está formatado em exc_text
+        if record.exc_info:
+            dados["excecao"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            dados["excecao"] = record.exc_text
+
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+
+class FilaHandler(QueueHandler):
+    """
+    QueueHandler que mantém a exceção fora da mensagem.
+
+    O prepare() padrão junta o traceback ao msg e apaga exc_info, e
+    o arquivo JSON nunca teria o campo "excecao". Aqui o traceback é
+    formatado em exc_text (o objeto da exceção, com seus frames, não
+    fica preso na fila) e cada handler do listener o mostra do seu
+    jeito: o terminal abaixo da mensagem, o JSON em "excecao".
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class FiltroAgregacao(logging.Filter):
+    """
+    Agrega registros marcados com extra={"agregar": "<rótulo>"}.
+
+    Em vez de uma linha por ocorrência, deixa passar no máximo uma
+    linha de resumo por rótulo a cada `intervalo` segundos
+    ("📦 Cache HIT: 390 ocorrências"). Avisos e erros nunca são agregados.
+    O que sobrar no fim é resumido por descarregar().
+    """
+
+    def __init__(self, intervalo=INTERVALO_AGREGACAO):
+        super().__init__()
+        self.intervalo = intervalo
+        self.contagens = Counter()
+        self.inicio = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        rotulo = getattr(record, "agregar", None)
+        if rotulo is None or record.levelno >= logging.WARNING:
+            return True
+
+        agora = time.monotonic()
+
+        with self._lock:
+            self.contagens[rotulo] += 1
+            inicio = self.inicio.setdefault(rotulo, agora)
+            if agora - inicio < self.intervalo:
+                return False
+
+            quantidade = self.contagens.pop(rotulo)
+            self.inicio[rotulo] = agora
+
+        # reaproveita o registro atual como linha de resumo
+        record.msg = "%s: %d ocorrências"
+        record.args = (rotulo, quantidade)
+        record.agregados = quantidade
+        return True
+
+    def descarregar(self):
+        with self._lock:
+            pendentes = list(self.contagens.items())
+            self.contagens.clear()
+            self.inicio.clear()
+
+        for rotulo, quantidade in pendentes:
+            logging.info("%s: %d ocorrências", rotulo, quantidade, extra={"agregados": quantidade})
+
+
+# listener ativo (um por processo) e o filtro de agregação associado
+_listener = None
+_filtro = None
+
+
 def configurar_logging(debug=False):
     """
     Configura o sistema de logs.
 
     Parâmetros:
-    - debug (bool): ativa logs detalhados quando True.
+    - debug (bool): ativa logs detalhados quando True
+      (e desliga a agregação: todas as linhas são gravadas).
     """
+    global _listener, _filtro
+
     nivel = logging.DEBUG if debug else logging.INFO
     formato = "%(asctime)s | %(levelname)s | %(message)s"
 
+    # Encerra uma configuração anterior (grava o que estiver na fila)
+    encerrar_logging()
+
     # Remove handlers antigos para evitar duplicação
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
 
-    # Handler para arquivo (sempre detalhado)
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    # Handler para arquivo (sempre detalhado, JSON, com rotação)
+    os.makedirs(LOG_DIR, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_TAMANHO_MAXIMO,
+        backupCount=LOG_ARQUIVOS_ANTIGOS,
+        encoding="utf-8"
+    )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(formato))
+    file_handler.setFormatter(FormatadorJSON())
 
     # Handler para terminal (com cores)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(nivel)
     console_handler.setFormatter(ColorFormatter(formato))
 
+    # O código só coloca o registro na fila; a gravação acontece
+    # na thread do QueueListener
+    fila = queue.SimpleQueue()
+    queue_handler = FilaHandler(fila)
+
+    # o FilaHandler só monta a mensagem e o traceback; data e nível
+    # ficam a cargo dos handlers do listener
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    if not debug:
+        _filtro = FiltroAgregacao()
+        queue_handler.addFilter(_filtro)
+
+    _listener = QueueListener(fila, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+
     logging.basicConfig(
         level=nivel,
-        handlers=[file_handler, console_handler]
+        handlers=[queue_handler]
     )
 
     logging.info("✅ Logging inicializado.")
+
+
+# ---------------------------------------------------------
+# Resume as agregações pendentes e esvazia a fila
+# ---------------------------------------------------------
+def encerrar_logging():
+    global _listener, _filtro
+
+    if _filtro is not None:
+        _filtro.descarregar()
+        _filtro = None
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(encerrar_logging)
@@ -0,0 +1,255 @@
+"""
+Métricas de execução do scraper.
+
+Responsável por:
+- Acumular tempos por etapa, contadores e bytes baixados
+- Registrar eventos descartados e o motivo
+- Calcular a taxa de acerto do cache e o pico de memória (RSS)
+- Informar quantos bytes a sanitização do HTML dos blocos economizou
+- Gravar run_report.json e um arquivo de texto no formato do Prometheus
+  (node_exporter textfile collector) ao final de cada execução
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+from scraping.config import PROMETHEUS_TEXTFILE, RELATORIO_EXECUCAO
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Metricas:
+    """
+    Coletor de métricas do processo. Thread-safe: as fontes
+    são coletadas em paralelo e todas registram aqui.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        with self._lock:
+            self.inicio = time.time()
+            self.contadores = Counter()
+            self.descartes = Counter()
+
+            # etapa -> [execuções, segundos totais, maior duração]
+            self.etapas = {}
+
+    # ---------------------------------------------------------
+    # Registro
+    # ---------------------------------------------------------
+    def incrementar(self, nome, valor=1):
+        with self._lock:
+            self.contadores[nome] += valor
+
+    def descartar(self, motivo):
+        with self._lock:
+            self.descartes[motivo] += 1
+
+    def valor(self, nome):
+        with self._lock:
+            return self.contadores[nome]
+
+    def observar(self, etapa, segundos):
+        with self._lock:
+            estatisticas = self.etapas.get(etapa)
+            if estatisticas is None:
+                self.etapas[etapa] = [1, segundos, segundos]
+                return
+            estatisticas[0] += 1
+            estatisticas[1] += segundos
+            if segundos > estatisticas[2]:
+                estatisticas[2] = segundos
+
+    @contextmanager
+    def cronometrar(self, etapa):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(etapa, time.perf_counter() - inicio)
+
+    def cronometrado(self, etapa):
+        """
+        Decorador: cronometra cada chamada da função como `etapa`.
+        """
+        def decorar(funcao):
+            @wraps(funcao)
+            def envolver(*args, **kwargs):
+                with self.cronometrar(etapa):
+                    return funcao(*args, **kwargs)
+            return envolver
+        return decorar
+
+    # ---------------------------------------------------------
+    # Relatório
+    # ---------------------------------------------------------
+    def relatorio(self, comando=None, sucesso=True):
+        fim = time.time()
+
+        with self._lock:
+            contadores = dict(sorted(self.contadores.items()))
+            descartes = dict(self.descartes.most_common())
+            etapas = {
+                nome: {
+                    "execucoes": n,
+                    "total_s": round(total, 4),
+                    "media_ms": round(total / n * 1000, 3),
+                    "max_ms": round(maior * 1000, 3)
+                }
+                for nome, (n, total, maior) in sorted(self.etapas.items())
+            }
+
+        hits = contadores.get("cache_hits", 0)
+        misses = contadores.get("cache_misses", 0)
+
+        html_original = contadores.get("html_bytes_originais", 0)
+        html_final = contadores.get("html_bytes_sanitizados", 0)
+
+        return {
+            "comando": comando,
+            "sucesso": sucesso,
+            "inicio": datetime.fromtimestamp(self.inicio).isoformat(timespec="seconds"),
+            "fim": datetime.fromtimestamp(fim).isoformat(timespec="seconds"),
+            "duracao_s": round(fim - self.inicio, 3),
+            "pico_rss_kb": pico_rss_kb(),
+            "cache": {
+                "hits": hits,
+                "misses": misses,
+                "taxa_acerto": round(hits / (hits + misses), 4) if hits + misses else None
+            },
+            "bytes_baixados": contadores.get("bytes_baixados", 0),
+            "html_blocos": {
+                "bytes_originais": html_original,
+                "bytes_sanitizados": html_final,
+                "bytes_economizados": html_original - html_final
+            },
+            "eventos_descartados": descartes,
+            "contadores": contadores,
+            "etapas": etapas
+        }
+
+
+# ---------------------------------------------------------
+# Pico de memória residente do processo (KB), se disponível
+# ---------------------------------------------------------
+def pico_rss_kb():
+    if resource is None:
+        return None
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS informa em bytes; Linux em KB
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+
+# ---------------------------------------------------------
+# Formato texto do Prometheus
+# ---------------------------------------------------------
+def _rotulo(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def formatar_prometheus(relatorio):
+    linhas = []
+
+    def metrica(nome, tipo, ajuda, amostras):
+        linhas.append(f"# HELP {nome} {ajuda}")
+        linhas.append(f"# TYPE {nome} {tipo}")
+        for rotulos, valor in amostras:
+            if valor is None:
+                continue
+            texto = ",".join(f'{k}="{_rotulo(v)}"' for k, v in rotulos.items())
+            linhas.append(f"{nome}{{{texto}}} {valor}" if texto else f"{nome} {valor}")
+
+    comando = {"comando": relatorio["comando"] or ""}
+
+    metrica(
+        "scraper_ultima_execucao_timestamp_segundos", "gauge",
+        "Fim da última execução (epoch).",
+        [(comando, int(time.time()))]
+    )
+    metrica(
+        "scraper_execucao_duracao_segundos", "gauge",
+        "Duração da última execução.",
+        [(comando, relatorio["duracao_s"])]
+    )
+    metrica(
+        "scraper_execucao_sucesso", "gauge",
+        "1 se a última execução terminou sem erro.",
+        [(comando, int(relatorio["sucesso"]))]
+    )
+    metrica(
+        "scraper_pico_rss_bytes", "gauge",
+        "Pico de memória residente do processo.",
+        [(comando, relatorio["pico_rss_kb"] * 1024 if relatorio["pico_rss_kb"] is not None else None)]
+    )
+    metrica(
+        "scraper_cache_taxa_acerto", "gauge",
+        "Fração das páginas servidas pelo cache local.",
+        [(comando, relatorio["cache"]["taxa_acerto"])]
+    )
+    metrica(
+        "scraper_contador", "gauge",
+        "Contadores da última execução.",
+        [({**comando, "nome": nome}, valor) for nome, valor in relatorio["contadores"].items()]
+    )
+    metrica(
+        "scraper_eventos_descartados", "gauge",
+        "Eventos descartados na última execução, por motivo.",
+        [({**comando, "motivo": motivo}, n) for motivo, n in relatorio["eventos_descartados"].items()]
+    )
+    metrica(
+        "scraper_etapa_segundos", "gauge",
+        "Tempo total gasto em cada etapa.",
+        [({**comando, "etapa": etapa}, e["total_s"]) for etapa, e in relatorio["etapas"].items()]
+    )
+    metrica(
+        "scraper_etapa_execucoes", "gauge",
+        "Quantidade de execuções de cada etapa.",
+        [({**comando, "etapa": etapa}, e["execucoes"]) for etapa, e in relatorio["etapas"].items()]
+    )
+
+    return "\n".join(linhas) + "\n"
+
+
+# ---------------------------------------------------------
+# Grava um arquivo de forma atômica (o coletor nunca lê pela metade)
+# ---------------------------------------------------------
+def _gravar(caminho, conteudo):
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    # um temporário por processo: vários --worker podem gravar ao mesmo tempo
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+def salvar_relatorio(
+    comando=None,
+    sucesso=True,
+    caminho=RELATORIO_EXECUCAO,
+    caminho_prometheus=PROMETHEUS_TEXTFILE
+):
+    relatorio = metricas.relatorio(comando, sucesso)
+
+    _gravar(caminho, json.dumps(relatorio, ensure_ascii=False, indent=2))
+    _gravar(caminho_prometheus, formatar_prometheus(relatorio))
+
+    return relatorio
+
+
+# coletor único do processo
+metricas = Metricas()
@@ -0,0 +1,184 @@
+"""
+Modelo compacto de eventos e blocos de conteúdo.
+
+Responsável por:
+- Representar eventos e blocos com __slots__ (sem um dict por objeto)
+- Validar os campos num único construtor
+- Converter de/para o formato JSON publicado, mantendo a ordem das chaves
+
+Evento e Bloco são Mappings somente leitura: quem lê eventos com
+ev.get(...), ev["..."] ou {**ev} continua funcionando sem mudanças.
+"""
+
+from collections.abc import Mapping
+
+SUBTITULO = "SUBTITLE"
+PARAGRAFO = "PARAGRAPH"
+IMAGEM = "IMAGE_URL"
+
+TIPOS_BLOCO = frozenset((SUBTITULO, PARAGRAFO, IMAGEM))
+
+
+class Bloco(Mapping):
+    """
+    Bloco de conteúdo: {"type": ..., "content": ...} no JSON.
+
+    texto e subtitulo só existem durante a classificação
+    (texto puro para deduplicação e estatísticas) e não são publicados.
+    """
+
+    __slots__ = ("tipo", "conteudo", "texto", "subtitulo")
+
+    # chave JSON -> atributo
+    CHAVES = {"type": "tipo", "content": "conteudo"}
+
+    def __init__(self, tipo, conteudo, texto=None, subtitulo=False):
+        if tipo not in TIPOS_BLOCO:
+            raise ValueError(f"Tipo de bloco inválido: {tipo!r}")
+        if not isinstance(conteudo, str):
+            raise ValueError(f"Conteúdo de bloco inválido: {conteudo!r}")
+
+        self.tipo = tipo
+        self.conteudo = conteudo
+        self.texto = texto
+        self.subtitulo = subtitulo
+
+    @classmethod
+    def imagem(cls, url):
+        return cls(IMAGEM, url)
+
+    @classmethod
+    def de_dict(cls, dados):
+        if isinstance(dados, cls):
+            return dados
+        if not isinstance(dados, Mapping):
+            raise ValueError(f"Bloco inválido: {dados!r}")
+        return cls(dados.get("type"), dados.get("content"))
+
+    def para_dict(self):
+        return {"type": self.tipo, "content": self.conteudo}
+
+    # ---------------------------------------------------------
+    # Interface de Mapping (somente as chaves publicadas)
+    # ---------------------------------------------------------
+    def __getitem__(self, chave):
+        try:
+            return getattr(self, self.CHAVES[chave])
+        except KeyError:
+            raise KeyError(chave) from None
+
+    def __iter__(self):
+        return iter(self.CHAVES)
+
+    def __len__(self):
+        return len(self.CHAVES)
+
+    def __eq__(self, outro):
+        if isinstance(outro, Bloco):
+            return self.tipo == outro.tipo and self.conteudo == outro.conteudo
+        return Mapping.__eq__(self, outro)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Bloco({self.tipo!r}, {self.conteudo[:40]!r})"
+
+
+class Evento(Mapping):
+    """
+    Evento publicado. Os campos seguem a ordem das chaves do JSON.
+    """
+
+    __slots__ = (
+        "titulo",
+        "tag_evento",
+        "blocos_conteudo",
+        "imagem_url",
+        "link_evento",
+        "fonte",
+        "data_exibicao"
+    )
+
+    CAMPOS = __slots__
+
+    def __init__(
+        self,
+        titulo,
+        tag_evento,
+        blocos_conteudo,
+        imagem_url,
+        link_evento,
+        fonte,
+        data_exibicao
+    ):
+        if not isinstance(titulo, str):
+            raise ValueError(f"Título inválido: {titulo!r}")
+        if not link_evento or not isinstance(link_evento, str):
+            raise ValueError(f"Link inválido: {link_evento!r}")
+        if not isinstance(blocos_conteudo, list):
+            raise ValueError(f"Blocos inválidos em {link_evento}")
+
+        self.titulo = titulo
+        self.tag_evento = tag_evento
+        self.blocos_conteudo = [Bloco.de_dict(b) for b in blocos_conteudo]
+        self.imagem_url = imagem_url
+        self.link_evento = link_evento
+        self.fonte = fonte
+        self.data_exibicao = data_exibicao
+
+    @classmethod
+    def de_dict(cls, dados):
+        if isinstance(dados, cls):
+            return dados
+        if not isinstance(dados, Mapping):
+            raise ValueError(f"Evento inválido: {dados!r}")
+
+        ausentes = [c for c in cls.CAMPOS if c not in dados]
+        if ausentes:
+            raise ValueError(f"Evento sem os campos {', '.join(ausentes)}")
+
+        return cls(*(dados[c] for c in cls.CAMPOS))
+
+    def para_dict(self):
+        return {
+            "titulo": self.titulo,
+            "tag_evento": self.tag_evento,
+            "blocos_conteudo": [b.para_dict() for b in self.blocos_conteudo],
+            "imagem_url": self.imagem_url,
+            "link_evento": self.link_evento,
+            "fonte": self.fonte,
+            "data_exibicao": self.data_exibicao
+        }
+
+    # ---------------------------------------------------------
+    # Interface de Mapping
+    # ---------------------------------------------------------
+    def __getitem__(self, chave):
+        if chave not in self.CAMPOS:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __iter__(self):
+        return iter(self.CAMPOS)
+
+    def __len__(self):
+        return len(self.CAMPOS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Evento({self.titulo!r}, {self.link_evento!r})"
+
+
+# ---------------------------------------------------------
+# Codec JSON
+# ---------------------------------------------------------
+def para_json(obj):
+    """
+    Usado como default= de json.dump/json.dumps: converte Evento e
+    Bloco no dict publicado (mesma saída de antes, byte a byte).
+    """
+    if isinstance(obj, (Evento, Bloco)):
+        return obj.para_dict()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
@@ -10,6 +10,8 @@ Responsável por:
 import re
 import unicodedata
 
+from scraping.models import PARAGRAFO, SUBTITULO, Bloco
+
 
 # ---------------------------------------------------------
 # Normaliza texto:
@@ -55,9 +57,4 @@ def build_block(elem):
         bool(elem.find(["strong", "em"]))
     )
 
-    return {
-        "type": "SUBTITLE" if is_title else "PARAGRAPH",
-        "content": html,
-        "plain": plain,
-        "is_subtitle": is_title
-    }
+    return Bloco(SUBTITULO if is_title else PARAGRAFO, html, plain, is_title)
@@ -0,0 +1,112 @@
+"""
+Pipeline completo do scraper em memória.
+
+Responsável por:
+- Executar coleta, arquivamento, exportações e HTML em sequência
+- Passar os eventos entre as etapas sem reler/regravar arquivos
+- Gravar cada arquivo de saída uma única vez, no final
+- Incorporar eventos novos aos já publicados (modo --watch)
+"""
+
+import logging
+
+from scraping.archiver import ArquivadorEventos
+from scraping.html_generator import gerar_html
+from scraping.images import RegistroImagens
+from scraping.runner import coletar_com_checkpoint
+from scraping.sqlite_export import exportar_sqlite
+from scraping.tags import gerar_facetas, salvar_facetas
+from scraping.urls import chave_url
+
+
+class Pipeline:
+    """
+    Mantém a coleção de eventos em memória entre as etapas:
+
+        Pipeline().coletar().arquivar().publicar()
+
+    Os comandos individuais (--atualizar, --arquivar, --gerar-html...)
+    continuam trabalhando sobre os arquivos.
+    """
+
+    def __init__(self, arquivador=None):
+        self.arquivador = arquivador or ArquivadorEventos()
+        self.registro = RegistroImagens()
+        self.checkpoint = None
+
+        self.eventos = []
+        self.eventos_atuais = []
+        self.eventos_antigos = {}
+
+    # ---------------------------------------------------------
+    # Etapa 1: coleta (com checkpoint)
+    # ---------------------------------------------------------
+    def coletar(self, retomar=False):
+        self.checkpoint = coletar_com_checkpoint(self.registro, retomar)
+        self.eventos = list(self.checkpoint.eventos())
+        return self
+
+    # ---------------------------------------------------------
+    # Alternativa à coleta: eventos novos + eventos já publicados
+    # ---------------------------------------------------------
+    def incorporar(self, eventos_novos, registro=None):
+        """
+        Parte dos arquivos publicados (eventos.json, arquivos por ano
+        e images.json) e adiciona eventos_novos no início.
+        As imagens dos eventos novos devem estar em registro
+        (ou já em self.registro).
+        """
+        if registro is not None:
+            self.registro = registro
+
+        links_novos = {chave_url(ev["link_evento"]) for ev in eventos_novos}
+        publicados = [
+            ev
+            for lista in self.arquivador.carregar_publicados().values()
+            for ev in lista
+            if chave_url(ev["link_evento"]) not in links_novos
+        ]
+
+        self.registro.carregar()
+        self.eventos = list(eventos_novos) + publicados
+        return self
+
+    # ---------------------------------------------------------
+    # Etapa 2: separa os eventos por ano (sem gravar)
+    # ---------------------------------------------------------
+    def arquivar(self):
+        self.eventos_atuais, self.eventos_antigos = self.arquivador.separar(self.eventos)
+        return self
+
+    # ---------------------------------------------------------
+    # Eventos agrupados por ano (mesmo formato de carregar_publicados)
+    # ---------------------------------------------------------
+    def eventos_por_ano(self):
+        grupos = {self.arquivador.ano_atual: self.eventos_atuais}
+        grupos.update(self.eventos_antigos)
+        return grupos
+
+    # ---------------------------------------------------------
+    # Etapa 3: grava todas as saídas, uma vez cada
+    # ---------------------------------------------------------
+    def publicar(self):
+        eventos_por_ano = self.eventos_por_ano()
+
+        logging.info("📦 Gravando eventos.json e arquivos por ano...")
+        self.arquivador.salvar(self.eventos_atuais, self.eventos_antigos)
+        self.registro.salvar()
+
+        logging.info("🗄️ Exportando eventos para SQLite...")
+        exportar_sqlite(eventos_por_ano)
+
+        logging.info("🏷️ Gerando facetas de tags...")
+        salvar_facetas(gerar_facetas(eventos_por_ano))
+
+        logging.info("🖥️ Gerando HTML final...")
+        gerar_html([ev for lista in eventos_por_ano.values() for ev in lista])
+
+        # só descarta o checkpoint depois que tudo foi publicado
+        if self.checkpoint is not None:
+            self.checkpoint.concluir()
+
+        return self
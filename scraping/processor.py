@@ -5,23 +5,73 @@ Responsável por:
 - Limpar o HTML do artigo
 - Extrair blocos de texto e imagens
 - Detectar padrões especiais (artigos longos, apenas imagens)
+- Sanitizar o HTML dos blocos (tags/atributos permitidos, URLs absolutas)
 - Montar a lista final de blocos estruturados
 """
 
 from bs4 import Tag
+from scraping.config import URL_BASE
 from scraping.fetch import complete_url
+from scraping.images import extrair_dimensoes
+from scraping.metrics import metricas
+from scraping.models import Bloco
 from scraping.parser import build_block
 import re
 
 
+# tags mantidas no HTML dos blocos; as demais são desembrulhadas
+# (o conteúdo fica, a tag sai)
+TAGS_PERMITIDAS = {
+    "p", "br", "strong", "em", "b", "i", "u", "a", "img", "iframe",
+    "h2", "h3", "h4", "ul", "ol", "li", "blockquote",
+    "table", "thead", "tbody", "tr", "td", "th"
+}
+
+# tags removidas junto com o conteúdo
+TAGS_REMOVIDAS = {
+    "script", "style", "noscript", "form", "input", "button",
+    "select", "textarea", "object", "embed"
+}
+
+ATRIBUTOS_PERMITIDOS = {
+    "a": {"href"},
+    "img": {"src", "alt", "width", "height"},
+    "iframe": {"src", "width", "height", "allowfullscreen"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"}
+}
+
+# atributos com URL (resolvidos para URLs absolutas)
+ATRIBUTOS_URL = {"href", "src"}
+
+# tags de formatação que somem quando ficam vazias
+TAGS_INLINE = {"strong", "em", "b", "i", "u", "a"}
+
+# tags em que um <br> no início ou no fim não tem efeito
+TAGS_QUEBRA = {"p", "li", "td", "th", "h2", "h3", "h4", "blockquote"}
+
+# tags de bloco: os espaços em volta delas não aparecem na página
+_REGEX_ESPACO_BLOCO = re.compile(
+    r"\s*(</?(?:p|ul|ol|li|blockquote|table|thead|tbody|tr|td|th|h2|h3|h4)\b[^>]*>)\s*"
+)
+_REGEX_ESPACO_BR = re.compile(r"\s*(<br/>)\s*")
+
+
 # ---------------------------------------------------------
 # Pré-processa o conteúdo do artigo:
 # - remove elementos inúteis
 # - extrai imagens destacadas
+# - registra as imagens no RegistroImagens (se informado)
 # ---------------------------------------------------------
-def preproc_content(article):
+@metricas.cronometrado("processor.preproc_content")
+def preproc_content(article, registro=None, evento_id=None, base=URL_BASE):
     imgs = []
 
+    # imagens inline (inclusive a destacada) antes de qualquer remoção
+    if registro is not None:
+        for img in article.find_all('img'):
+            registro.registrar_tag(img, evento_id)
+
     # usar list() evita problemas ao remover elementos durante a iteração
     children = list(article.children)
 
@@ -35,7 +85,7 @@ def preproc_content(article):
         if 'artigo-img-wrap' in classes:
             img = child.find('img')
             if img and img.get('src'):
-                imgs.append(complete_url(img['src']))
+                imgs.append(complete_url(img['src'], base))
             child.decompose()
             continue  # necessário para evitar processar elemento removido
 
@@ -52,8 +102,141 @@ def preproc_content(article):
     return imgs
 
 
+# ---------------------------------------------------------
+# Resolve a URL de um atributo (ou None se deve ser descartada)
+# ---------------------------------------------------------
+def _url_absoluta(valor, base):
+    valor = (valor or "").strip()
+
+    if not valor or valor.lower().startswith(("javascript:", "data:", "vbscript:")):
+        return None
+
+    # âncoras dentro da própria página ficam como estão
+    if valor.startswith("#"):
+        return valor
+
+    return complete_url(valor, base)
+
+
+# ---------------------------------------------------------
+# Limpa os atributos de uma tag permitida
+# ---------------------------------------------------------
+def _limpar_atributos(tag, base):
+    permitidos = ATRIBUTOS_PERMITIDOS.get(tag.name, set())
+
+    # largura/altura do style viram atributos (o style é descartado)
+    if tag.name == "img":
+        largura, altura = extrair_dimensoes(tag)
+        tag.attrs.pop("width", None)
+        tag.attrs.pop("height", None)
+        if largura and altura:
+            tag["width"] = str(largura)
+            tag["height"] = str(altura)
+
+    for nome in list(tag.attrs):
+        if nome not in permitidos:
+            del tag[nome]
+            continue
+
+        if nome in ATRIBUTOS_URL:
+            url = _url_absoluta(tag[nome], base)
+            if url is None:
+                del tag[nome]
+            else:
+                tag[nome] = url
+
+
+# ---------------------------------------------------------
+# Sanitiza um elemento (altera a árvore no lugar)
+# ---------------------------------------------------------
+def sanitizar_elemento(elem, base=URL_BASE):
+    """
+    - remove scripts, estilos e formulários
+    - desembrulha tags fora de TAGS_PERMITIDAS (span, div, font...)
+    - mantém só os atributos de ATRIBUTOS_PERMITIDOS, com URLs absolutas
+    - tira o conteúdo de dentro de <img>...</img> malformados
+    - remove <p> e formatação vazios e <br> sobrando
+    """
+    # list(): a árvore muda durante a iteração
+    for tag in list(elem.find_all(True)):
+        if tag.decomposed:
+            continue
+
+        if tag.name in TAGS_REMOVIDAS:
+            tag.decompose()
+            continue
+
+        if tag.name not in TAGS_PERMITIDAS:
+            tag.unwrap()
+            continue
+
+        if tag.name == "img" and tag.contents:
+            for filho in reversed(list(tag.contents)):
+                tag.insert_after(filho.extract())
+
+        _limpar_atributos(tag, base)
+
+        # link sem destino válido vira texto
+        if tag.name == "a" and not tag.get("href"):
+            tag.unwrap()
+
+    # de dentro para fora: um <p> com um <strong> vazio também some
+    for tag in reversed(elem.find_all(["p", *TAGS_INLINE])):
+        if not tag.get_text(strip=True) and not tag.find(["img", "iframe"]):
+            tag.decompose()
+
+    # <br> no início/fim de um bloco ou repetido não aparece na página
+    for br in elem.find_all("br"):
+        if br.parent is not elem and br.parent.name not in TAGS_QUEBRA:
+            continue
+
+        seguinte = _vizinho(br, br.next_siblings)
+        if (
+            _vizinho(br, br.previous_siblings) is None
+            or seguinte is None
+            or getattr(seguinte, "name", None) == "br"
+        ):
+            br.decompose()
+
+
+def _vizinho(tag, irmaos):
+    """
+    Primeiro irmão que não é só espaço em branco.
+    """
+    for irmao in irmaos:
+        if isinstance(irmao, Tag) or str(irmao).strip():
+            return irmao
+    return None
+
+
+# ---------------------------------------------------------
+# Compacta os espaços do HTML serializado
+# ---------------------------------------------------------
+def compactar_html(html):
+    html = re.sub(r"\s+", " ", html)
+    html = _REGEX_ESPACO_BLOCO.sub(r"\1", html)
+    html = _REGEX_ESPACO_BR.sub(r"\1", html)
+    return html.strip()
+
+
+# ---------------------------------------------------------
+# HTML final de um bloco: sanitizado e compactado
+# ---------------------------------------------------------
+def limpar_bloco(bloco, elem, base=URL_BASE):
+    original = bloco.conteudo
+
+    sanitizar_elemento(elem, base)
+    bloco.conteudo = compactar_html(elem.decode_contents())
+
+    metricas.incrementar("html_bytes_originais", len(original.encode("utf-8")))
+    metricas.incrementar("html_bytes_sanitizados", len(bloco.conteudo.encode("utf-8")))
+
+    return bloco
+
+
 # ---------------------------------------------------------
 # Insere imagens entre parágrafos para melhorar leitura
+# (os blocos são reaproveitados, sem cópia)
 # ---------------------------------------------------------
 def interleave_images(blocks, imgs):
     out = []
@@ -61,18 +244,18 @@ def interleave_images(blocks, imgs):
     para_count = 0
 
     for b in blocks:
-        out.append({"type": b["type"], "content": b["content"]})
+        out.append(b)
 
         # insere imagem a cada 2 parágrafos
-        if not b["is_subtitle"]:
+        if not b.subtitulo:
             para_count += 1
             if para_count % 2 == 0 and img_i < len(imgs):
-                out.append({"type": "IMAGE_URL", "content": imgs[img_i]})
+                out.append(Bloco.imagem(imgs[img_i]))
                 img_i += 1
 
     # adiciona imagens restantes
     while img_i < len(imgs):
-        out.append({"type": "IMAGE_URL", "content": imgs[img_i]})
+        out.append(Bloco.imagem(imgs[img_i]))
         img_i += 1
 
     return out
@@ -81,7 +264,7 @@ def interleave_images(blocks, imgs):
 # ---------------------------------------------------------
 # Extrai blocos de texto do artigo (modo rápido)
 # ---------------------------------------------------------
-def _collect_blocks(article, seen):
+def _collect_blocks(article, seen, base=URL_BASE):
     blocks = []
 
     for e in article.find_all(['p', 'div', 'h2', 'h3'], recursive=False):
@@ -90,12 +273,12 @@ def _collect_blocks(article, seen):
             continue
 
         # hash simples para evitar duplicação
-        h = re.sub(r'[\W_]+', '', b["plain"].lower())[:80]
+        h = re.sub(r'[\W_]+', '', b.texto.lower())[:80]
         if h in seen:
             continue
 
         seen.add(h)
-        blocks.append(b)
+        blocks.append(limpar_bloco(b, e, base))
 
     return blocks
 
@@ -103,7 +286,7 @@ def _collect_blocks(article, seen):
 # ---------------------------------------------------------
 # Fallback mais agressivo (caso o HTML seja irregular)
 # ---------------------------------------------------------
-def _fallback_collect_blocks(article, seen):
+def _fallback_collect_blocks(article, seen, base=URL_BASE):
     blocks = []
 
     for e in article.find_all(['p', 'div', 'h2', 'h3']):
@@ -111,12 +294,12 @@ def _fallback_collect_blocks(article, seen):
         if not b:
             continue
 
-        h = re.sub(r'[\W_]+', '', b["plain"].lower())[:80]
+        h = re.sub(r'[\W_]+', '', b.texto.lower())[:80]
         if h in seen:
             continue
 
         seen.add(h)
-        blocks.append(b)
+        blocks.append(limpar_bloco(b, e, base))
 
     return blocks
 
@@ -126,7 +309,7 @@ def _fallback_collect_blocks(article, seen):
 # ---------------------------------------------------------
 def _handle_only_images_case(blocks, imgs):
     if not blocks and imgs:
-        return [{"type": "IMAGE_URL", "content": i} for i in imgs]
+        return [Bloco.imagem(i) for i in imgs]
     return None
 
 
@@ -137,7 +320,7 @@ def _get_length_stats(blocks):
     if not blocks:
         return None, None, None, None
 
-    lengths = [len(b["plain"]) for b in blocks]
+    lengths = [len(b.texto) for b in blocks]
     max_len = max(lengths)
     sorted_l = sorted(lengths, reverse=True)
     second = sorted_l[1] if len(sorted_l) > 1 else 0
@@ -169,13 +352,13 @@ def _is_long_block(max_len, second, avg):
 # ---------------------------------------------------------
 def _build_single_block_result(blocks, max_len, imgs):
     for b in blocks:
-        if len(b["plain"]) == max_len:
-            single = [{"type": b["type"], "content": b["content"]}]
+        if len(b.texto) == max_len:
+            single = [b]
 
             # adiciona imagens se o bloco não contém <img>
-            if '<img' not in (b["content"] or "").lower():
+            if '<img' not in b.conteudo.lower():
                 for i in imgs:
-                    single.append({"type": "IMAGE_URL", "content": i})
+                    single.append(Bloco.imagem(i))
 
             return single
 
@@ -197,15 +380,16 @@ def _detect_single_long_block(blocks, imgs):
 # ---------------------------------------------------------
 # Função principal: classifica e organiza os blocos
 # ---------------------------------------------------------
-def classify_blocks(article, imgs):
+@metricas.cronometrado("processor.classify_blocks")
+def classify_blocks(article, imgs, base=URL_BASE):
     seen = set()
 
     # coleta rápida
-    blocks = _collect_blocks(article, seen)
+    blocks = _collect_blocks(article, seen, base)
 
     # fallback se necessário
     if not blocks:
-        blocks = _fallback_collect_blocks(article, seen)
+        blocks = _fallback_collect_blocks(article, seen, base)
 
     # caso especial: só imagens
     only_images = _handle_only_images_case(blocks, imgs)
@@ -213,9 +397,11 @@ def classify_blocks(article, imgs):
         return only_images
 
     # caso especial: artigo de bloco único
-    long_block = _detect_single_long_block(blocks, imgs)
-    if long_block:
-        return long_block
+    # caso geral: intercala imagens
+    result = _detect_single_long_block(blocks, imgs) or interleave_images(blocks, imgs)
+
+    # o texto puro só serve à classificação; não fica no evento
+    for b in result:
+        b.texto = None
 
-    # caso geral
-    return interleave_images(blocks, imgs)
+    return result
@@ -1,62 +1,78 @@
 """
-Runner principal do scraper da Funcultural.
+Runner principal do scraper.
 
 Responsável por:
-- Carregar páginas da listagem de notícias
+- Carregar páginas da listagem de notícias de cada fonte
 - Extrair blocos de eventos
 - Processar cada evento individualmente
 - Coletar conteúdo detalhado da página interna
 - Normalizar dados e retornar a lista final de eventos
+- Percorrer várias fontes em paralelo, cada uma com seu limite
+- Gravar o progresso em checkpoint e retomar coletas interrompidas
 """
 
 import logging
-from time import sleep
-from urllib.parse import urljoin
+import queue
+import threading
 
-from scraping.config import URL_NOTICIAS
+from scraping.checkpoint import CheckpointJSONL
 from scraping.fetch import get_soup
-from scraping.processor import classify_blocks, preproc_content
+from scraping.metrics import metricas
+from scraping.models import Evento
 from scraping.parser import norm_text
+from scraping.sources import fonte_padrao, obter_fontes
+from scraping.storage import gerar_id_evento
+
+# marca o fim da coleta de uma fonte na fila compartilhada
+_FIM_FONTE = object()
+
+
+class ColetaIncompleta(Exception):
+    """
+    A coleta de uma fonte parou antes do fim da listagem (ex: falha
+    de rede numa página). O checkpoint é mantido para --retomar.
+    """
 
 
 # ---------------------------------------------------------
 # Coleta o conteúdo detalhado da página interna do evento
 # ---------------------------------------------------------
-def scrape_details(url):
+@metricas.cronometrado("runner.detalhes")
+def scrape_details(url, registro=None, evento_id=None, fonte=None):
     """
     Acessa a página interna do evento e extrai:
     - texto detalhado
     - imagens internas
     - blocos de conteúdo normalizados
+
+    Se um RegistroImagens for informado, as imagens do artigo
+    são registradas em nome de evento_id.
     """
+    fonte = fonte or fonte_padrao()
 
     # Log útil para depuração e acompanhamento do fluxo
     logging.debug("🔍 Coletando detalhes do evento: %s", url)
 
     # Baixa o HTML da página interna
-    soup = get_soup(url)
+    soup = get_soup(url, fonte.aguardar_vez)
     if not soup:
         logging.warning("⚠️ Falha ao carregar página interna: %s", url)
+        metricas.descartar("pagina_interna_indisponivel")
         return []
 
-    # A estrutura da Funcultural coloca o conteúdo dentro de <article>
-    article = soup.find('article', class_='noticia-conteudo')
-    if not article:
-        logging.warning("⚠️ Estrutura inesperada: artigo não encontrado em %s", url)
-        return []
-
-    # Pré-processa imagens internas (resolve URLs relativas, remove lixo, etc.)
-    imgs = preproc_content(article)
-
-    # Classifica blocos de texto, imagens e parágrafos
-    # Isso organiza o conteúdo para o app exibir de forma limpa
-    return classify_blocks(article, imgs)
+    # Cada fonte sabe onde fica o conteúdo do artigo
+    # e organiza blocos de texto, imagens e parágrafos
+    blocks = fonte.extrair_detalhes(soup, registro, evento_id)
+    if not blocks:
+        logging.debug("Nenhum bloco extraído de %s", url)
+        metricas.descartar("conteudo_vazio")
+    return blocks
 
 
 # ---------------------------------------------------------
 # Processa um único bloco da listagem (um card de evento)
 # ---------------------------------------------------------
-def process_single_block(bloco):
+def process_single_block(bloco, registro=None, fonte=None):
     """
     Extrai informações básicas do card:
     - título
@@ -65,135 +81,282 @@ def process_single_block(bloco):
     - link para página interna
     - data exibida
     E coleta o conteúdo detalhado da página interna.
+    As imagens do card e do artigo vão para o registro, se informado.
     """
+    fonte = fonte or fonte_padrao()
 
-    # Extrai banner do card (pode ser relativo)
-    img_tag = bloco.find('img')
-    banner_rel = img_tag['src'] if img_tag and img_tag.get('src') else ""
-
-    # Título do evento
-    title_tag = bloco.find('div', class_='titulo-noticia-pesquisa')
-    title = title_tag.get_text(strip=True) if title_tag else "Título não encontrado"
+    card = fonte.extrair_card(bloco)
+    if not card:
+        logging.warning("⚠️ Card ignorado: link inválido.")
+        metricas.descartar("link_invalido")
+        return None
 
-    # Categoria/tag do evento
-    tag_tag = bloco.find('div', class_='tag-noticia')
-    tag_evento = tag_tag.get_text(strip=True) if tag_tag else "Sem tag"
+    return process_card(card, registro, fonte)
 
-    # Link para página interna (normalmente relativo)
-    link_tag = bloco.find('a')
-    link_rel = link_tag['href'] if link_tag and link_tag.get('href') else None
 
-    # Converte link relativo para absoluto
-    link = urljoin(URL_NOTICIAS, link_rel.strip()) if link_rel else None
+# ---------------------------------------------------------
+# Processa um card já extraído (dict de fonte.extrair_card)
+# ---------------------------------------------------------
+def process_card(card, registro=None, fonte=None):
+    """
+    Coleta a página interna do card e monta o evento
+    (None se o artigo não tiver conteúdo).
+    """
+    fonte = fonte or fonte_padrao()
 
-    if not link:
-        logging.warning("⚠️ Card ignorado: link inválido.")
-        return None
+    link = card["link_evento"]
+    evento_id = gerar_id_evento({"titulo": norm_text(card["titulo"]), "link_evento": link})
 
-    # Data exibida no card
-    date_tag = bloco.find('div', class_='datanot')
-    data_exibicao = date_tag.get_text(strip=True) if date_tag else "Sem data"
+    if registro is not None:
+        registro.registrar(card["imagem_url"], evento_id)
 
     # Coleta conteúdo detalhado da página interna
     # Se não houver conteúdo, o evento é ignorado (evita dados incompletos)
-    blocks = scrape_details(link)
+    blocks = scrape_details(link, registro, evento_id, fonte)
     if not blocks:
         logging.warning("⚠️ Conteúdo detalhado vazio. Ignorando evento: %s", link)
+        if registro is not None:
+            registro.descartar_evento(evento_id)
         return None
 
     # Normaliza textos para evitar caracteres estranhos
-    return {
-        "titulo": norm_text(title),
-        "tag_evento": norm_text(tag_evento),
-        "blocos_conteudo": blocks,
-        "imagem_url": banner_rel,
-        "link_evento": link,
-        "fonte": "Funcultural",
-        "data_exibicao": data_exibicao
-    }
+    return Evento(
+        titulo=norm_text(card["titulo"]),
+        tag_evento=norm_text(card["tag_evento"]),
+        blocos_conteudo=blocks,
+        imagem_url=card["imagem_url"],
+        link_evento=link,
+        fonte=fonte.nome,
+        data_exibicao=card["data_exibicao"]
+    )
 
 
 # ---------------------------------------------------------
 # Carrega uma página da listagem
 # ---------------------------------------------------------
-def load_page(pagina):
+@metricas.cronometrado("runner.listagem")
+def load_page(pagina, fonte=None):
     """
     Carrega uma página da listagem de notícias.
     """
-    url = f"{URL_NOTICIAS}?page={pagina}"
+    fonte = fonte or fonte_padrao()
+    url = fonte.url_pagina(pagina)
 
     # Log informativo para acompanhar o progresso
     logging.info("📄 Carregando página %s", url)
 
     # Retorna o BeautifulSoup da página
-    return get_soup(url)
+    return get_soup(url, fonte.aguardar_vez)
 
 
 # ---------------------------------------------------------
 # Extrai os blocos de eventos da página
 # ---------------------------------------------------------
-def extract_results(soup):
+def extract_results(soup, fonte=None):
     """
     Retorna todos os cards de eventos encontrados na página.
     """
-    # Cada card de evento está dentro de <div class="resultado-pesquisa">
-    return soup.find_all('div', class_='resultado-pesquisa')
+    return (fonte or fonte_padrao()).extrair_cards(soup)
 
 
 # ---------------------------------------------------------
 # Verifica se existe próxima página
 # ---------------------------------------------------------
-def get_next_page(soup, pagina):
+def get_next_page(soup, pagina, fonte=None):
     """
     Verifica se existe link para a próxima página.
     """
-    # A paginação usa <ul class="pagination"> com links contendo ?page=X
-    return soup.select_one(f'ul.pagination a[href*="page={pagina + 1}"]')
+    return (fonte or fonte_padrao()).tem_proxima_pagina(soup, pagina)
 
 
 # ---------------------------------------------------------
-# Runner principal — coleta todos os eventos
+# Coleta uma única fonte — produz os eventos conforme são coletados
 # ---------------------------------------------------------
-def scrape_all():
+def scrape_fonte(fonte, registro=None, checkpoint=None, pagina_inicial=1, card_inicial=0):
     """
-    Percorre todas as páginas da listagem e retorna
-    uma lista completa de eventos normalizados.
+    Percorre as páginas da listagem de uma fonte e produz (yield)
+    cada evento normalizado assim que ele é coletado.
+
+    A fonte só é marcada como concluída no checkpoint no fim real da
+    listagem (página sem cards ou sem próxima página); se uma página
+    não carregar, levanta ColetaIncompleta.
     """
 
-    logging.info("🚀 Iniciando coleta de eventos da Funcultural...")
+    logging.info("🚀 Iniciando coleta de eventos da %s...", fonte.nome)
+
+    if pagina_inicial > 1 or card_inicial > 0:
+        logging.info(
+            "⏩ %s: retomando da página %d, card %d.",
+            fonte.nome, pagina_inicial, card_inicial
+        )
 
-    all_events = []
-    pagina = 1
+    total = 0
+    pagina = pagina_inicial
 
     while True:
         # Carrega HTML da página atual
-        soup = load_page(pagina)
+        soup = load_page(pagina, fonte)
         if not soup:
-            logging.warning("⚠️ Falha ao carregar página %d. Encerrando.", pagina)
-            break
+            # não é o fim da listagem: a fonte não é marcada como
+            # concluída e a coleta continua daqui com --retomar
+            raise ColetaIncompleta(f"{fonte.nome}: falha ao carregar a página {pagina}")
+
+        metricas.incrementar("paginas_listagem")
 
         # Extrai todos os cards da página
-        results = extract_results(soup)
+        results = extract_results(soup, fonte)
         if not results:
             logging.info("✅ Nenhum resultado encontrado na página %d. Encerrando.", pagina)
             break
 
         # Processa cada card individualmente
-        for bloco in results:
-            ev = process_single_block(bloco)
+        inicio = card_inicial if pagina == pagina_inicial else 0
+        for card, bloco in enumerate(results):
+            if card < inicio:
+                continue
+
+            ev = process_single_block(bloco, registro, fonte)
+
+            if checkpoint is not None:
+                checkpoint.registrar(fonte.chave, pagina, card, ev)
+
             if ev:
-                all_events.append(ev)
+                total += 1
+                metricas.incrementar("eventos_coletados")
+                yield ev
 
         # Verifica se existe próxima página na paginação
-        if not get_next_page(soup, pagina):
+        if not get_next_page(soup, pagina, fonte):
             logging.info("📌 Última página alcançada (%d).", pagina)
             break
 
         # Avança para a próxima página
+        # (o intervalo entre requisições é controlado pela fonte)
         pagina += 1
 
-        # Pequena pausa para evitar sobrecarregar o servidor
-        sleep(0.1)
+    if checkpoint is not None:
+        checkpoint.concluir_fonte(fonte.chave)
+
+    logging.info("✅ Coleta da %s concluída. Eventos coletados: %d", fonte.nome, total)
+
+
+# ---------------------------------------------------------
+# Runner principal — coleta todas as fontes em paralelo
+# ---------------------------------------------------------
+def scrape_all(registro=None, checkpoint=None, fontes=None, posicoes=None):
+    """
+    Percorre todas as fontes registradas (ou as informadas) e
+    produz (yield) os eventos conforme são coletados.
 
-    logging.info("✅ Coleta concluída. Total de eventos coletados: %d", len(all_events))
-    return all_events
+    - registro: RegistroImagens preenchido com as imagens dos eventos
+    - checkpoint: CheckpointJSONL onde cada card processado é gravado
+    - posicoes: {chave_da_fonte: (pagina, card)} para retomar a coleta
+
+    Com mais de uma fonte, cada uma roda em sua própria thread,
+    com seu próprio limite de requisições. Se alguma fonte falhar,
+    as outras terminam e o primeiro erro é levantado no final.
+    """
+    fontes = fontes or obter_fontes()
+    posicoes = posicoes or {}
+
+    if len(fontes) == 1:
+        fonte = fontes[0]
+        yield from scrape_fonte(fonte, registro, checkpoint, *posicoes.get(fonte.chave, (1, 0)))
+        return
+
+    fila = queue.Queue(maxsize=100)
+    erros = []
+
+    def trabalhar(fonte):
+        try:
+            for ev in scrape_fonte(fonte, registro, checkpoint, *posicoes.get(fonte.chave, (1, 0))):
+                fila.put(ev)
+        except Exception as e:
+            logging.exception("❌ Falha na coleta da fonte %s", fonte.nome)
+            erros.append(e)
+        finally:
+            fila.put(_FIM_FONTE)
+
+    threads = [
+        threading.Thread(target=trabalhar, args=(f,), name=f"fonte-{f.chave}", daemon=True)
+        for f in fontes
+    ]
+    for t in threads:
+        t.start()
+
+    ativas = len(threads)
+    while ativas:
+        item = fila.get()
+        if item is _FIM_FONTE:
+            ativas -= 1
+            continue
+        yield item
+
+    for t in threads:
+        t.join()
+
+    # uma fonte sem "concluida" no checkpoint não pode ser publicada
+    if erros:
+        if isinstance(erros[0], ColetaIncompleta):
+            raise erros[0]
+        raise ColetaIncompleta(f"falha na coleta: {erros[0]}") from erros[0]
+
+
+# ---------------------------------------------------------
+# Executa a coleta completa gravando tudo no checkpoint
+# ---------------------------------------------------------
+def coletar_com_checkpoint(registro=None, retomar=False, checkpoint=None, fontes=None):
+    """
+    Roda scrape_all até o fim, gravando cada card no checkpoint.
+    Com retomar=True, continua de onde a coleta anterior parou
+    (e reconstrói o registro de imagens dos eventos já coletados).
+
+    Retorna o CheckpointJSONL, de onde os eventos podem ser
+    lidos em streaming com checkpoint.eventos().
+
+    Levanta ColetaIncompleta se alguma fonte parar antes do fim;
+    nesse caso nada deve ser publicado e o checkpoint fica no disco.
+    """
+    checkpoint = checkpoint or CheckpointJSONL()
+    fontes = fontes or obter_fontes()
+    posicoes = {}
+
+    if retomar and checkpoint.existe():
+        pendentes = []
+        for fonte in fontes:
+            posicao = checkpoint.proxima_posicao(fonte.chave)
+            if posicao is None:
+                logging.info("✅ %s já concluída no checkpoint.", fonte.nome)
+                continue
+            posicoes[fonte.chave] = posicao
+            pendentes.append(fonte)
+        fontes = pendentes
+
+        if registro is not None:
+            for ev in checkpoint.eventos():
+                registro.registrar_evento(ev, gerar_id_evento(ev))
+        checkpoint.reabrir()
+    else:
+        if retomar:
+            logging.info("ℹ️ Nenhum checkpoint encontrado. Iniciando do zero.")
+        checkpoint.iniciar()
+
+    try:
+        if fontes:
+            for _ in scrape_all(registro, checkpoint, fontes, posicoes):
+                pass
+    except ColetaIncompleta as e:
+        logging.error("❌ Coleta incompleta (%s). Checkpoint mantido: rode de novo com --retomar.", e)
+        raise
+    finally:
+        checkpoint.fechar()
+
+    html_original = metricas.valor("html_bytes_originais")
+    if html_original:
+        html_final = metricas.valor("html_bytes_sanitizados")
+        logging.info(
+            "🧹 HTML dos blocos sanitizado: %d → %d bytes (%d economizados).",
+            html_original, html_final, html_original - html_final
+        )
+
+    return checkpoint
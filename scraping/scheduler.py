@@ -0,0 +1,163 @@
+"""
+Coleta priorizada e com orçamento de tempo (--agendar).
+
+Responsável por:
+- Ordenar o trabalho da coleta por prioridade:
+  1. links novos (ainda não publicados e recentes)
+  2. artigos recentes já publicados (revalidação: podem ter sido editados)
+  3. artigos antigos nunca publicados (preenchimento do histórico)
+- Parar quando o orçamento de tempo acabar e publicar o que foi concluído
+- Guardar a fronteira (o que não deu tempo) para a próxima execução
+"""
+
+import itertools
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+from scraping import codec
+from scraping.config import AGENDADOR_DIAS_RECENTES, AGENDADOR_FRONTEIRA_FILE
+from scraping.date_extractor import resolver_data_evento
+from scraping.lite import Hidratador, carregar_indice, coletar_indice, salvar_indice
+from scraping.urls import chave_url
+
+NOVO = 0
+REVALIDAR = 1
+HISTORICO = 2
+
+NOMES_PRIORIDADE = {NOVO: "novos", REVALIDAR: "revalidação", HISTORICO: "histórico"}
+
+
+class Agendador(Hidratador):
+    """
+    Coleta a listagem, monta a fila priorizada e processa o que
+    couber no orçamento:
+
+        Agendador(orcamento=1200).executar()
+
+    O índice (eventos_index.json) é publicado logo após a listagem;
+    os eventos concluídos são publicados no fim, e os itens que não
+    couberam ficam em fronteira.json, antes de tudo na próxima fila.
+    """
+
+    def __init__(
+        self,
+        orcamento=None,
+        limite=None,
+        dias_recentes=AGENDADOR_DIAS_RECENTES,
+        caminho_fronteira=AGENDADOR_FRONTEIRA_FILE,
+        **kwargs
+    ):
+        super().__init__(orcamento, limite, **kwargs)
+        self.dias_recentes = dias_recentes
+        self.caminho_fronteira = caminho_fronteira
+        self.fronteira = []
+
+    # ---------------------------------------------------------
+    # Índice: listagem nova (dentro do prazo) + fronteira anterior
+    # ---------------------------------------------------------
+    def carregar(self):
+        self.fronteira = self.carregar_fronteira()
+
+        prazo = self.inicio + self.orcamento if self.orcamento is not None else None
+        indice = coletar_indice(list(self.fontes.values()), prazo)
+
+        # listagem interrompida pelo prazo: mantém os registros
+        # antigos que não foram vistos desta vez
+        if prazo is not None and time.monotonic() >= prazo:
+            links = {chave_url(r["link_evento"]) for r in indice}
+            indice += [r for r in carregar_indice() if chave_url(r["link_evento"]) not in links]
+
+        if indice:
+            salvar_indice(indice)
+        else:
+            logging.warning("⚠️ Nenhum card encontrado na listagem.")
+
+        return indice or self.fronteira
+
+    # ---------------------------------------------------------
+    # Fila priorizada
+    # ---------------------------------------------------------
+    def prioridade(self, item, publicado, limite_recente):
+        recente = resolver_data_evento(item.get("data_exibicao")) >= limite_recente
+
+        if not publicado:
+            return NOVO if recente else HISTORICO
+        if recente:
+            return REVALIDAR
+        return None
+
+    def pendentes(self, indice):
+        publicados = {
+            chave_url(ev["link_evento"])
+            for lista in self.arquivador.carregar_publicados().values()
+            for ev in lista
+        }
+        processados = self.checkpoint.links()
+        limite_recente = datetime.now() - timedelta(days=self.dias_recentes)
+
+        fila = []
+        vistos = set()
+
+        # a ordem de chegada (listagem, depois fronteira) desempata
+        for posicao, item in enumerate(itertools.chain(indice, self.fronteira)):
+            link = chave_url(item["link_evento"])
+            if link in vistos or link in processados or item.get("fonte") not in self.fontes:
+                continue
+            vistos.add(link)
+
+            prioridade = self.prioridade(item, link in publicados, limite_recente)
+            if prioridade is not None:
+                fila.append((prioridade, posicao, item))
+
+        fila.sort(key=lambda p: p[:2])
+
+        contagem = {nome: 0 for nome in NOMES_PRIORIDADE.values()}
+        for prioridade, _, _ in fila:
+            contagem[NOMES_PRIORIDADE[prioridade]] += 1
+        logging.info(
+            "🗓️ Fila: %s.",
+            ", ".join(f"{n} {nome}" for nome, n in contagem.items())
+        )
+
+        return [item for _, _, item in fila]
+
+    # ---------------------------------------------------------
+    # Fronteira: itens que ficaram para a próxima execução
+    # ---------------------------------------------------------
+    def carregar_fronteira(self):
+        if not os.path.exists(self.caminho_fronteira):
+            return []
+
+        try:
+            dados = codec.carregar(self.caminho_fronteira)
+        except ValueError:
+            logging.warning("⚠️ Fronteira inválida ignorada: %s", self.caminho_fronteira)
+            return []
+
+        fronteira = [r for r in dados if isinstance(r, dict) and r.get("link_evento")]
+        logging.info("🗓️ %d itens herdados da execução anterior.", len(fronteira))
+        return fronteira
+
+    def salvar_fronteira(self, itens):
+        if not itens:
+            if os.path.exists(self.caminho_fronteira):
+                os.remove(self.caminho_fronteira)
+            return
+
+        os.makedirs(os.path.dirname(self.caminho_fronteira) or ".", exist_ok=True)
+        codec.gravar(itens, self.caminho_fronteira)
+        logging.info("🗓️ %d itens guardados para a próxima execução em %s", len(itens), self.caminho_fronteira)
+
+    # ---------------------------------------------------------
+    # Executa a passada e guarda a fronteira
+    # ---------------------------------------------------------
+    def executar(self):
+        publicados = super().executar()
+
+        # sem índice nem fronteira não houve passada: a fronteira fica como está
+        if self.restantes is not None:
+            self.salvar_fronteira(self.restantes)
+
+        return publicados
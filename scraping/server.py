@@ -0,0 +1,423 @@
+"""
+Servidor HTTP local da API de eventos (somente biblioteca padrão).
+
+Responsável por:
+- Carregar os arquivos publicados em índices na memória
+  (por id, tag canônica, mês e palavras do texto)
+- Servir endpoints JSON paginados e filtrados
+- Responder com ETag forte, tratar If-None-Match (304) e comprimir com gzip
+- Recarregar os índices quando o pipeline regrava os arquivos
+
+Os índices, a versão e o cache de respostas ficam juntos numa tupla
+imutável (DadosIndice): cada requisição lê uma única referência, e o
+corpo e o ETag sempre vêm da mesma carga.
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from scraping.archiver import ArquivadorEventos
+from scraping.config import API_IMAGES_FILE, SERVIDOR_HOST, SERVIDOR_PORTA
+from scraping.html_generator import extrair_mes_ano
+from scraping.models import para_json
+from scraping.parser import clean_text_simple
+from scraping.storage import gerar_id_evento
+from scraping.tags import canonicalizar_tag
+
+
+# respostas menores que isso não compensam o gzip
+GZIP_MINIMO = 1024
+
+# intervalo mínimo (segundos) entre verificações dos arquivos no disco
+INTERVALO_RECARGA = 1.0
+
+# limite de respostas guardadas em memória (o cache é zerado ao atingir)
+RESPOSTAS_MAXIMO = 512
+
+POR_PAGINA_PADRAO = 20
+POR_PAGINA_MAXIMO = 100
+
+# campos devolvidos nas listagens (o evento completo fica em /api/eventos/<id>)
+CAMPOS_RESUMO = ("titulo", "tag_evento", "imagem_url", "link_evento", "fonte", "data_exibicao")
+
+
+# ---------------------------------------------------------
+# Quebra um texto em palavras sem acento e minúsculas
+# ---------------------------------------------------------
+def tokenizar(texto):
+    texto = unicodedata.normalize("NFKD", texto or "")
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return re.findall(r"\w{2,}", texto.lower())
+
+
+class DadosIndice(namedtuple(
+    "DadosIndice",
+    "versao eventos por_id por_tag por_mes por_palavra rotulos respostas"
+)):
+    """
+    Uma carga dos índices. respostas guarda as respostas já
+    serializadas desta carga: caminho -> (status, corpo, corpo_gzip, etag).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def vazio(cls):
+        return cls("", [], {}, {}, {}, {}, {}, {})
+
+    # ---------------------------------------------------------
+    # Consulta com filtros combinados (E lógico)
+    # ---------------------------------------------------------
+    def buscar(self, tag=None, mes=None, ano=None, q=None):
+        """
+        Retorna os resumos dos eventos que atendem a todos os filtros,
+        na ordem de publicação (mais recentes primeiro).
+        """
+        conjuntos = []
+
+        if tag:
+            conjuntos.append(self.por_tag.get(canonicalizar_tag(tag), frozenset()))
+        if mes:
+            conjuntos.append(self.por_mes.get(mes, frozenset()))
+        if ano:
+            conjuntos.append(frozenset().union(
+                *(v for k, v in self.por_mes.items() if k.startswith(f"{ano}-"))
+            ))
+        for palavra in tokenizar(q):
+            conjuntos.append(self.por_palavra.get(palavra, frozenset()))
+
+        if not conjuntos:
+            return self.eventos
+
+        posicoes = frozenset.intersection(*conjuntos)
+        return [self.eventos[p] for p in sorted(posicoes)]
+
+
+class IndiceEventos:
+    """
+    Eventos publicados (eventos.json + arquivos por ano) indexados
+    na memória. Cada recarga monta um DadosIndice novo e troca a
+    referência de uma vez, sem bloquear as requisições em andamento.
+    """
+
+    def __init__(self, arquivador=None):
+        self.arquivador = arquivador or ArquivadorEventos()
+        self.dados = DadosIndice.vazio()
+
+        self._assinatura = None
+        self._ultima_verificacao = 0.0
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Arquivos de onde os índices são montados
+    # ---------------------------------------------------------
+    def arquivos(self):
+        padrao = os.path.join(self.arquivador.pasta_arquivo, "eventos_de_*.json")
+        return [self.arquivador.caminho_principal, API_IMAGES_FILE] + sorted(glob.glob(padrao))
+
+    def assinatura(self):
+        partes = []
+        for caminho in self.arquivos():
+            try:
+                st = os.stat(caminho)
+            except OSError:
+                continue
+            partes.append((caminho, st.st_mtime_ns, st.st_size))
+        return tuple(partes)
+
+    # ---------------------------------------------------------
+    # Recarrega se algum arquivo mudou (verificação barata, via stat)
+    # ---------------------------------------------------------
+    def recarregar_se_mudou(self):
+        agora = time.monotonic()
+        if agora - self._ultima_verificacao < INTERVALO_RECARGA:
+            return False
+
+        with self._lock:
+            self._ultima_verificacao = agora
+            assinatura = self.assinatura()
+            if assinatura == self._assinatura:
+                return False
+
+            try:
+                self.carregar()
+            except (OSError, ValueError) as e:
+                # arquivo sendo regravado: mantém o índice anterior
+                logging.warning("⚠️ Recarga adiada, arquivos incompletos: %s", e)
+                return False
+
+            self._assinatura = assinatura
+            return True
+
+    # ---------------------------------------------------------
+    # Monta os índices
+    # ---------------------------------------------------------
+    def carregar(self):
+        inicio = time.perf_counter()
+
+        eventos = []
+        por_id = {}
+        por_tag = {}
+        por_mes = {}
+        por_palavra = {}
+        rotulos = {}
+
+        for ano, lista in sorted(self.arquivador.carregar_publicados().items(), reverse=True):
+            for ev in lista:
+                ev_id = gerar_id_evento(ev)
+                if ev_id in por_id:
+                    continue
+
+                ano_ev, mes_ev = extrair_mes_ano(ev.get("data_exibicao", ""), ev.get("blocos_conteudo"))
+                mes = f"{ano_ev:04d}-{mes_ev:02d}"
+                tag_original = (ev.get("tag_evento") or "").strip()
+                tag = canonicalizar_tag(tag_original)
+
+                resumo = {"id": ev_id, "ano": ano, "mes": mes, "tag": tag}
+                resumo.update((campo, ev.get(campo)) for campo in CAMPOS_RESUMO)
+
+                posicao = len(eventos)
+                eventos.append(resumo)
+                por_id[ev_id] = (resumo, ev)
+                por_mes.setdefault(mes, []).append(posicao)
+
+                if tag:
+                    por_tag.setdefault(tag, []).append(posicao)
+                    rotulos.setdefault(tag, tag_original)
+
+                texto = " ".join(
+                    [ev.get("titulo", ""), tag_original]
+                    + [
+                        clean_text_simple(b.get("content", ""))
+                        for b in ev.get("blocos_conteudo") or []
+                        if isinstance(b, Mapping) and b.get("type") != "IMAGE_URL"
+                    ]
+                )
+                for palavra in set(tokenizar(texto)):
+                    por_palavra.setdefault(palavra, []).append(posicao)
+
+        # listas de posições viram conjuntos para interseção rápida
+        por_mes = {k: frozenset(v) for k, v in por_mes.items()}
+        por_tag = {k: frozenset(v) for k, v in por_tag.items()}
+        por_palavra = {k: frozenset(v) for k, v in por_palavra.items()}
+
+        # versão dos dados (exposta em /api/saude e usada no cache de respostas)
+        versao = hashlib.sha1("|".join(sorted(por_id)).encode("utf-8"))
+        versao.update(str(self.assinatura()).encode("utf-8"))
+
+        # uma única atribuição: quem já leu self.dados segue com a carga anterior
+        self.dados = DadosIndice(
+            versao.hexdigest()[:16], eventos, por_id, por_tag,
+            por_mes, por_palavra, rotulos, {}
+        )
+
+        logging.info(
+            "🔎 Índices carregados: %d eventos, %d tags, %d meses, %d palavras (%.2fs).",
+            len(eventos), len(por_tag), len(por_mes), len(por_palavra),
+            time.perf_counter() - inicio
+        )
+
+    def buscar(self, tag=None, mes=None, ano=None, q=None):
+        return self.dados.buscar(tag=tag, mes=mes, ano=ano, q=q)
+
+
+# ---------------------------------------------------------
+# Handler HTTP
+# ---------------------------------------------------------
+class ManipuladorAPI(BaseHTTPRequestHandler):
+    """
+    Endpoints:
+    - /api/eventos?tag=&mes=AAAA-MM&ano=&q=&pagina=&por_pagina=
+    - /api/eventos/<id>
+    - /api/tags
+    - /api/meses
+    - /api/saude
+    """
+
+    server_version = "FunculturalAPI/1.0"
+    indice = None
+
+    def do_GET(self):
+        self.indice.recarregar_se_mudou()
+
+        # a mesma carga do começo ao fim da requisição
+        dados = self.indice.dados
+
+        resposta = dados.respostas.get(self.path)
+        if resposta is None:
+            resposta = self.montar_resposta(dados)
+            if len(dados.respostas) >= RESPOSTAS_MAXIMO:
+                dados.respostas.clear()
+            dados.respostas[self.path] = resposta
+
+        self.responder(*resposta)
+
+    def montar_resposta(self, dados):
+        """
+        Roteia a requisição e retorna (status, corpo JSON em bytes,
+        corpo comprimido ou None, etag).
+        """
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        caminho = url.path.rstrip("/")
+
+        try:
+            if caminho == "/api/eventos":
+                status, resultado = 200, self.listar_eventos(dados, params)
+            elif caminho.startswith("/api/eventos/"):
+                status, resultado = self.obter_evento(dados, unquote(caminho.rsplit("/", 1)[1]))
+            elif caminho == "/api/tags":
+                status, resultado = 200, self.listar_tags(dados)
+            elif caminho == "/api/meses":
+                status, resultado = 200, self.listar_meses(dados)
+            elif caminho == "/api/saude":
+                status, resultado = 200, {"eventos": len(dados.eventos), "versao": dados.versao}
+            else:
+                status, resultado = 404, {"erro": "endpoint não encontrado"}
+        except ValueError as e:
+            status, resultado = 400, {"erro": str(e)}
+
+        corpo = json.dumps(resultado, ensure_ascii=False, separators=(",", ":"), default=para_json).encode("utf-8")
+
+        # comprimido uma vez só, junto com o corpo
+        corpo_gzip = None
+        if len(corpo) >= GZIP_MINIMO:
+            corpo_gzip = gzip.compress(corpo, compresslevel=6, mtime=0)
+
+        return status, corpo, corpo_gzip, hashlib.sha1(corpo).hexdigest()[:20]
+
+    # ---------------------------------------------------------
+    # Endpoints
+    # ---------------------------------------------------------
+    def listar_eventos(self, dados, params):
+        pagina = _inteiro(params.get("pagina"), 1, "pagina")
+        por_pagina = min(_inteiro(params.get("por_pagina"), POR_PAGINA_PADRAO, "por_pagina"), POR_PAGINA_MAXIMO)
+
+        mes = params.get("mes")
+        if mes and not re.fullmatch(r"\d{4}-\d{2}", mes):
+            raise ValueError("mes deve estar no formato AAAA-MM")
+
+        resultados = dados.buscar(
+            tag=params.get("tag"),
+            mes=mes,
+            ano=params.get("ano"),
+            q=params.get("q")
+        )
+
+        inicio = (pagina - 1) * por_pagina
+        return {
+            "total": len(resultados),
+            "pagina": pagina,
+            "por_pagina": por_pagina,
+            "paginas": max(1, -(-len(resultados) // por_pagina)),
+            "eventos": resultados[inicio:inicio + por_pagina]
+        }
+
+    def obter_evento(self, dados, ev_id):
+        encontrado = dados.por_id.get(ev_id)
+        if not encontrado:
+            return 404, {"erro": "evento não encontrado"}
+
+        resumo, ev = encontrado
+        return 200, {**ev, "id": ev_id, "ano": resumo["ano"], "mes": resumo["mes"]}
+
+    def listar_tags(self, dados):
+        tags = sorted(dados.por_tag.items(), key=lambda item: (-len(item[1]), item[0]))
+        return {
+            "quantidade_tags": len(tags),
+            "tags": [
+                {"tag": tag, "rotulo": dados.rotulos.get(tag, tag), "eventos": len(posicoes)}
+                for tag, posicoes in tags
+            ]
+        }
+
+    def listar_meses(self, dados):
+        return {
+            "meses": [
+                {"mes": mes, "eventos": len(posicoes)}
+                for mes, posicoes in sorted(dados.por_mes.items(), reverse=True)
+            ]
+        }
+
+    # ---------------------------------------------------------
+    # Resposta com ETag, 304 e gzip
+    # ---------------------------------------------------------
+    def responder(self, status, corpo, corpo_gzip, etag):
+        usar_gzip = (
+            corpo_gzip is not None
+            and "gzip" in (self.headers.get("Accept-Encoding") or "")
+        )
+
+        # representações diferentes precisam de ETags fortes diferentes
+        etag = f'"{etag}-gz"' if usar_gzip else f'"{etag}"'
+
+        if status == 200 and _etags(self.headers.get("If-None-Match")) & {etag, "*"}:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        if usar_gzip:
+            corpo = corpo_gzip
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if status == 200:
+            self.send_header("ETag", etag)
+        if usar_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        logging.debug("🌐 %s - %s", self.address_string(), formato % args)
+
+
+def _inteiro(valor, padrao, nome):
+    if valor in (None, ""):
+        return padrao
+    if not valor.isdigit() or int(valor) < 1:
+        raise ValueError(f"{nome} deve ser um inteiro positivo")
+    return int(valor)
+
+
+def _etags(cabecalho):
+    if not cabecalho:
+        return set()
+    if cabecalho.strip() == "*":
+        return {"*"}
+    return {e.strip().removeprefix("W/") for e in cabecalho.split(",")}
+
+
+# ---------------------------------------------------------
+# Sobe o servidor (bloqueia até Ctrl+C)
+# ---------------------------------------------------------
+def servir(host=SERVIDOR_HOST, porta=SERVIDOR_PORTA, indice=None):
+    indice = indice or IndiceEventos()
+    indice.recarregar_se_mudou()
+
+    manipulador = type("Manipulador", (ManipuladorAPI,), {"indice": indice})
+    servidor = ThreadingHTTPServer((host, porta), manipulador)
+
+    logging.info("🌐 API disponível em http://%s:%d/api/eventos", host, porta)
+    try:
+        servidor.serve_forever()
+    finally:
+        servidor.server_close()
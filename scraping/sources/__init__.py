@@ -0,0 +1,46 @@
+"""
+Fontes (portais) suportadas pelo scraper.
+
+Responsável por:
+- Manter o registro das fontes disponíveis
+- Entregar as fontes que o runner deve percorrer
+"""
+
+from scraping.sources.base import FonteBase
+from scraping.sources.funcultural import FonteFuncultural
+
+FONTES = {}
+
+
+# ---------------------------------------------------------
+# Registra uma fonte (a ordem de registro é a ordem de saída)
+# ---------------------------------------------------------
+def registrar_fonte(fonte):
+    FONTES[fonte.chave] = fonte
+    return fonte
+
+
+# ---------------------------------------------------------
+# Retorna as fontes pedidas (ou todas)
+# ---------------------------------------------------------
+def obter_fontes(chaves=None):
+    if not chaves:
+        return list(FONTES.values())
+
+    desconhecidas = [c for c in chaves if c not in FONTES]
+    if desconhecidas:
+        raise ValueError(f"Fonte(s) desconhecida(s): {', '.join(desconhecidas)}")
+
+    return [FONTES[c] for c in chaves]
+
+
+# ---------------------------------------------------------
+# Fonte usada quando nenhuma é informada
+# ---------------------------------------------------------
+def fonte_padrao():
+    return FONTES[FonteFuncultural.chave]
+
+
+registrar_fonte(FonteFuncultural())
+
+__all__ = ["FonteBase", "FonteFuncultural", "FONTES", "registrar_fonte", "obter_fontes", "fonte_padrao"]
@@ -0,0 +1,94 @@
+"""
+Interface comum das fontes (portais) raspadas.
+
+Responsável por:
+- Definir o que cada portal precisa informar ao runner
+  (URL base, padrão da listagem, intervalo entre requisições)
+- Definir os extratores de card, de artigo e de paginação
+- Controlar o limite de requisições de cada fonte, de forma independente
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from scraping.urls import canonicalizar_url, resolver_url
+
+
+class FonteBase(ABC):
+    """
+    Adaptador de um portal. Subclasses preenchem os atributos
+    e implementam os métodos de extração (um adaptador incompleto
+    falha ao ser instanciado, não no meio da coleta).
+    """
+
+    # identificador curto (usado no checkpoint e na CLI)
+    chave = ""
+
+    # valor gravado no campo "fonte" dos eventos
+    nome = ""
+
+    # URL base para resolver links relativos
+    url_base = ""
+
+    # URL da listagem, com {pagina} no lugar do número da página
+    url_listagem = ""
+
+    # intervalo mínimo (segundos) entre requisições de rede desta fonte
+    intervalo = 0.1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ultima_requisicao = 0.0
+
+    # ---------------------------------------------------------
+    # URLs
+    # ---------------------------------------------------------
+    def url_pagina(self, pagina):
+        return self.url_listagem.format(pagina=pagina)
+
+    def complete_url(self, relative_url):
+        return resolver_url(relative_url, self.url_base)
+
+    def canonicalizar_url(self, url):
+        return canonicalizar_url(url, self.url_base)
+
+    # ---------------------------------------------------------
+    # Limite de requisições (chamado apenas antes de ir à rede)
+    # ---------------------------------------------------------
+    def aguardar_vez(self):
+        with self._lock:
+            espera = self._ultima_requisicao + self.intervalo - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            self._ultima_requisicao = time.monotonic()
+
+    # ---------------------------------------------------------
+    # Extratores (implementados por cada fonte)
+    # ---------------------------------------------------------
+    @abstractmethod
+    def extrair_cards(self, soup):
+        """
+        Retorna os elementos de card de uma página da listagem.
+        """
+
+    @abstractmethod
+    def extrair_card(self, bloco):
+        """
+        Retorna um dict com titulo, tag_evento, imagem_url,
+        link_evento (absoluto) e data_exibicao, ou None se o
+        card for inválido.
+        """
+
+    @abstractmethod
+    def extrair_detalhes(self, soup, registro=None, evento_id=None):
+        """
+        Retorna a lista de blocos de conteúdo da página interna
+        (vazia se a estrutura esperada não for encontrada).
+        """
+
+    @abstractmethod
+    def tem_proxima_pagina(self, soup, pagina):
+        """
+        True se a listagem tiver uma página depois de `pagina`.
+        """
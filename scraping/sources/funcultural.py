@@ -0,0 +1,84 @@
+"""
+Fonte: Fundação Cultural de Porto Velho (Funcultural).
+
+Responsável por:
+- Informar as URLs da listagem de notícias da Funcultural
+- Extrair os dados dos cards (div.resultado-pesquisa)
+- Extrair o conteúdo do artigo (article.noticia-conteudo)
+"""
+
+import logging
+
+from scraping.config import URL_BASE, URL_NOTICIAS
+from scraping.processor import classify_blocks, preproc_content
+from scraping.sources.base import FonteBase
+
+
+class FonteFuncultural(FonteBase):
+    chave = "funcultural"
+    nome = "Funcultural"
+    url_base = URL_BASE
+    url_listagem = URL_NOTICIAS + "?page={pagina}"
+    intervalo = 0.1
+
+    # ---------------------------------------------------------
+    # Cada card de evento está dentro de <div class="resultado-pesquisa">
+    # ---------------------------------------------------------
+    def extrair_cards(self, soup):
+        return soup.find_all('div', class_='resultado-pesquisa')
+
+    # ---------------------------------------------------------
+    # Dados básicos do card
+    # ---------------------------------------------------------
+    def extrair_card(self, bloco):
+        # Extrai banner do card (pode ser relativo)
+        img_tag = bloco.find('img')
+        banner_rel = img_tag['src'] if img_tag and img_tag.get('src') else ""
+
+        # Título do evento
+        title_tag = bloco.find('div', class_='titulo-noticia-pesquisa')
+        title = title_tag.get_text(strip=True) if title_tag else "Título não encontrado"
+
+        # Categoria/tag do evento
+        tag_tag = bloco.find('div', class_='tag-noticia')
+        tag_evento = tag_tag.get_text(strip=True) if tag_tag else "Sem tag"
+
+        # Link para página interna (normalmente relativo)
+        link_tag = bloco.find('a')
+        link_rel = link_tag['href'] if link_tag and link_tag.get('href') else None
+
+        if not link_rel:
+            return None
+
+        # Data exibida no card
+        date_tag = bloco.find('div', class_='datanot')
+        data_exibicao = date_tag.get_text(strip=True) if date_tag else "Sem data"
+
+        return {
+            "titulo": title,
+            "tag_evento": tag_evento,
+            "imagem_url": banner_rel,
+            "link_evento": self.canonicalizar_url(link_rel),
+            "data_exibicao": data_exibicao
+        }
+
+    # ---------------------------------------------------------
+    # O conteúdo da página interna fica dentro de <article>
+    # ---------------------------------------------------------
+    def extrair_detalhes(self, soup, registro=None, evento_id=None):
+        article = soup.find('article', class_='noticia-conteudo')
+        if not article:
+            logging.warning("⚠️ Estrutura inesperada: artigo não encontrado.")
+            return []
+
+        # Pré-processa imagens internas (resolve URLs relativas, remove lixo, etc.)
+        imgs = preproc_content(article, registro, evento_id, self.url_base)
+
+        # Classifica blocos de texto, imagens e parágrafos
+        return classify_blocks(article, imgs, self.url_base)
+
+    # ---------------------------------------------------------
+    # A paginação usa <ul class="pagination"> com links contendo ?page=X
+    # ---------------------------------------------------------
+    def tem_proxima_pagina(self, soup, pagina):
+        return soup.select_one(f'ul.pagination a[href*="page={pagina + 1}"]') is not None
@@ -0,0 +1,243 @@
+"""
+Exportação dos eventos para SQLite.
+
+Responsável por:
+- Gerar um único arquivo eventos.sqlite para consumo offline
+- Guardar eventos, blocos de conteúdo e tags em tabelas indexadas
+- Manter uma tabela FTS5 para busca textual
+- Atualizar o banco de forma incremental (upsert pelo id do evento)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Mapping
+
+from scraping.config import API_SQLITE_FILE
+from scraping.models import para_json
+from scraping.parser import clean_text_simple
+from scraping.storage import gerar_id_evento
+from scraping.tags import canonicalizar_tag
+
+
+# ---------------------------------------------------------
+# Versão do formato das linhas: incrementar quando mudar,
+# para forçar a regravação de todos os eventos
+# ---------------------------------------------------------
+VERSAO_EXPORTACAO = 2
+
+
+# ---------------------------------------------------------
+# Esquema do banco
+# ---------------------------------------------------------
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS eventos (
+    id TEXT PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    tag_evento TEXT,
+    imagem_url TEXT,
+    link_evento TEXT,
+    fonte TEXT,
+    data_exibicao TEXT,
+    ano INTEGER,
+    hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_eventos_ano ON eventos(ano);
+
+CREATE TABLE IF NOT EXISTS blocos (
+    evento_id TEXT NOT NULL REFERENCES eventos(id) ON DELETE CASCADE,
+    posicao INTEGER NOT NULL,
+    tipo TEXT NOT NULL,
+    conteudo TEXT,
+    PRIMARY KEY (evento_id, posicao)
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    evento_id TEXT NOT NULL REFERENCES eventos(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (evento_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+"""
+
+ESQUEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS eventos_fts USING fts5(
+    id UNINDEXED,
+    titulo,
+    tag_evento,
+    texto,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+# ---------------------------------------------------------
+# Abre o banco e garante o esquema
+# ---------------------------------------------------------
+def abrir_banco(caminho=API_SQLITE_FILE):
+    """
+    Abre (ou cria) o banco SQLite e retorna (conexão, tem_fts).
+    tem_fts é False quando o SQLite local não foi compilado com FTS5.
+    """
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+
+    conn = sqlite3.connect(caminho)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(ESQUEMA)
+
+    try:
+        conn.executescript(ESQUEMA_FTS)
+        tem_fts = True
+    except sqlite3.OperationalError as e:
+        logging.warning("⚠️ FTS5 indisponível, busca textual desativada: %s", e)
+        tem_fts = False
+
+    return conn, tem_fts
+
+
+# ---------------------------------------------------------
+# Hash do conteúdo do evento (decide se precisa regravar)
+# ---------------------------------------------------------
+def _hash_evento(ev, ano):
+    dados = json.dumps([VERSAO_EXPORTACAO, ano, ev], ensure_ascii=False, sort_keys=True, default=para_json)
+    return hashlib.sha1(dados.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------
+# Texto puro dos blocos, usado na busca textual
+# ---------------------------------------------------------
+def _texto_blocos(blocos):
+    textos = []
+
+    for bloco in blocos or []:
+        if not isinstance(bloco, Mapping) or bloco.get("type") == "IMAGE_URL":
+            continue
+        textos.append(clean_text_simple(bloco.get("content", "")))
+
+    return " ".join(t for t in textos if t)
+
+
+# ---------------------------------------------------------
+# Insere ou atualiza um único evento
+# ---------------------------------------------------------
+def _gravar_evento(conn, tem_fts, ev_id, ev, ano, hash_ev):
+    conn.execute(
+        """
+        INSERT INTO eventos (id, titulo, tag_evento, imagem_url, link_evento,
+                             fonte, data_exibicao, ano, hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            titulo = excluded.titulo,
+            tag_evento = excluded.tag_evento,
+            imagem_url = excluded.imagem_url,
+            link_evento = excluded.link_evento,
+            fonte = excluded.fonte,
+            data_exibicao = excluded.data_exibicao,
+            ano = excluded.ano,
+            hash = excluded.hash
+        """,
+        (
+            ev_id,
+            ev.get("titulo", ""),
+            ev.get("tag_evento"),
+            ev.get("imagem_url"),
+            ev.get("link_evento"),
+            ev.get("fonte"),
+            ev.get("data_exibicao"),
+            ano,
+            hash_ev,
+        )
+    )
+
+    # blocos e tags são reescritos por completo
+    conn.execute("DELETE FROM blocos WHERE evento_id = ?", (ev_id,))
+    conn.executemany(
+        "INSERT INTO blocos (evento_id, posicao, tipo, conteudo) VALUES (?, ?, ?, ?)",
+        [
+            (ev_id, i, b.get("type"), b.get("content"))
+            for i, b in enumerate(ev.get("blocos_conteudo") or [])
+            if isinstance(b, Mapping)
+        ]
+    )
+
+    # a tabela de tags guarda a forma canônica (mesma de tags.json)
+    conn.execute("DELETE FROM tags WHERE evento_id = ?", (ev_id,))
+    tag = (ev.get("tag_evento") or "").strip()
+    tag_canonica = canonicalizar_tag(tag)
+    if tag_canonica:
+        conn.execute(
+            "INSERT INTO tags (evento_id, tag) VALUES (?, ?)",
+            (ev_id, tag_canonica)
+        )
+
+    if tem_fts:
+        conn.execute("DELETE FROM eventos_fts WHERE id = ?", (ev_id,))
+        conn.execute(
+            "INSERT INTO eventos_fts (id, titulo, tag_evento, texto) VALUES (?, ?, ?, ?)",
+            (ev_id, ev.get("titulo", ""), tag, _texto_blocos(ev.get("blocos_conteudo")))
+        )
+
+
+# ---------------------------------------------------------
+# Remove eventos que não existem mais nos arquivos JSON
+# ---------------------------------------------------------
+def _remover_ausentes(conn, tem_fts, ids_atuais):
+    existentes = {row[0] for row in conn.execute("SELECT id FROM eventos")}
+    ausentes = [(i,) for i in existentes - ids_atuais]
+
+    if ausentes:
+        conn.executemany("DELETE FROM eventos WHERE id = ?", ausentes)
+        if tem_fts:
+            conn.executemany("DELETE FROM eventos_fts WHERE id = ?", ausentes)
+
+    return len(ausentes)
+
+
+# ---------------------------------------------------------
+# Função principal: exporta os eventos para SQLite
+# ---------------------------------------------------------
+def exportar_sqlite(eventos_por_ano, caminho=API_SQLITE_FILE):
+    """
+    Recebe um dict {ano: [eventos]} (o mesmo conteúdo de eventos.json
+    e dos arquivos por ano) e sincroniza o banco SQLite.
+    Apenas eventos novos ou alterados são regravados.
+    Retorna (gravados, inalterados, removidos).
+    """
+    conn, tem_fts = abrir_banco(caminho)
+
+    ids_atuais = set()
+    gravados = 0
+    removidos = 0
+
+    try:
+        hashes = dict(conn.execute("SELECT id, hash FROM eventos"))
+
+        with conn:
+            for ano, eventos in eventos_por_ano.items():
+                for ev in eventos:
+                    ev_id = gerar_id_evento(ev)
+                    if ev_id in ids_atuais:
+                        continue
+                    ids_atuais.add(ev_id)
+
+                    hash_ev = _hash_evento(ev, ano)
+                    if hashes.get(ev_id) == hash_ev:
+                        continue
+
+                    _gravar_evento(conn, tem_fts, ev_id, ev, ano, hash_ev)
+                    gravados += 1
+
+            removidos = _remover_ausentes(conn, tem_fts, ids_atuais)
+
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+    inalterados = len(ids_atuais) - gravados
+    logging.info(
+        "🗄️ SQLite atualizado em %s: %d gravados, %d removidos, %d inalterados.",
+        caminho, gravados, removidos, inalterados
+    )
+    return gravados, inalterados, removidos
@@ -4,11 +4,117 @@ Módulo de armazenamento do scraper.
 Responsável por:
 - Salvar os eventos coletados em arquivos JSON
 - Gerar um índice resumido
+- Gerar o id estável de cada evento
+- Escrever listas JSON em streaming
+- Gravar um arquivo por evento (eventos/<id>.json)
 """
 
-import json
+import hashlib
 import os
-from scraping.config import API_DIR, API_LIST_FILE, API_INDEX_FILE
+import logging
+import re
+from scraping.config import API_DIR, API_EVENTOS_DIR, API_LIST_FILE, API_INDEX_FILE
+from scraping import codec
+from scraping.urls import chave_url
+
+# nome dos arquivos por evento: <sha1>.json
+_REGEX_ARQUIVO_EVENTO = re.compile(r"^([0-9a-f]{40})\.json$")
+
+
+# ---------------------------------------------------------
+# Gera o id estável do evento (mesmo usado em eventos_index.json)
+# ---------------------------------------------------------
+def gerar_id_evento(ev):
+    """
+    sha1 da chave canônica do link (o artigo, não o slug nem o
+    título): variações do mesmo link geram o mesmo id.
+    """
+    link = ev.get("link_evento")
+    chave = chave_url(link) if link else ev.get("titulo", "")
+    return hashlib.sha1(chave.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------
+# Escreve uma lista JSON item a item
+# ---------------------------------------------------------
+def salvar_lista_json(itens, caminho):
+    """
+    Grava um iterável como lista JSON sem montar a lista em memória.
+    A saída é idêntica à de json.dump(..., ensure_ascii=False, indent=2)
+    (serializada pelo codec: orjson, se instalado).
+    Retorna a quantidade de itens gravados.
+    """
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+
+    quantidade = 0
+    temporario = caminho + ".tmp"
+
+    with open(temporario, "w", encoding="utf-8") as f:
+        for item in itens:
+            f.write(",\n  " if quantidade else "[\n  ")
+            texto = codec.dumps(item)
+            f.write(texto.replace("\n", "\n  "))
+            quantidade += 1
+
+        f.write("\n]" if quantidade else "[]")
+
+    os.replace(temporario, caminho)
+    return quantidade
+
+
+# ---------------------------------------------------------
+# Um arquivo por evento, regravado só quando muda
+# ---------------------------------------------------------
+def salvar_eventos_individuais(eventos, pasta=API_EVENTOS_DIR):
+    """
+    Grava cada evento em pasta/<id>.json (mesmo id de
+    eventos_index.json), com as chaves ordenadas. Arquivos com
+    o mesmo conteúdo não são regravados: o commit diário e o
+    deploy do Pages só levam os eventos que mudaram.
+
+    eventos deve ser o conjunto publicado inteiro: arquivos <id>.json
+    de eventos que não estão nele são apagados (os demais arquivos
+    da pasta não são tocados). Retorna (gravados, inalterados, removidos).
+    """
+    os.makedirs(pasta, exist_ok=True)
+
+    gravados = 0
+    inalterados = 0
+    ids = set()
+
+    for ev in eventos:
+        ev_id = gerar_id_evento(ev)
+        ids.add(ev_id)
+
+        caminho = os.path.join(pasta, f"{ev_id}.json")
+        dados = codec.dumps_bytes(ev, ordenar=True)
+
+        try:
+            with open(caminho, "rb") as f:
+                if f.read() == dados:
+                    inalterados += 1
+                    continue
+        except FileNotFoundError:
+            pass
+
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as f:
+            f.write(dados)
+        os.replace(temporario, caminho)
+        gravados += 1
+
+    removidos = 0
+    for nome in os.listdir(pasta):
+        match = _REGEX_ARQUIVO_EVENTO.match(nome)
+        if match and match.group(1) not in ids:
+            os.remove(os.path.join(pasta, nome))
+            removidos += 1
+
+    logging.info(
+        "🧾 Arquivos por evento em %s: %d gravados, %d inalterados, %d removidos.",
+        pasta, gravados, inalterados, removidos
+    )
+    return gravados, inalterados, removidos
 
 
 # ---------------------------------------------------------
@@ -18,8 +124,7 @@ def save_only(eventos):
     os.makedirs(API_DIR, exist_ok=True)
 
     # salva lista completa
-    with open(API_LIST_FILE, "w", encoding="utf-8") as f:
-        json.dump(eventos, f, ensure_ascii=False, indent=2)
+    codec.gravar(eventos, API_LIST_FILE)
 
     # índice resumido
     index = {
@@ -27,5 +132,4 @@ def save_only(eventos):
         "links": [e["link_evento"] for e in eventos]  # substitui ids
     }
 
-    with open(API_INDEX_FILE, "w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+    codec.gravar(index, API_INDEX_FILE)
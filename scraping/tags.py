@@ -4,10 +4,50 @@ Normalização e contagem de tags dos eventos.
 Responsável por:
 - Padronizar tags vindas do site (remover duplicações, símbolos, conectivos)
 - Contar a frequência de cada tag normalizada
+- Canonicalizar tags (acentos, sinônimos) com memoização
+- Gerar facetas: índice tag → ids de eventos e contagens por ano
 """
 
+import json
+import logging
+import os
 import re
+import unicodedata
 from collections import Counter
+from functools import lru_cache
+
+from scraping.config import API_TAGS_FILE
+from scraping.storage import gerar_id_evento
+
+
+# ---------------------------------------------------------
+# Tags que não identificam assunto algum
+# ---------------------------------------------------------
+TAGS_IGNORADAS = {"", "sem tag"}
+
+# ---------------------------------------------------------
+# Sinônimos (já sem acento, minúsculos e sem ano no final)
+# ---------------------------------------------------------
+SINONIMOS = {
+    "festa julina": "festa junina",
+    "paulo gustavo": "lei paulo gustavo",
+    "aldir blanc": "lei aldir blanc",
+    "ano novo": "reveillon",
+    "novo ano": "reveillon",
+    "aniversario de pvh": "aniversario de porto velho",
+    "111 anos": "aniversario de porto velho",
+    "111 anos de pvh": "aniversario de porto velho",
+    "pvh 111 anos": "aniversario de porto velho",
+    "rumo aos 111 anos": "aniversario de porto velho",
+    "110 anos": "aniversario de porto velho",
+    "o maior do norte": "maior do norte",
+    "no mercado cultural": "mercado cultural",
+    "natal porto velho luz": "natal porto luz",
+    "agenda": "agenda cultural",
+    "distritos": "distrito",
+    "eventos": "evento",
+    "prorrogado": "prorrogacao",
+}
 
 
 # ---------------------------------------------------------
@@ -50,3 +90,86 @@ def contar_tags(eventos: list) -> Counter:
         normalizadas.append(normalizar_tag(tag))
 
     return Counter(normalizadas)
+
+
+# ---------------------------------------------------------
+# Canonicaliza uma tag (memoizado: cada texto é tratado uma vez)
+# - remove acentos e converte para minúsculas
+# - remove pontuação e o ano no final ("CARNAVAL 2025" -> "carnaval")
+# - aplica a tabela de sinônimos
+# Retorna "" para tags vazias ou sem significado ("Sem tag")
+# ---------------------------------------------------------
+@lru_cache(maxsize=None)
+def canonicalizar_tag(tag: str) -> str:
+    if not tag:
+        return ""
+
+    tag = unicodedata.normalize("NFKD", tag)
+    tag = "".join(c for c in tag if not unicodedata.combining(c))
+    tag = tag.lower()
+
+    tag = re.sub(r"[^\w\s/-]", " ", tag)
+    tag = re.sub(r"[\s-]+", " ", tag).strip()
+    tag = re.sub(r"\s+(19|20)\d{2}$", "", tag)
+
+    if tag in TAGS_IGNORADAS:
+        return ""
+
+    return SINONIMOS.get(tag, tag)
+
+
+# ---------------------------------------------------------
+# Gera as facetas de tags
+# ---------------------------------------------------------
+def gerar_facetas(eventos_por_ano: dict) -> dict:
+    """
+    Recebe {ano: [eventos]} e retorna:
+    - total: contagem de cada tag canônica
+    - por_ano: contagens por ano
+    - rotulos: forma original mais frequente de cada tag
+    - indice: tag canônica → ids dos eventos
+    """
+    total = Counter()
+    por_ano = {}
+    indice = {}
+    formas = {}
+
+    for ano, eventos in sorted(eventos_por_ano.items(), reverse=True):
+        contagem_ano = Counter()
+
+        for ev in eventos:
+            original = (ev.get("tag_evento") or "").strip()
+            tag = canonicalizar_tag(original)
+            if not tag:
+                continue
+
+            contagem_ano[tag] += 1
+            formas.setdefault(tag, Counter())[original] += 1
+            indice.setdefault(tag, []).append(gerar_id_evento(ev))
+
+        if contagem_ano:
+            por_ano[str(ano)] = dict(contagem_ano.most_common())
+            total.update(contagem_ano)
+
+    return {
+        "quantidade_tags": len(total),
+        "total": dict(total.most_common()),
+        "por_ano": por_ano,
+        "rotulos": {tag: formas[tag].most_common(1)[0][0] for tag in sorted(formas)},
+        "indice": {tag: indice[tag] for tag in sorted(indice)},
+    }
+
+
+# ---------------------------------------------------------
+# Publica as facetas em tags.json
+# ---------------------------------------------------------
+def salvar_facetas(facetas: dict, caminho=API_TAGS_FILE):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(facetas, f, ensure_ascii=False, indent=2)
+
+    logging.info(
+        "🏷️ %d tags canônicas salvas em %s",
+        facetas["quantidade_tags"], caminho
+    )
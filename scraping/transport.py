@@ -0,0 +1,322 @@
+"""
+Transportes HTTP usados pela camada de fetch.
+
+Responsável por:
+- Isolar o acesso à rede atrás de uma interface única (obter)
+- Transporte real (requests), usado por padrão
+- Transporte de gravação: repassa ao real e grava cada resposta
+  num arquivo JSONL reproduzível
+- Transporte de reprodução: responde a partir do arquivo gravado,
+  com latência e taxas de erro injetadas (testes de carga sem rede)
+"""
+
+import base64
+import codecs
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+from scraping.config import TRANSPORTE_ARQUIVO
+
+TIMEOUT = 10
+
+# cabeçalhos guardados na gravação (o resto não é usado pelo scraper)
+CABECALHOS_GRAVADOS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class ErroTransporte(Exception):
+    """
+    Falha de rede (real ou injetada): timeout, conexão recusada...
+    """
+
+
+class Resposta:
+    """
+    Resposta mínima, independente de requests.
+
+    conteudo são os bytes recebidos, sem decodificar; encoding é o
+    charset declarado no Content-Type (None se o servidor não declarou).
+    Um conteudo str (gravações) é guardado em UTF-8.
+    """
+
+    def __init__(self, status, conteudo=b"", headers=None, encoding=None):
+        self.status = status
+        self.headers = headers or {}
+
+        if isinstance(conteudo, str):
+            conteudo = conteudo.encode("utf-8")
+            encoding = "utf-8"
+
+        self.conteudo = conteudo
+        self.encoding = encoding or charset(self.cabecalho("Content-Type"))
+
+    @property
+    def texto(self):
+        return self.conteudo.decode(self.encoding or "utf-8", errors="replace")
+
+    def cabecalho(self, nome):
+        nome = nome.lower()
+        for chave, valor in self.headers.items():
+            if chave.lower() == nome:
+                return valor
+        return None
+
+
+# ---------------------------------------------------------
+# Charset declarado num Content-Type (None se ausente ou desconhecido)
+# ---------------------------------------------------------
+def charset(content_type):
+    if not content_type:
+        return None
+
+    for parte in content_type.split(";")[1:]:
+        nome, _, valor = parte.partition("=")
+        if nome.strip().lower() == "charset":
+            valor = valor.strip().strip("\"'")
+            try:
+                return codecs.lookup(valor).name
+            except LookupError:
+                return None
+
+    return None
+
+
+# ---------------------------------------------------------
+# Transporte real
+# ---------------------------------------------------------
+class TransporteHTTP:
+    nome = "http"
+
+    # o cache em disco vale para o transporte real
+    usa_cache = True
+
+    def obter(self, url, headers=None):
+        # importado só quando a rede é usada (comandos offline não pagam o custo)
+        import requests
+
+        try:
+            resp = requests.get(url, timeout=TIMEOUT, headers=headers)
+        except requests.RequestException as e:
+            raise ErroTransporte(str(e)) from e
+
+        # resp.content: bytes sem decodificar (resp.text adivinharia o charset)
+        return Resposta(resp.status_code, resp.content, dict(resp.headers))
+
+    def fechar(self):
+        pass
+
+
+# ---------------------------------------------------------
+# Gravação: repassa ao transporte real e grava as respostas
+# ---------------------------------------------------------
+class TransporteGravacao:
+    """
+    Cada resposta vira uma linha do arquivo:
+    {"url": ..., "status": 200, "headers": {...},
+     "conteudo_b64": "<bytes em base64>", "encoding": "utf-8"}
+
+    O corpo é gravado como os bytes recebidos (a reprodução entrega
+    ao parser exatamente o que o servidor mandou), com o charset
+    declarado (null se o servidor não declarou).
+
+    O cache em disco é ignorado na leitura, para que todas as
+    páginas visitadas entrem na gravação.
+    """
+
+    nome = "gravar"
+    usa_cache = False
+
+    def __init__(self, caminho=TRANSPORTE_ARQUIVO, base=None):
+        self.caminho = caminho
+        self.base = base or TransporteHTTP()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        self._arquivo = open(caminho, "w", encoding="utf-8")
+
+    def obter(self, url, headers=None):
+        resposta = self.base.obter(url, headers)
+
+        linha = json.dumps({
+            "url": url,
+            "status": resposta.status,
+            "headers": {
+                nome: resposta.cabecalho(nome)
+                for nome in CABECALHOS_GRAVADOS
+                if resposta.cabecalho(nome) is not None
+            },
+            "conteudo_b64": base64.b64encode(resposta.conteudo).decode("ascii"),
+            "encoding": resposta.encoding
+        }, ensure_ascii=False)
+
+        with self._lock:
+            self._arquivo.write(linha + "\n")
+            self._arquivo.flush()
+
+        return resposta
+
+    def fechar(self):
+        with self._lock:
+            if self._arquivo:
+                self._arquivo.close()
+                self._arquivo = None
+        logging.info("📼 Respostas gravadas em %s", self.caminho)
+
+
+# ---------------------------------------------------------
+# Reprodução: responde a partir de uma gravação
+# ---------------------------------------------------------
+class TransporteReproducao:
+    """
+    Responde com as páginas gravadas (a última gravação de cada URL).
+    URLs ausentes respondem 404.
+
+    - latencia: atraso fixo (segundos) por requisição
+    - variacao: atraso extra aleatório, entre 0 e `variacao` segundos
+    - taxa_erro: fração das requisições que falham com ErroTransporte
+    - taxa_5xx: fração das requisições que respondem 503
+    - semente: torna a sequência de atrasos e erros reproduzível
+    """
+
+    nome = "reproduzir"
+
+    # a reprodução não deve ler nem gravar o cache em disco
+    usa_cache = False
+
+    def __init__(
+        self,
+        caminho=TRANSPORTE_ARQUIVO,
+        latencia=0.0,
+        variacao=0.0,
+        taxa_erro=0.0,
+        taxa_5xx=0.0,
+        semente=None
+    ):
+        self.caminho = caminho
+        self.latencia = latencia
+        self.variacao = variacao
+        self.taxa_erro = taxa_erro
+        self.taxa_5xx = taxa_5xx
+
+        self._aleatorio = random.Random(semente)
+        self._lock = threading.Lock()
+        self.respostas = self.carregar(caminho)
+
+        logging.info("📼 %d respostas carregadas de %s", len(self.respostas), caminho)
+
+    @staticmethod
+    def carregar(caminho):
+        respostas = {}
+
+        with open(caminho, "r", encoding="utf-8") as f:
+            for linha in f:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    logging.warning("⚠️ Linha inválida ignorada na gravação.")
+                    continue
+                respostas[registro["url"]] = registro
+
+        return respostas
+
+    def _sortear(self):
+        with self._lock:
+            return (
+                self._aleatorio.random(),
+                self._aleatorio.random(),
+                self._aleatorio.uniform(0, self.variacao) if self.variacao else 0.0
+            )
+
+    def obter(self, url, headers=None):
+        sorteio_erro, sorteio_5xx, extra = self._sortear()
+
+        atraso = self.latencia + extra
+        if atraso > 0:
+            time.sleep(atraso)
+
+        if sorteio_erro < self.taxa_erro:
+            raise ErroTransporte(f"falha injetada em {url}")
+        if sorteio_5xx < self.taxa_5xx:
+            return Resposta(503)
+
+        registro = self.respostas.get(url)
+        if registro is None:
+            return Resposta(404)
+
+        resposta = resposta_gravada(registro)
+
+        # requisições condicionais também funcionam na reprodução
+        etag = resposta.cabecalho("ETag")
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            return Resposta(304, b"", resposta.headers)
+
+        return resposta
+
+    def fechar(self):
+        pass
+
+
+# ---------------------------------------------------------
+# Resposta a partir de uma linha da gravação
+# ---------------------------------------------------------
+def resposta_gravada(registro):
+    """
+    Gravações antigas guardavam o corpo já decodificado em "texto";
+    elas continuam sendo lidas (como UTF-8).
+    """
+    if "conteudo_b64" in registro:
+        return Resposta(
+            registro["status"],
+            base64.b64decode(registro["conteudo_b64"]),
+            registro.get("headers"),
+            registro.get("encoding")
+        )
+
+    return Resposta(registro["status"], registro.get("texto", ""), registro.get("headers"))
+
+
+TRANSPORTES = {
+    TransporteHTTP.nome: TransporteHTTP,
+    TransporteGravacao.nome: TransporteGravacao,
+    TransporteReproducao.nome: TransporteReproducao,
+}
+
+
+# ---------------------------------------------------------
+# Cria um transporte pelo nome (usado pela CLI)
+# ---------------------------------------------------------
+def criar_transporte(nome="http", caminho=TRANSPORTE_ARQUIVO, **opcoes):
+    """
+    nome: "http", "gravar" ou "reproduzir".
+    opcoes (só para "reproduzir"): latencia, variacao, taxa_erro, taxa_5xx, semente.
+    """
+    if nome == TransporteHTTP.nome:
+        return TransporteHTTP()
+    if nome == TransporteGravacao.nome:
+        return TransporteGravacao(caminho)
+    if nome == TransporteReproducao.nome:
+        return TransporteReproducao(caminho, **opcoes)
+
+    raise ValueError(f"Transporte desconhecido: {nome}")
+
+
+# ---------------------------------------------------------
+# Transporte ativo (um por processo)
+# ---------------------------------------------------------
+_transporte = TransporteHTTP()
+
+
+def obter_transporte():
+    return _transporte
+
+
+def definir_transporte(transporte):
+    """
+    Troca o transporte usado por fetch e retorna o anterior.
+    """
+    global _transporte
+    anterior, _transporte = _transporte, transporte
+    return anterior
@@ -0,0 +1,123 @@
+"""
+URLs canônicas do scraper.
+
+Responsável por:
+- Resolver URLs relativas contra a base da fonte
+- Normalizar variações triviais da mesma URL: esquema (https), host em
+  minúsculas, porta padrão, barra final, fragmento, percent-encoding
+  do caminho e ordem dos parâmetros da query
+- Decodificar só os escapes de caracteres não reservados (%41 -> A):
+  %2F e outros reservados mudam o caminho e ficam como estão
+- Reduzir links de artigo a /artigo/<id>: o slug muda com o título,
+  o id numérico não
+- Entregar a chave usada pelo cache, pela deduplicação e pelo id
+  dos eventos
+
+As funções são chamadas várias vezes para cada URL (cache, ids,
+deduplicação), por isso os resultados ficam memoizados.
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+from scraping.config import URL_BASE
+
+# caracteres mantidos ao recodificar o caminho da URL (inclui %,
+# porque os escapes válidos já foram normalizados)
+_SEGUROS_CAMINHO = "/()!$&'*+,;=:@-._~%"
+
+# caracteres não reservados (RFC 3986): o escape equivale ao caractere
+_NAO_RESERVADOS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+
+_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_PORCENTO_SOLTO = re.compile(r"%(?![0-9A-Fa-f]{2})")
+
+_PORTAS_PADRAO = (":80", ":443")
+
+REGEX_ARTIGO = re.compile(r"^/artigo/(\d+)(?:/|$)")
+
+
+# ---------------------------------------------------------
+# URL absoluta (sem outra normalização)
+# ---------------------------------------------------------
+@lru_cache(maxsize=4096)
+def resolver_url(url, base=URL_BASE):
+    return urljoin(base, url)
+
+
+# ---------------------------------------------------------
+# URL canônica
+# ---------------------------------------------------------
+@lru_cache(maxsize=8192)
+def canonicalizar_url(url, base=URL_BASE):
+    """
+    Converte a URL em absoluta e normaliza as variações que apontam
+    para a mesma página. URLs que não são http(s) voltam só resolvidas.
+    """
+    if not url:
+        return ""
+
+    partes = urlsplit(urljoin(base, url.strip()))
+    if partes.scheme not in ("http", "https"):
+        return urlunsplit(partes)
+
+    host = partes.netloc.lower()
+    for porta in _PORTAS_PADRAO:
+        host = host.removesuffix(porta)
+
+    caminho = _normalizar_caminho(partes.path)
+    if len(caminho) > 1:
+        caminho = caminho.rstrip("/")
+
+    query = urlencode(sorted(parse_qsl(partes.query, keep_blank_values=True)))
+
+    return urlunsplit(("https", host, caminho or "/", query, ""))
+
+
+# ---------------------------------------------------------
+# Percent-encoding do caminho
+# ---------------------------------------------------------
+def _normalizar_caminho(caminho):
+    """
+    Decodifica os escapes de caracteres não reservados, põe os demais
+    em maiúsculas (%2f -> %2F) e codifica o que não pode aparecer
+    cru (espaços, acentos, % sem escape).
+    """
+    def escape(match):
+        caractere = chr(int(match.group(1), 16))
+        return caractere if caractere in _NAO_RESERVADOS else "%" + match.group(1).upper()
+
+    caminho = _ESCAPE.sub(escape, caminho)
+    caminho = _PORCENTO_SOLTO.sub("%25", caminho)
+    return quote(caminho, safe=_SEGUROS_CAMINHO)
+
+
+# ---------------------------------------------------------
+# Id numérico do artigo (None se a URL não for de artigo)
+# ---------------------------------------------------------
+def id_artigo(url):
+    match = REGEX_ARTIGO.match(urlsplit(canonicalizar_url(url)).path)
+    return match.group(1) if match else None
+
+
+# ---------------------------------------------------------
+# Chave da URL: cache, deduplicação e id dos eventos
+# ---------------------------------------------------------
+@lru_cache(maxsize=8192)
+def chave_url(url):
+    """
+    URL canônica, com os links de artigo reduzidos a
+    https://<host>/artigo/<id> (mesmo artigo com outro slug,
+    mesma chave).
+    """
+    canonica = canonicalizar_url(url)
+    partes = urlsplit(canonica)
+
+    match = REGEX_ARTIGO.match(partes.path)
+    if match:
+        return urlunsplit(("https", partes.netloc, f"/artigo/{match.group(1)}", "", ""))
+
+    return canonica
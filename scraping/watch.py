@@ -0,0 +1,215 @@
+"""
+Modo --watch: acompanhamento contínuo das fontes.
+
+Responsável por:
+- Consultar a primeira página da listagem em intervalos curtos,
+  com requisições condicionais (ETag / Last-Modified)
+- Detectar cards novos pelo link do evento
+- Raspar e publicar apenas os eventos novos, repetindo no ciclo
+  seguinte os que falharam
+- Rodar uma reconciliação completa (pipeline inteiro, sem o cache
+  de HTML) em intervalos longos
+"""
+
+import hashlib
+import logging
+import time
+
+from scraping.archiver import ArquivadorEventos
+from scraping.cache import definir_ttl
+from scraping.config import WATCH_INTERVALO, WATCH_INTERVALO_COMPLETO, WATCH_TTL_RECONCILIACAO
+from scraping.fetch import get_condicional, parse_html
+from scraping.images import RegistroImagens
+from scraping.pipeline import Pipeline
+from scraping.runner import process_card
+from scraping.sources import obter_fontes
+from scraping.urls import chave_url
+
+
+class Vigia:
+    """
+    Laço de acompanhamento:
+
+        Vigia().executar()
+
+    A cada `intervalo` segundos, baixa só a página 1 de cada fonte;
+    a cada `intervalo_completo` segundos, refaz a coleta completa
+    (que também corrige eventos editados ou removidos no portal),
+    com o cache de HTML limitado a `ttl_reconciliacao` segundos.
+
+    Os validadores da página 1 só são guardados depois que os cards
+    novos foram publicados; um card que falhar fica em `repetir` e é
+    tentado de novo nos ciclos seguintes, mesmo com a página em 304.
+    """
+
+    def __init__(
+        self,
+        intervalo=WATCH_INTERVALO,
+        intervalo_completo=WATCH_INTERVALO_COMPLETO,
+        fontes=None,
+        ttl_reconciliacao=WATCH_TTL_RECONCILIACAO
+    ):
+        self.intervalo = intervalo
+        self.intervalo_completo = intervalo_completo
+        self.fontes = fontes or obter_fontes()
+        self.ttl_reconciliacao = ttl_reconciliacao
+        self.arquivador = ArquivadorEventos()
+
+        # validadores HTTP e hash do corpo da página 1, por fonte
+        self.estado = {f.chave: {"etag": None, "modificado": None, "hash": None} for f in self.fontes}
+
+        # cards que falharam, por fonte: {chave do link: card}
+        self.repetir = {f.chave: {} for f in self.fontes}
+
+        self.links_conhecidos = set()
+        self.proxima_reconciliacao = 0.0
+
+    # ---------------------------------------------------------
+    # Links já publicados (eventos.json + arquivos por ano)
+    # ---------------------------------------------------------
+    def carregar_links(self):
+        self.links_conhecidos = {
+            chave_url(ev["link_evento"])
+            for lista in self.arquivador.carregar_publicados().values()
+            for ev in lista
+        }
+        logging.info("👀 %d eventos já publicados.", len(self.links_conhecidos))
+
+    # ---------------------------------------------------------
+    # Cards novos na primeira página de uma fonte
+    # ---------------------------------------------------------
+    def cards_novos(self, fonte):
+        """
+        Retorna ({chave do link: card} da página 1 ainda não
+        publicados, validadores novos da página). Os validadores
+        (etag, modificado, hash) são None se a página não mudou
+        desde a última consulta; quem chama os guarda no estado
+        depois de publicar os cards.
+        """
+        estado = self.estado[fonte.chave]
+
+        status, resposta, etag, modificado = get_condicional(
+            fonte.url_pagina(1),
+            estado["etag"],
+            estado["modificado"],
+            fonte.aguardar_vez
+        )
+
+        if status == 304:
+            logging.debug("%s: página 1 não modificada (304).", fonte.nome)
+            return {}, None
+        if not resposta or not resposta.conteudo:
+            return {}, None
+
+        # servidores sem ETag/Last-Modified: compara o corpo
+        hash_corpo = hashlib.sha1(resposta.conteudo).hexdigest()
+        if hash_corpo == estado["hash"]:
+            logging.debug("%s: página 1 idêntica à anterior.", fonte.nome)
+            return {}, None
+
+        soup = parse_html(resposta.conteudo, resposta.encoding)
+        novos = {}
+
+        for bloco in fonte.extrair_cards(soup):
+            card = fonte.extrair_card(bloco)
+            if not card:
+                continue
+            chave = chave_url(card["link_evento"])
+            if chave not in self.links_conhecidos:
+                novos[chave] = card
+
+        return novos, {"etag": etag, "modificado": modificado, "hash": hash_corpo}
+
+    # ---------------------------------------------------------
+    # Verificação rápida: raspa e publica só os eventos novos
+    # ---------------------------------------------------------
+    def verificar(self):
+        registro = RegistroImagens()
+        eventos_novos = []
+        falhas = {}
+        validadores = {}
+
+        for fonte in self.fontes:
+            novos, validadores[fonte.chave] = self.cards_novos(fonte)
+
+            # cards que falharam antes vêm primeiro
+            cards = {**self.repetir[fonte.chave], **novos}
+            falhas[fonte.chave] = {}
+
+            for chave, card in cards.items():
+                if chave in self.links_conhecidos:
+                    continue
+                ev = process_card(card, registro, fonte)
+                if ev:
+                    eventos_novos.append(ev)
+                else:
+                    falhas[fonte.chave][chave] = card
+
+        if eventos_novos:
+            logging.info("🆕 %d eventos novos. Publicando...", len(eventos_novos))
+            Pipeline(self.arquivador).incorporar(eventos_novos, registro).arquivar().publicar()
+            self.links_conhecidos.update(chave_url(ev["link_evento"]) for ev in eventos_novos)
+        else:
+            logging.debug("Nenhum evento novo.")
+
+        # só depois da publicação: se ela falhar, a página 1 é
+        # baixada e comparada de novo no próximo ciclo
+        for fonte in self.fontes:
+            self.repetir[fonte.chave] = falhas[fonte.chave]
+            if validadores[fonte.chave]:
+                self.estado[fonte.chave].update(validadores[fonte.chave])
+
+        total_falhas = sum(len(f) for f in falhas.values())
+        if total_falhas:
+            logging.warning("🔁 %d cards falharam e serão tentados no próximo ciclo.", total_falhas)
+
+        return len(eventos_novos)
+
+    # ---------------------------------------------------------
+    # Reconciliação: pipeline completo, sem o cache de HTML
+    # ---------------------------------------------------------
+    def reconciliar(self):
+        # agenda a próxima antes, para uma falha não repetir a coleta a cada ciclo
+        self.proxima_reconciliacao = time.monotonic() + self.intervalo_completo
+
+        logging.info("🔄 Reconciliação completa...")
+
+        # com o TTL padrão (1 dia), as páginas baixadas há menos de um
+        # dia viriam do cache e as edições no portal não apareceriam
+        anterior = definir_ttl(self.ttl_reconciliacao)
+        try:
+            Pipeline(self.arquivador).coletar().arquivar().publicar()
+        finally:
+            definir_ttl(anterior)
+
+        self.carregar_links()
+
+        # a coleta completa já tentou de novo todos os cards da listagem
+        self.repetir = {f.chave: {} for f in self.fontes}
+
+    # ---------------------------------------------------------
+    # Laço principal (até Ctrl+C)
+    # ---------------------------------------------------------
+    def executar(self):
+        logging.info(
+            "👀 Modo watch: página 1 a cada %ds, coleta completa a cada %ds.",
+            self.intervalo, self.intervalo_completo
+        )
+
+        self.carregar_links()
+
+        # sem nada publicado ainda, começa pela coleta completa
+        if self.links_conhecidos:
+            self.proxima_reconciliacao = time.monotonic() + self.intervalo_completo
+
+        while True:
+            try:
+                if time.monotonic() >= self.proxima_reconciliacao:
+                    self.reconciliar()
+                else:
+                    self.verificar()
+            except Exception:
+                # uma falha isolada não derruba o processo
+                logging.exception("❌ Falha no ciclo do modo watch.")
+
+            time.sleep(self.intervalo)
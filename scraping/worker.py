@@ -0,0 +1,275 @@
+"""
+Coleta distribuída: trabalhadores (--worker) e coordenador (--coordenar).
+
+Responsável por:
+- Processar tarefas da fila compartilhada (FilaTrabalho) em vários
+  processos ou contêineres ao mesmo tempo
+- Páginas da listagem: enfileirar os artigos e a próxima página
+- Artigos: coletar os detalhes e guardar o evento na fila
+- Manter as reservas do trabalhador vivas com um heartbeat
+- Coordenar: semear a fila, subir trabalhadores locais, acompanhar
+  o andamento e publicar os resultados nas saídas de sempre
+"""
+
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from scraping.metrics import metricas
+from scraping.models import Evento
+from scraping.runner import extract_results, get_next_page, load_page, process_card
+from scraping.sources import obter_fontes
+from scraping.storage import gerar_id_evento
+from scraping.transport import ErroTransporte
+from scraping.workqueue import PAGINA, PENDENTE, RESERVADA, CONCLUIDA, FALHOU, FilaTrabalho
+
+# segundos entre consultas quando a fila está vazia
+ESPERA_FILA = 1.0
+
+# segundos que um trabalhador espera o coordenador semear a fila
+ESPERA_SEMEADURA = 60
+
+# segundos entre os logs de andamento do coordenador
+INTERVALO_ANDAMENTO = 10
+
+SCRAPER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraper.py")
+
+
+class Trabalhador:
+    """
+    Reserva tarefas da fila até ela terminar:
+
+        Trabalhador().executar()
+
+    Enquanto trabalha, uma thread renova o prazo das suas reservas
+    (a cada terço do prazo). Se o processo morrer, as reservas
+    vencem e voltam para a fila.
+    """
+
+    def __init__(self, fila=None, nome=None, fontes=None):
+        self.fila = fila or FilaTrabalho()
+        self.nome = nome or f"{socket.gethostname()}-{os.getpid()}"
+        self.fontes = {f.chave: f for f in fontes or obter_fontes()}
+
+        self._parar = threading.Event()
+
+    # ---------------------------------------------------------
+    # Heartbeat
+    # ---------------------------------------------------------
+    def _batimentos(self):
+        try:
+            while not self._parar.wait(self.fila.reserva / 3):
+                self.fila.renovar(self.nome)
+        except Exception:
+            logging.exception("❌ Falha no heartbeat de %s", self.nome)
+        finally:
+            self.fila.fechar()
+
+    # ---------------------------------------------------------
+    # Página da listagem: artigos + próxima página
+    # ---------------------------------------------------------
+    def processar_pagina(self, tarefa, fonte):
+        soup = load_page(tarefa.pagina, fonte)
+        if not soup:
+            raise ErroTransporte(f"falha ao carregar a página {tarefa.pagina} da {fonte.nome}")
+
+        metricas.incrementar("paginas_listagem")
+
+        cards = []
+        for posicao, bloco in enumerate(extract_results(soup, fonte)):
+            card = fonte.extrair_card(bloco)
+            if card:
+                cards.append((posicao, card))
+            else:
+                metricas.descartar("link_invalido")
+
+        self.fila.adicionar_artigos(fonte.chave, tarefa.ordem_fonte, tarefa.pagina, cards)
+
+        if cards and get_next_page(soup, tarefa.pagina, fonte):
+            self.fila.adicionar_pagina(fonte.chave, tarefa.ordem_fonte, tarefa.pagina + 1)
+
+    # ---------------------------------------------------------
+    # Uma tarefa: executa e grava o resultado (ou a falha)
+    # ---------------------------------------------------------
+    def executar_tarefa(self, tarefa):
+        fonte = self.fontes.get(tarefa.fonte)
+
+        try:
+            if fonte is None:
+                raise ValueError(f"fonte desconhecida: {tarefa.fonte}")
+
+            resultado = None
+            if tarefa.tipo == PAGINA:
+                self.processar_pagina(tarefa, fonte)
+            else:
+                resultado = process_card(tarefa.dados, None, fonte)
+                if resultado:
+                    metricas.incrementar("eventos_coletados")
+        except Exception as e:
+            logging.error("❌ %s: falha em %s: %s", self.nome, tarefa, e)
+            self.fila.falhar(tarefa, self.nome)
+            return
+
+        if not self.fila.concluir(tarefa, self.nome, resultado):
+            logging.warning("⚠️ %s: reserva vencida, resultado descartado: %s", self.nome, tarefa)
+
+    # ---------------------------------------------------------
+    # Laço principal
+    # ---------------------------------------------------------
+    def executar(self):
+        logging.info("🧵 Trabalhador %s iniciado (%s).", self.nome, self.fila.caminho)
+
+        batimentos = threading.Thread(target=self._batimentos, name=f"heartbeat-{self.nome}", daemon=True)
+        batimentos.start()
+
+        inicio = time.monotonic()
+        processadas = 0
+
+        try:
+            while True:
+                tarefa = self.fila.reservar(self.nome)
+
+                if tarefa is None:
+                    if self.fila.terminada():
+                        break
+                    vazia = not sum(self.fila.contagem().values())
+                    if vazia and time.monotonic() - inicio > ESPERA_SEMEADURA:
+                        logging.warning("⚠️ Fila vazia: nenhum coordenador semeou a coleta.")
+                        break
+                    time.sleep(ESPERA_FILA)
+                    continue
+
+                self.executar_tarefa(tarefa)
+                processadas += 1
+        finally:
+            self._parar.set()
+            batimentos.join()
+            self.fila.fechar()
+
+        logging.info("✅ Trabalhador %s: %d tarefas processadas.", self.nome, processadas)
+        return processadas
+
+
+class Coordenador:
+    """
+    Semeia a fila, acompanha os trabalhadores e publica o resultado:
+
+        Coordenador(trabalhadores=4).executar()
+
+    - trabalhadores: processos `scraper.py --worker` subidos aqui
+      (0 para usar só trabalhadores externos, ex.: docker-compose)
+    - argumentos: opções repassadas aos trabalhadores (ex.: transporte)
+
+    Se todos os trabalhadores locais terminarem antes da fila, o
+    próprio coordenador processa o restante. Uma coleta interrompida
+    continua de onde parou: a fila só é apagada depois de uma
+    publicação sem falhas, e as tarefas que falharam voltam para a
+    fila na execução seguinte.
+    """
+
+    def __init__(self, trabalhadores=0, fila=None, fontes=None, argumentos=()):
+        self.trabalhadores = trabalhadores
+        self.fila = fila or FilaTrabalho()
+        self.fontes = fontes or obter_fontes()
+        self.argumentos = list(argumentos)
+
+        self.processos = []
+
+        # (tipo, chave) das tarefas que falharam, preenchido por publicar()
+        self.falhas = []
+
+    # ---------------------------------------------------------
+    # Trabalhadores locais
+    # ---------------------------------------------------------
+    def iniciar_trabalhadores(self):
+        comando = [sys.executable, SCRAPER, "--worker", "--fila", self.fila.caminho] + self.argumentos
+        self.processos = [subprocess.Popen(comando) for _ in range(self.trabalhadores)]
+        if self.processos:
+            logging.info("🧵 %d trabalhadores locais iniciados.", len(self.processos))
+
+    def encerrar_trabalhadores(self):
+        for processo in self.processos:
+            if processo.poll() is None:
+                processo.terminate()
+        for processo in self.processos:
+            processo.wait()
+
+    # ---------------------------------------------------------
+    # Espera a fila terminar, registrando o andamento
+    # ---------------------------------------------------------
+    def aguardar(self):
+        proximo_log = 0.0
+
+        while not self.fila.terminada():
+            if self.processos and all(p.poll() is not None for p in self.processos):
+                logging.warning("⚠️ Trabalhadores encerrados antes do fim da fila; o coordenador assume o restante.")
+                Trabalhador(self.fila, f"coordenador-{os.getpid()}", self.fontes).executar()
+                break
+
+            if time.monotonic() >= proximo_log:
+                c = self.fila.contagem()
+                logging.info(
+                    "🧵 Fila: %d pendentes, %d em andamento, %d concluídas, %d falhas.",
+                    c[PENDENTE], c[RESERVADA], c[CONCLUIDA], c[FALHOU]
+                )
+                proximo_log = time.monotonic() + INTERVALO_ANDAMENTO
+
+            time.sleep(ESPERA_FILA)
+
+    # ---------------------------------------------------------
+    # Publica os eventos da fila nas saídas de sempre
+    # ---------------------------------------------------------
+    def publicar(self):
+        # importado só aqui: os trabalhadores não precisam do pipeline
+        from scraping.images import RegistroImagens
+        from scraping.pipeline import Pipeline
+
+        self.falhas = self.fila.falhas()
+        for tipo, chave in self.falhas:
+            logging.warning("⚠️ Tarefa sem sucesso após as tentativas: %s %s", tipo, chave)
+
+        registro = RegistroImagens()
+        eventos = []
+        for dados in self.fila.resultados():
+            ev = Evento.de_dict(dados)
+            registro.registrar_evento(ev, gerar_id_evento(ev))
+            eventos.append(ev)
+
+        logging.info("📦 Publicando %d eventos da coleta distribuída...", len(eventos))
+        if eventos:
+            Pipeline().incorporar(eventos, registro).arquivar().publicar()
+
+        # com falhas, a fila fica para a próxima execução, que tenta
+        # de novo só as tarefas que falharam; sem falhas, é apagada
+        # depois da publicação
+        if self.falhas:
+            logging.error(
+                "❌ %d tarefas falharam. Fila mantida em %s: rode --coordenar de novo.",
+                len(self.falhas), self.fila.caminho
+            )
+        else:
+            self.fila.remover()
+        return len(eventos)
+
+    # ---------------------------------------------------------
+    # Executa a coleta distribuída completa
+    # ---------------------------------------------------------
+    def executar(self):
+        if self.fila.existe() and sum(self.fila.contagem().values()):
+            logging.info("⏩ Retomando coleta distribuída de %s.", self.fila.caminho)
+            reabertas = self.fila.reabrir_falhas()
+            if reabertas:
+                logging.info("🔁 %d tarefas que falharam voltaram para a fila.", reabertas)
+        self.fila.semear(self.fontes)
+
+        self.iniciar_trabalhadores()
+        try:
+            self.aguardar()
+        finally:
+            self.encerrar_trabalhadores()
+
+        return self.publicar()
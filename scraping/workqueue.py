@@ -0,0 +1,294 @@
+"""
+Fila de trabalho compartilhada em SQLite (coleta distribuída).
+
+Responsável por:
+- Guardar as tarefas da coleta (páginas da listagem e artigos)
+  num arquivo SQLite que vários processos abrem ao mesmo tempo
+- Entregar cada tarefa a um único trabalhador por vez (reserva
+  com prazo), devolvendo à fila as reservas que expiraram
+- Renovar o prazo das reservas de um trabalhador vivo (heartbeat)
+- Guardar o resultado de cada artigo até o coordenador publicar
+- Reabrir as tarefas que falharam quando a coleta é retomada
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from scraping import codec
+from scraping.config import FILA_RESERVA, FILA_TENTATIVAS, FILA_TRABALHO_FILE
+from scraping.urls import chave_url
+
+PAGINA = "pagina"
+ARTIGO = "artigo"
+
+PENDENTE = "pendente"
+RESERVADA = "reservada"
+CONCLUIDA = "concluida"
+FALHOU = "falhou"
+
+
+# ---------------------------------------------------------
+# Esquema da fila
+# ---------------------------------------------------------
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    fonte TEXT NOT NULL,
+    ordem_fonte INTEGER NOT NULL,
+    pagina INTEGER NOT NULL,
+    posicao INTEGER NOT NULL DEFAULT 0,
+    chave TEXT NOT NULL,
+    dados TEXT,
+    estado TEXT NOT NULL DEFAULT 'pendente',
+    dono TEXT,
+    prazo REAL,
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    resultado TEXT,
+    UNIQUE (tipo, fonte, chave)
+);
+CREATE INDEX IF NOT EXISTS idx_tarefas_estado ON tarefas(estado, tipo, id);
+"""
+
+
+class Tarefa:
+    """
+    Tarefa reservada por um trabalhador. dados é o card do
+    artigo (None nas páginas da listagem).
+    """
+
+    __slots__ = ("id", "tipo", "fonte", "ordem_fonte", "pagina", "posicao", "chave", "dados")
+
+    def __init__(self, id, tipo, fonte, ordem_fonte, pagina, posicao, chave, dados):
+        self.id = id
+        self.tipo = tipo
+        self.fonte = fonte
+        self.ordem_fonte = ordem_fonte
+        self.pagina = pagina
+        self.posicao = posicao
+        self.chave = chave
+        self.dados = codec.loads(dados) if dados else None
+
+    def __repr__(self):
+        return f"Tarefa({self.tipo!r}, {self.fonte!r}, {self.chave!r})"
+
+
+class FilaTrabalho:
+    """
+    Fila de tarefas num arquivo SQLite (modo WAL), segura para
+    vários processos e threads:
+
+        fila = FilaTrabalho()
+        fila.semear(fontes)
+        tarefa = fila.reservar("worker-1")
+        ...
+        fila.concluir(tarefa, "worker-1", evento)
+
+    Uma tarefa reservada tem prazo (reserva segundos). Se o
+    trabalhador morrer, o prazo vence e outro trabalhador a
+    reserva de novo; depois de `tentativas` reservas sem sucesso
+    ela é marcada como falha. Páginas da listagem vêm antes dos
+    artigos, para que a fila cresça o quanto antes.
+    """
+
+    def __init__(self, caminho=FILA_TRABALHO_FILE, reserva=FILA_RESERVA, tentativas=FILA_TENTATIVAS):
+        self.caminho = caminho
+        self.reserva = reserva
+        self.tentativas = tentativas
+
+        # uma conexão por thread (o heartbeat roda em outra thread)
+        self._local = threading.local()
+
+    def existe(self):
+        return os.path.exists(self.caminho)
+
+    def _conexao(self):
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30, isolation_level=None)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.executescript(ESQUEMA)
+            self._local.conexao = conexao
+        return conexao
+
+    def fechar(self):
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is not None:
+            conexao.close()
+            self._local.conexao = None
+
+    # ---------------------------------------------------------
+    # Inclusão de tarefas (ignora as que já existem)
+    # ---------------------------------------------------------
+    def semear(self, fontes):
+        """
+        Enfileira a primeira página da listagem de cada fonte.
+        Numa fila já existente (coleta interrompida) não muda nada.
+        """
+        for ordem, fonte in enumerate(fontes):
+            self.adicionar_pagina(fonte.chave, ordem, 1)
+
+    def adicionar_pagina(self, fonte, ordem_fonte, pagina):
+        self._conexao().execute(
+            "INSERT OR IGNORE INTO tarefas (tipo, fonte, ordem_fonte, pagina, chave) VALUES (?, ?, ?, ?, ?)",
+            (PAGINA, fonte, ordem_fonte, pagina, str(pagina))
+        )
+
+    def adicionar_artigos(self, fonte, ordem_fonte, pagina, cards):
+        self._conexao().executemany(
+            "INSERT OR IGNORE INTO tarefas (tipo, fonte, ordem_fonte, pagina, posicao, chave, dados) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (ARTIGO, fonte, ordem_fonte, pagina, posicao, chave_url(card["link_evento"]), codec.dumps(card))
+                for posicao, card in cards
+            ]
+        )
+
+    # ---------------------------------------------------------
+    # Reserva da próxima tarefa (ou None se não houver)
+    # ---------------------------------------------------------
+    def reservar(self, dono):
+        conexao = self._conexao()
+        agora = time.time()
+
+        # BEGIN IMMEDIATE: só um processo escolhe tarefa por vez
+        conexao.execute("BEGIN IMMEDIATE")
+        try:
+            # reservas vencidas que já esgotaram as tentativas
+            conexao.execute(
+                "UPDATE tarefas SET estado = ?, dono = NULL, prazo = NULL "
+                "WHERE estado = ? AND prazo < ? AND tentativas >= ?",
+                (FALHOU, RESERVADA, agora, self.tentativas)
+            )
+
+            linha = conexao.execute(
+                """
+                SELECT id, tipo, fonte, ordem_fonte, pagina, posicao, chave, dados
+                FROM tarefas
+                WHERE estado = ? OR (estado = ? AND prazo < ?)
+                ORDER BY tipo = ?, ordem_fonte, pagina, posicao
+                LIMIT 1
+                """,
+                (PENDENTE, RESERVADA, agora, ARTIGO)
+            ).fetchone()
+
+            if linha is None:
+                conexao.execute("COMMIT")
+                return None
+
+            conexao.execute(
+                "UPDATE tarefas SET estado = ?, dono = ?, prazo = ?, tentativas = tentativas + 1 WHERE id = ?",
+                (RESERVADA, dono, agora + self.reserva, linha[0])
+            )
+            conexao.execute("COMMIT")
+        except BaseException:
+            conexao.execute("ROLLBACK")
+            raise
+
+        return Tarefa(*linha)
+
+    # ---------------------------------------------------------
+    # Heartbeat: renova o prazo das reservas de um trabalhador
+    # ---------------------------------------------------------
+    def renovar(self, dono):
+        self._conexao().execute(
+            "UPDATE tarefas SET prazo = ? WHERE dono = ? AND estado = ?",
+            (time.time() + self.reserva, dono, RESERVADA)
+        )
+
+    # ---------------------------------------------------------
+    # Fim de uma tarefa
+    # ---------------------------------------------------------
+    def concluir(self, tarefa, dono, resultado=None):
+        """
+        Grava o resultado (o evento, nos artigos). Retorna False se
+        a reserva já tinha vencido e passado a outro trabalhador.
+        """
+        cursor = self._conexao().execute(
+            "UPDATE tarefas SET estado = ?, prazo = NULL, resultado = ? "
+            "WHERE id = ? AND dono = ? AND estado = ?",
+            (
+                CONCLUIDA,
+                codec.dumps(resultado) if resultado is not None else None,
+                tarefa.id,
+                dono,
+                RESERVADA
+            )
+        )
+        return cursor.rowcount == 1
+
+    def falhar(self, tarefa, dono):
+        """
+        Devolve a tarefa à fila, ou a marca como falha depois
+        de esgotar as tentativas.
+        """
+        self._conexao().execute(
+            "UPDATE tarefas SET estado = CASE WHEN tentativas >= ? THEN ? ELSE ? END, "
+            "dono = NULL, prazo = NULL WHERE id = ? AND dono = ? AND estado = ?",
+            (self.tentativas, FALHOU, PENDENTE, tarefa.id, dono, RESERVADA)
+        )
+
+    def reabrir_falhas(self):
+        """
+        Devolve à fila, com as tentativas zeradas, as tarefas que
+        falharam numa execução anterior (páginas e artigos).
+        Retorna quantas foram reabertas.
+        """
+        cursor = self._conexao().execute(
+            "UPDATE tarefas SET estado = ?, tentativas = 0, dono = NULL, prazo = NULL WHERE estado = ?",
+            (PENDENTE, FALHOU)
+        )
+        return cursor.rowcount
+
+    # ---------------------------------------------------------
+    # Andamento
+    # ---------------------------------------------------------
+    def contagem(self):
+        """
+        {estado: quantidade}, para todos os estados.
+        """
+        contagem = dict.fromkeys((PENDENTE, RESERVADA, CONCLUIDA, FALHOU), 0)
+        for estado, quantidade in self._conexao().execute(
+            "SELECT estado, COUNT(*) FROM tarefas GROUP BY estado"
+        ):
+            contagem[estado] = quantidade
+        return contagem
+
+    def terminada(self):
+        """
+        True quando há tarefas e nenhuma está pendente ou reservada.
+        """
+        contagem = self.contagem()
+        return sum(contagem.values()) > 0 and not contagem[PENDENTE] and not contagem[RESERVADA]
+
+    # ---------------------------------------------------------
+    # Resultados, na ordem da listagem de cada fonte
+    # ---------------------------------------------------------
+    def resultados(self):
+        for (resultado,) in self._conexao().execute(
+            "SELECT resultado FROM tarefas WHERE tipo = ? AND estado = ? AND resultado IS NOT NULL "
+            "ORDER BY ordem_fonte, pagina, posicao",
+            (ARTIGO, CONCLUIDA)
+        ):
+            yield codec.loads(resultado)
+
+    def falhas(self):
+        return [
+            (tipo, chave)
+            for tipo, chave in self._conexao().execute(
+                "SELECT tipo, chave FROM tarefas WHERE estado = ? ORDER BY id", (FALHOU,)
+            )
+        ]
+
+    # ---------------------------------------------------------
+    # Remove a fila (depois da publicação)
+    # ---------------------------------------------------------
+    def remover(self):
+        self.fechar()
+        for sufixo in ("", "-wal", "-shm"):
+            if os.path.exists(self.caminho + sufixo):
+                os.remove(self.caminho + sufixo)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Verifica o orçamento de tempo de import de cada comando da CLI.
+
+Para cada comando, roda `python -X importtime` importando o scraper.py
+e os módulos que o comando importa, soma o tempo dos imports e
+compara com o orçamento (ms). Sai com código 1 se algum estourar.
+
+Uso:
+    python scripts/verificar_importtime.py
+    python scripts/verificar_importtime.py --repeticoes 10 --detalhes
+"""
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRAPER = os.path.join(RAIZ, "scraper.py")
+
+# comando -> orçamento em ms (~50% de folga sobre as medições atuais).
+# Os módulos de cada comando vêm de scraper.py (modulos_dos_comandos);
+# um comando novo sem orçamento aqui faz o script falhar.
+ORCAMENTOS = {
+    "--help": 60,
+    "--arquivar": 70,
+    "--gerar-html": 90,
+    "--exportar-sqlite": 80,
+    "--facetas": 70,
+    "--atualizar": 250,
+    "--tudo": 250,
+    "--lite": 250,
+    "--hidratar": 250,
+    "--agendar": 250,
+    "--worker": 250,
+    "--coordenar": 250,
+    "--watch": 250,
+    "--servir": 120,
+}
+
+LINHA = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def modulos_dos_comandos(caminho=SCRAPER):
+    """
+    Lê scraper.py (sem importá-lo) e retorna {"--comando": (módulos)}
+    para cada nome da tupla COMANDOS: os imports de scraping.* feitos
+    dentro de comando_<nome> e das funções de scraper.py que ela chama.
+    "--help" não importa nada além do próprio scraper.py.
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        arvore = ast.parse(f.read())
+
+    funcoes = {no.name: no for no in arvore.body if isinstance(no, ast.FunctionDef)}
+    nomes = next(
+        ast.literal_eval(no.value)
+        for no in arvore.body
+        if isinstance(no, ast.Assign) and any(getattr(alvo, "id", None) == "COMANDOS" for alvo in no.targets)
+    )
+
+    def imports(nome, visitadas):
+        visitadas.add(nome)
+        modulos = set()
+
+        for no in ast.walk(funcoes[nome]):
+            if isinstance(no, ast.ImportFrom) and (no.module or "").startswith("scraping"):
+                modulos.add(no.module)
+            elif isinstance(no, ast.Import):
+                modulos.update(a.name for a in no.names if a.name.startswith("scraping"))
+            elif isinstance(no, ast.Call) and isinstance(no.func, ast.Name):
+                chamada = no.func.id
+                if chamada in funcoes and chamada not in visitadas:
+                    modulos |= imports(chamada, visitadas)
+
+        return modulos
+
+    comandos = {"--help": ()}
+    for nome in nomes:
+        comandos["--" + nome.replace("_", "-")] = tuple(sorted(imports(f"comando_{nome}", set())))
+    return comandos
+
+
+def imports_primeiro_nivel(codigo):
+    """
+    Roda o código com -X importtime e retorna [(ms acumulado, módulo)]
+    dos imports de primeiro nível.
+    """
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stderr
+
+    primeiro_nivel = []
+    for linha in saida.splitlines():
+        match = LINHA.match(linha)
+        if match and not match.group(3):
+            primeiro_nivel.append((int(match.group(2)) / 1000, match.group(4)))
+
+    return primeiro_nivel
+
+
+def medir(modulos, inicializacao):
+    """
+    Retorna (total em ms, [(ms acumulado, módulo)]) dos imports feitos
+    pelo comando, sem contar os da inicialização do interpretador.
+    """
+    codigo = "; ".join(f"import {m}" for m in ("scraper",) + tuple(modulos))
+    primeiro_nivel = [
+        (ms, modulo)
+        for ms, modulo in imports_primeiro_nivel(codigo)
+        if modulo not in inicializacao
+    ]
+    return sum(ms for ms, _ in primeiro_nivel), primeiro_nivel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Orçamento de tempo de import por comando.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Medições por comando (vale a menor)")
+    parser.add_argument("--detalhes", action="store_true", help="Mostra os imports mais caros de cada comando")
+    args = parser.parse_args()
+
+    # o que o interpretador importa sozinho (site, encodings...) varia
+    # com o ambiente e não depende do projeto
+    inicializacao = {modulo for _, modulo in imports_primeiro_nivel("pass")}
+
+    comandos = modulos_dos_comandos()
+
+    sem_orcamento = sorted(set(comandos) - set(ORCAMENTOS))
+    sobrando = sorted(set(ORCAMENTOS) - set(comandos))
+    if sem_orcamento or sobrando:
+        if sem_orcamento:
+            print(f"❌ Comandos sem orçamento em ORCAMENTOS: {', '.join(sem_orcamento)}")
+        if sobrando:
+            print(f"❌ Orçamentos de comandos que não existem em scraper.py: {', '.join(sobrando)}")
+        raise SystemExit(1)
+
+    estourados = 0
+
+    for comando, modulos in comandos.items():
+        orcamento = ORCAMENTOS[comando]
+        medicoes = [medir(modulos, inicializacao) for _ in range(args.repeticoes)]
+        total, primeiro_nivel = min(medicoes, key=lambda m: m[0])
+
+        ok = total <= orcamento
+        estourados += not ok
+        print(f"{'✅' if ok else '❌'} {comando:<18} {total:7.1f} ms  (orçamento {orcamento} ms)")
+
+        if args.detalhes or not ok:
+            for ms, modulo in sorted(primeiro_nivel, reverse=True)[:5]:
+                print(f"      {ms:7.1f} ms  {modulo}")
+
+    if estourados:
+        print(f"\n❌ {estourados} comandos acima do orçamento.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
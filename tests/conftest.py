@@ -0,0 +1,61 @@
+"""
+Fixtures compartilhadas dos testes.
+
+As páginas em tests/fixtures/ foram salvas do portal da Funcultural
+(listagem reduzida a dois cards) e são servidas pelo transporte de
+reprodução, sem acesso à rede nem ao cache em disco.
+"""
+
+import base64
+import json
+import os
+
+import pytest
+
+from scraping.transport import TransporteReproducao, definir_transporte
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def ler_fixture(nome):
+    with open(os.path.join(FIXTURES, nome), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def listagem_html():
+    return ler_fixture("funcultural_listagem.html")
+
+
+@pytest.fixture
+def artigo_html():
+    return ler_fixture("funcultural_artigo.html")
+
+
+# ---------------------------------------------------------
+# Grava {url: html} numa gravação e ativa a reprodução
+# ---------------------------------------------------------
+@pytest.fixture
+def reproduzir(tmp_path):
+    anteriores = []
+
+    def ativar(paginas):
+        caminho = tmp_path / "gravacao.jsonl"
+        with open(caminho, "w", encoding="utf-8") as f:
+            for url, html in paginas.items():
+                f.write(json.dumps({
+                    "url": url,
+                    "status": 200,
+                    "headers": {"Content-Type": "text/html; charset=utf-8"},
+                    "conteudo_b64": base64.b64encode(html.encode("utf-8")).decode("ascii"),
+                    "encoding": "utf-8"
+                }) + "\n")
+
+        transporte = TransporteReproducao(str(caminho))
+        anteriores.append(definir_transporte(transporte))
+        return transporte
+
+    yield ativar
+
+    for anterior in reversed(anteriores):
+        definir_transporte(anterior)
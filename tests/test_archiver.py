@@ -0,0 +1,147 @@
+"""
+Leitura dos eventos publicados pelo ArquivadorEventos e arquivos
+por evento (eventos/<id>.json).
+"""
+
+import json
+import os
+from datetime import datetime
+
+from scraping import codec
+from scraping.archiver import ArquivadorEventos
+from scraping.storage import gerar_id_evento, salvar_eventos_individuais
+
+
+def evento(titulo):
+    return {
+        "titulo": titulo,
+        "tag_evento": "TAG",
+        "blocos_conteudo": [],
+        "imagem_url": "",
+        "link_evento": "https://funcultural.portovelho.ro.gov.br/artigo/1/evento",
+        "fonte": "Funcultural",
+        "data_exibicao": "01/01/2024",
+    }
+
+
+def gravar(caminho, eventos):
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(eventos, f, ensure_ascii=False)
+
+
+def test_arquivo_do_ano_mais_recente_vence(tmp_path):
+    pasta = tmp_path / "arquivo"
+    pasta.mkdir()
+
+    gravar(pasta / "eventos_de_2025.json", [evento("versão de 2025")])
+    gravar(pasta / "eventos_de_2024.json", [evento("versão de 2024")])
+
+    # o arquivo mais antigo com a data de modificação mais nova
+    # (ex.: depois de um checkout) não muda a ordem
+    os.utime(pasta / "eventos_de_2025.json", (1_000_000, 1_000_000))
+
+    arquivador = ArquivadorEventos(
+        caminho_principal=str(tmp_path / "eventos.json"),
+        pasta_arquivo=str(pasta),
+        pasta_eventos=str(tmp_path / "eventos")
+    )
+    publicados = arquivador.carregar_publicados()
+
+    assert list(publicados) == [2025]
+    assert publicados[2025][0].titulo == "versão de 2025"
+
+
+def test_eventos_json_vem_primeiro(tmp_path):
+    pasta = tmp_path / "arquivo"
+    pasta.mkdir()
+
+    gravar(tmp_path / "eventos.json", [evento("versão principal")])
+    gravar(pasta / "eventos_de_2025.json", [evento("versão de 2025")])
+
+    arquivador = ArquivadorEventos(
+        caminho_principal=str(tmp_path / "eventos.json"),
+        pasta_arquivo=str(pasta),
+        pasta_eventos=str(tmp_path / "eventos")
+    )
+    publicados = arquivador.carregar_publicados()
+
+    [eventos] = publicados.values()
+    assert [ev.titulo for ev in eventos] == ["versão principal"]
+
+
+# ---------------------------------------------------------
+# Arquivos por evento (eventos/<id>.json)
+# ---------------------------------------------------------
+def evento_de(numero, data):
+    return {
+        **evento(f"evento {numero}"),
+        "link_evento": f"https://funcultural.portovelho.ro.gov.br/artigo/{numero}/evento-{numero}",
+        "data_exibicao": data,
+    }
+
+
+def ids_na_pasta(pasta):
+    return {nome[:-len(".json")] for nome in os.listdir(pasta) if nome.endswith(".json")}
+
+
+def test_um_arquivo_por_evento_publicado(tmp_path):
+    atual = evento_de(1, f"01/01/{datetime.now().year}")
+    antigo = evento_de(2, "01/01/2020")
+    gravar(tmp_path / "eventos.json", [atual, antigo])
+
+    arquivador = ArquivadorEventos(
+        caminho_principal=str(tmp_path / "eventos.json"),
+        pasta_arquivo=str(tmp_path / "arquivo"),
+        pasta_eventos=str(tmp_path / "eventos")
+    )
+    arquivador.arquivar()
+
+    # mesmo id de eventos.json/eventos_index.json, inclusive para os arquivados
+    publicados = codec.carregar(tmp_path / "eventos.json")
+    publicados += codec.carregar(tmp_path / "arquivo" / "eventos_de_2020.json")
+    assert ids_na_pasta(tmp_path / "eventos") == {gerar_id_evento(ev) for ev in publicados}
+
+    for ev in publicados:
+        caminho = tmp_path / "eventos" / f"{gerar_id_evento(ev)}.json"
+        assert caminho.read_bytes() == codec.dumps_bytes(ev, ordenar=True)
+
+
+def test_arquivos_iguais_nao_sao_regravados(tmp_path):
+    pasta = tmp_path / "eventos"
+    eventos = [evento_de(1, "01/01/2024"), evento_de(2, "01/01/2024")]
+
+    assert salvar_eventos_individuais(eventos, str(pasta)) == (2, 0, 0)
+
+    alterado = {**eventos[1], "titulo": "título novo"}
+    assert salvar_eventos_individuais([eventos[0], alterado], str(pasta)) == (1, 1, 0)
+    assert codec.carregar(pasta / f"{gerar_id_evento(alterado)}.json")["titulo"] == "título novo"
+
+
+def test_evento_que_saiu_tem_o_arquivo_apagado(tmp_path):
+    pasta = tmp_path / "eventos"
+    fica, sai = evento_de(1, "01/01/2024"), evento_de(2, "01/01/2024")
+    salvar_eventos_individuais([fica, sai], str(pasta))
+    (pasta / "LEIAME.txt").write_text("não é de evento")
+
+    assert salvar_eventos_individuais([fica], str(pasta)) == (0, 1, 1)
+    assert ids_na_pasta(pasta) == {gerar_id_evento(fica)}
+    assert (pasta / "LEIAME.txt").exists()
+
+
+def test_arquivo_por_ano_antigo_continua_publicado(tmp_path):
+    # eventos_de_2019.json não é regravado por esta coleta, mas segue
+    # publicado: os arquivos dos eventos dele não podem ser apagados
+    pasta_arquivo = tmp_path / "arquivo"
+    pasta_arquivo.mkdir()
+    antigo = evento_de(3, "01/01/2019")
+    gravar(pasta_arquivo / "eventos_de_2019.json", [antigo])
+    gravar(tmp_path / "eventos.json", [evento_de(1, f"01/01/{datetime.now().year}")])
+
+    arquivador = ArquivadorEventos(
+        caminho_principal=str(tmp_path / "eventos.json"),
+        pasta_arquivo=str(pasta_arquivo),
+        pasta_eventos=str(tmp_path / "eventos")
+    )
+    arquivador.arquivar()
+
+    assert gerar_id_evento(antigo) in ids_na_pasta(tmp_path / "eventos")
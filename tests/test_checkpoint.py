@@ -0,0 +1,155 @@
+"""
+Checkpoint JSONL da coleta: deduplicação dos eventos e retomada
+de uma coleta interrompida.
+"""
+
+import json
+
+import pytest
+
+from scraping.checkpoint import CheckpointJSONL
+from scraping.lite import CheckpointHidratacao
+from scraping.runner import coletar_com_checkpoint
+from tests.test_funcultural import FonteExemplo, FonteFunculturalTeste, paginas_da_fonte
+
+
+def evento(link, titulo="Evento"):
+    return {
+        "titulo": titulo,
+        "tag_evento": "TAG",
+        "blocos_conteudo": [],
+        "imagem_url": "",
+        "link_evento": link,
+        "fonte": "Funcultural",
+        "data_exibicao": "há 1 dia",
+    }
+
+
+GRAFIAS = [
+    "https://funcultural.portovelho.ro.gov.br/artigo/10/titulo",
+    "http://funcultural.portovelho.ro.gov.br/artigo/10/titulo/",
+    "https://FUNCULTURAL.portovelho.ro.gov.br:443/artigo/10/titulo-editado#topo",
+]
+
+
+def test_eventos_deduplicados_pela_chave_canonica(tmp_path):
+    checkpoint = CheckpointJSONL(str(tmp_path / "checkpoint.jsonl"))
+    checkpoint.iniciar()
+    for card, link in enumerate(GRAFIAS):
+        checkpoint.registrar("funcultural", 1, card, evento(link, f"versão {card}"))
+    checkpoint.registrar("funcultural", 1, 3, evento("https://funcultural.portovelho.ro.gov.br/artigo/11/outro"))
+    checkpoint.fechar()
+
+    eventos = list(checkpoint.eventos())
+
+    assert [ev.titulo for ev in eventos] == ["versão 0", "Evento"]
+
+
+def test_checkpoint_da_hidratacao_deduplica_igual(tmp_path):
+    checkpoint = CheckpointHidratacao(str(tmp_path / "hidratacao.jsonl"))
+    checkpoint.iniciar()
+    for link in GRAFIAS:
+        checkpoint.registrar_link("funcultural", link, evento(link))
+    checkpoint.fechar()
+
+    assert len(list(checkpoint.eventos())) == 1
+    assert len(checkpoint.links()) == 1
+
+
+# ---------------------------------------------------------
+# Retomada de um checkpoint parcial
+# ---------------------------------------------------------
+def gravar_linhas(caminho, registros, final=""):
+    with open(caminho, "w", encoding="utf-8") as f:
+        for registro in registros:
+            f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        f.write(final)
+
+
+def test_proxima_posicao(tmp_path):
+    caminho = tmp_path / "checkpoint.jsonl"
+    checkpoint = CheckpointJSONL(str(caminho))
+
+    # sem arquivo: do começo
+    assert checkpoint.proxima_posicao("funcultural") == (1, 0)
+
+    gravar_linhas(caminho, [
+        {"fonte": "funcultural", "pagina": 1, "card": 0, "evento": evento(GRAFIAS[0])},
+        {"fonte": "exemplo", "pagina": 1, "card": 0, "evento": None},
+        {"fonte": "funcultural", "pagina": 1, "card": 1, "evento": None},
+        {"fonte": "funcultural", "pagina": 2, "card": 0, "evento": None},
+        {"fonte": "exemplo", "pagina": 1, "card": 1, "evento": None},
+        {"fonte": "exemplo", "concluida": True},
+    ], final='{"fonte": "funcultural", "pagina": 2, "ca')
+
+    # a linha truncada pela falha é ignorada
+    assert checkpoint.proxima_posicao("funcultural") == (2, 1)
+    assert checkpoint.proxima_posicao("exemplo") is None
+    assert checkpoint.proxima_posicao("outra") == (1, 0)
+
+
+def test_checkpoint_sem_fonte_e_da_funcultural(tmp_path):
+    # checkpoints anteriores ao suporte a várias fontes
+    caminho = tmp_path / "checkpoint.jsonl"
+    gravar_linhas(caminho, [{"pagina": 3, "card": 4, "evento": evento(GRAFIAS[0])}])
+    checkpoint = CheckpointJSONL(str(caminho))
+
+    assert checkpoint.proxima_posicao() == (3, 5)
+    assert checkpoint.proxima_posicao("funcultural") == (3, 5)
+    assert [ev.link_evento for ev in checkpoint.eventos()] == [GRAFIAS[0]]
+
+
+@pytest.mark.parametrize("conteudo, cards", [
+    ("", [1]),
+    ('{"fonte": "func', [1]),
+    ('{"fonte": "funcultural", "pagina": 1, "card": 0, "evento": null}\n', [0, 1]),
+    ('{"fonte": "funcultural", "pagina": 1, "card": 0, "evento": null}\n{"fonte": "func', [0, 1]),
+])
+def test_reabrir_descarta_a_linha_incompleta(tmp_path, conteudo, cards):
+    caminho = tmp_path / "checkpoint.jsonl"
+    caminho.write_text(conteudo, encoding="utf-8")
+    checkpoint = CheckpointJSONL(str(caminho))
+
+    checkpoint.reabrir()
+    checkpoint.registrar("funcultural", 1, 1, None)
+    checkpoint.fechar()
+
+    linhas = caminho.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(linha)["card"] for linha in linhas] == cards
+
+
+def test_retomar_coleta_interrompida(tmp_path, reproduzir, listagem_html, artigo_html):
+    fontes = [FonteFunculturalTeste(), FonteExemplo()]
+    paginas = {}
+    for fonte in fontes:
+        paginas.update(paginas_da_fonte(fonte, listagem_html, artigo_html))
+    transporte = reproduzir(paginas)
+
+    # coleta completa, usada como referência
+    completo = coletar_com_checkpoint(checkpoint=CheckpointJSONL(str(tmp_path / "completo.jsonl")), fontes=fontes)
+    registros = list(completo._registros())
+    esperados = [ev.link_evento for ev in completo.eventos()]
+
+    # a falha veio depois do primeiro card da Funcultural; a outra fonte já tinha terminado
+    parcial = [r for r in registros if r["fonte"] == "exemplo"]
+    parcial += [r for r in registros if r["fonte"] == "funcultural" and r.get("card") == 0]
+    caminho = tmp_path / "parcial.jsonl"
+    gravar_linhas(caminho, parcial, final='{"fonte": "funcultural", "pag')
+
+    pedidos = []
+    obter = transporte.obter
+    transporte.obter = lambda url, headers=None: pedidos.append(url) or obter(url, headers)
+
+    checkpoint = coletar_com_checkpoint(retomar=True, checkpoint=CheckpointJSONL(str(caminho)), fontes=fontes)
+
+    # só o que faltava: a listagem da página 1, o segundo artigo e a página 2
+    artigos = [url for url in paginas if "/artigo/" in url]
+    assert all(not url.startswith(FonteExemplo.url_base) for url in pedidos)
+    assert not [url for url in pedidos if "/artigo/52635/" in url]
+    assert [url for url in pedidos if url in artigos] == [
+        url for url in artigos if url.startswith(fontes[0].url_base) and "/artigo/52471/" in url
+    ]
+
+    assert checkpoint.proxima_posicao("funcultural") is None
+    assert checkpoint.proxima_posicao("exemplo") is None
+    assert [ev.link_evento for ev in checkpoint.eventos()] == esperados
@@ -0,0 +1,65 @@
+"""
+A CLI (scraper.py) em sincronia com os módulos e com o script
+de orçamento de tempo de import.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+import scraper
+from scraping import transport
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def carregar_verificador():
+    caminho = os.path.join(RAIZ, "scripts", "verificar_importtime.py")
+    spec = importlib.util.spec_from_file_location("verificar_importtime", caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def test_transportes_da_cli():
+    assert sorted(scraper.TRANSPORTES) == sorted(transport.TRANSPORTES)
+
+
+def test_cada_comando_tem_funcao():
+    for nome in scraper.COMANDOS:
+        assert callable(getattr(scraper, f"comando_{nome}", None)), nome
+
+
+def test_orcamentos_de_importtime():
+    verificador = carregar_verificador()
+    comandos = verificador.modulos_dos_comandos()
+
+    assert set(comandos) == set(verificador.ORCAMENTOS)
+    assert comandos["--atualizar"] == ("scraping.images", "scraping.runner", "scraping.storage")
+
+    for modulos in comandos.values():
+        for modulo in modulos:
+            assert importlib.util.find_spec(modulo) is not None, modulo
+
+
+@pytest.mark.parametrize("comando", ["--worker", "--coordenar"])
+def test_gravacao_recusada_na_coleta_distribuida(tmp_path, comando):
+    gravacao = tmp_path / "gravacao.jsonl"
+
+    resultado = subprocess.run(
+        [
+            sys.executable, os.path.join(RAIZ, "scraper.py"), comando,
+            "--transporte", "gravar", "--gravacao", str(gravacao),
+            "--fila", str(tmp_path / "fila.sqlite")
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True
+    )
+
+    assert resultado.returncode == 2
+    assert "--transporte gravar" in resultado.stderr
+    assert not gravacao.exists()
@@ -0,0 +1,77 @@
+"""
+Codec JSON: mesma saída, byte a byte, que json.dumps(..., ensure_ascii=False,
+indent=2), com e sem orjson.
+"""
+
+import json
+
+import pytest
+
+from scraping import codec
+from scraping.models import Evento, para_json
+
+EVENTO = {
+    "titulo": "Festival de Verão — “Arraial Flor do Maracujá” 🎉",
+    "tag_evento": "Música",
+    "blocos_conteudo": [
+        {"type": "SUBTITLE", "content": "Programação"},
+        {"type": "PARAGRAPH", "content": "Sábado, 20h: <b>Banda</b> & convidados\n\"entrada\" gratuita \\ 50%"},
+        {"type": "IMAGE_URL", "content": "https://funcultural.portovelho.ro.gov.br/uploads/a%20b.jpg"},
+    ],
+    "imagem_url": "/uploads/capa.jpg",
+    "link_evento": "https://funcultural.portovelho.ro.gov.br/artigo/52635/festival",
+    "fonte": "funcultural",
+    "data_exibicao": "há 2 dias",
+}
+
+# Eventos como no eventos.json, mais um arquivo de índice com outros tipos
+DADOS = [
+    [Evento.de_dict(EVENTO), Evento.de_dict({**EVENTO, "tag_evento": None, "blocos_conteudo": []})],
+    {"zeta": 1, "alfa": [True, False, None], "meio": {"b": "", "a": -(2 ** 40)}, "vazio": {}, "lista": []},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        if codec.orjson is None:
+            pytest.importorskip("orjson")
+            import orjson
+            monkeypatch.setattr(codec, "orjson", orjson)
+    else:
+        monkeypatch.setattr(codec, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("dados", DADOS)
+@pytest.mark.parametrize("ordenar", [False, True])
+def test_mesma_saida_que_o_json(backend, dados, ordenar):
+    esperado = json.dumps(
+        dados, ensure_ascii=False, indent=2, sort_keys=ordenar, default=para_json
+    ).encode("utf-8")
+
+    assert codec.dumps_bytes(dados, ordenar) == esperado
+    assert codec.loads(codec.dumps_bytes(dados, ordenar)) == json.loads(esperado)
+
+
+def test_inteiro_grande_volta_ao_json(backend):
+    dados = {"n": 2 ** 70}
+
+    assert codec.dumps_bytes(dados) == json.dumps(dados, indent=2).encode("utf-8")
+
+
+def test_surrogate_solto(backend):
+    dados = {"titulo": "ok \ud800 ç"}
+
+    saida = codec.dumps_bytes(dados)
+
+    assert saida == b'{\n  "titulo": "ok \\ud800 \\u00e7"\n}'
+    assert codec.loads(saida) == dados
+
+
+def test_gravar_e_carregar(backend, tmp_path):
+    caminho = tmp_path / "eventos.json"
+
+    codec.gravar(DADOS[0], caminho, ordenar=True)
+
+    assert codec.carregar(caminho) == json.loads(json.dumps(DADOS[0], default=para_json))
@@ -0,0 +1,55 @@
+"""
+Resolução da data dos eventos (arquivamento por ano e mês).
+"""
+
+from datetime import datetime
+
+from scraping.date_extractor import extrair_datas, resolver_data_evento
+
+AGORA = datetime(2025, 12, 12, 10, 0)
+
+
+def blocos(texto):
+    return [{"type": "PARAGRAPH", "content": f"<p>{texto}</p>"}]
+
+
+def test_extrair_datas():
+    assert extrair_datas("De 10/03/2024 até 5 de abril de 2024") == [
+        datetime(2024, 3, 10),
+        datetime(2024, 4, 5),
+    ]
+
+
+def test_data_historica_no_conteudo_nao_vence_a_relativa():
+    data = resolver_data_evento(
+        "há 2 meses",
+        blocos("A praça, inaugurada em 12 de abril de 1848, foi reformada."),
+        AGORA
+    )
+    assert data == datetime(2025, 10, 12, 10, 0)
+
+
+def test_data_do_conteudo_dentro_da_janela_da_relativa():
+    data = resolver_data_evento(
+        "há 2 meses",
+        blocos("Fundada em 1914. A entrega foi em 20/09/2025."),
+        AGORA
+    )
+    assert data == datetime(2025, 9, 20)
+
+
+def test_relativa_em_anos():
+    data = resolver_data_evento("há 1 ano", blocos("Lei de 03/06/2008."), AGORA)
+    assert data.year == 2024
+
+
+def test_sem_data_no_card_usa_o_conteudo():
+    assert resolver_data_evento("Sem data", blocos("Dia 12/04/2024."), AGORA) == datetime(2024, 4, 12)
+
+
+def test_data_explicita_no_card():
+    assert resolver_data_evento("01/02/2023", blocos("Dia 12/04/2024."), AGORA) == datetime(2023, 2, 1)
+
+
+def test_sem_data_nenhuma():
+    assert resolver_data_evento("", None, AGORA) == AGORA
@@ -0,0 +1,142 @@
+"""
+Adaptador da Funcultural e coleta com várias fontes, a partir das
+páginas salvas em tests/fixtures/.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraping.runner import ColetaIncompleta, scrape_all
+from scraping.sources import FonteFuncultural
+
+LINK_ARTIGO = (
+    "https://funcultural.portovelho.ro.gov.br/artigo/52635/"
+    "folia-a-vista-reuniao-no-predio-do-relogio-define-ultimos-ajustes-para-o-carnaval-2026"
+)
+
+
+class FonteExemplo(FonteFuncultural):
+    """
+    Segunda fonte com o mesmo HTML da Funcultural em outro host.
+    """
+
+    chave = "exemplo"
+    nome = "Exemplo"
+    url_base = "https://exemplo.test"
+    url_listagem = "https://exemplo.test/noticias?page={pagina}"
+    intervalo = 0
+
+
+class FonteFunculturalTeste(FonteFuncultural):
+    intervalo = 0
+
+
+def soup(html):
+    return BeautifulSoup(html, "html.parser")
+
+
+# ---------------------------------------------------------
+# Páginas servidas pela reprodução para uma fonte
+# ---------------------------------------------------------
+def paginas_da_fonte(fonte, listagem_html, artigo_html):
+    """
+    Página 1 da listagem (com os links no host da fonte), página 2
+    sem cards (fim da listagem) e o artigo para cada card.
+    """
+    listagem = listagem_html.replace("https://funcultural.portovelho.ro.gov.br", fonte.url_base)
+
+    paginas = {
+        fonte.url_pagina(1): listagem,
+        fonte.url_pagina(2): "<html><body></body></html>",
+    }
+    for bloco in fonte.extrair_cards(soup(listagem)):
+        paginas[fonte.extrair_card(bloco)["link_evento"]] = artigo_html
+
+    return paginas
+
+
+# ---------------------------------------------------------
+# Extratores
+# ---------------------------------------------------------
+def test_extrair_cards(listagem_html):
+    cards = FonteFuncultural().extrair_cards(soup(listagem_html))
+    assert len(cards) == 2
+
+
+def test_extrair_card(listagem_html):
+    fonte = FonteFuncultural()
+    card = fonte.extrair_card(fonte.extrair_cards(soup(listagem_html))[0])
+
+    assert card == {
+        "titulo": "Reunião no Prédio do Relógio define últimos ajustes para o Carnaval 2026",
+        "tag_evento": "FOLIA À VISTA",
+        "imagem_url": "/uploads/_thumbs/editor/capas/2025/12/1765480658img-3719.JPG",
+        "link_evento": LINK_ARTIGO,
+        "data_exibicao": "há 22 horas",
+    }
+
+
+def test_extrair_card_sem_link():
+    bloco = soup('<div class="resultado-pesquisa"><div class="titulo-noticia-pesquisa">x</div></div>').div
+    assert FonteFuncultural().extrair_card(bloco) is None
+
+
+def test_tem_proxima_pagina(listagem_html):
+    fonte = FonteFuncultural()
+    pagina = soup(listagem_html)
+
+    assert fonte.tem_proxima_pagina(pagina, 1)
+    assert not fonte.tem_proxima_pagina(pagina, 27)
+
+
+def test_extrair_detalhes(artigo_html):
+    blocos = FonteFuncultural().extrair_detalhes(soup(artigo_html))
+
+    assert blocos
+    assert blocos[0].tipo == "SUBTITLE"
+    assert "Encontro alinhou regras e responsabilidades" in blocos[0].conteudo
+
+
+def test_extrair_detalhes_sem_artigo():
+    assert FonteFuncultural().extrair_detalhes(soup("<html><body></body></html>")) == []
+
+
+# ---------------------------------------------------------
+# Coleta com duas fontes (reprodução, sem rede)
+# ---------------------------------------------------------
+def test_scrape_all_junta_as_fontes(reproduzir, listagem_html, artigo_html):
+    fontes = [FonteFunculturalTeste(), FonteExemplo()]
+
+    paginas = {}
+    for fonte in fontes:
+        paginas.update(paginas_da_fonte(fonte, listagem_html, artigo_html))
+    reproduzir(paginas)
+
+    eventos = list(scrape_all(fontes=fontes))
+
+    assert len(eventos) == 4
+    assert sorted(ev.fonte for ev in eventos) == ["Exemplo", "Exemplo", "Funcultural", "Funcultural"]
+
+    # cada fonte mantém a ordem da própria listagem
+    for fonte in fontes:
+        links = [ev.link_evento for ev in eventos if ev.fonte == fonte.nome]
+        assert links[0].startswith(f"{fonte.url_base}/artigo/52635/")
+        assert links[1].startswith(f"{fonte.url_base}/artigo/52471/")
+
+
+def test_scrape_all_falha_de_uma_fonte(reproduzir, listagem_html, artigo_html):
+    fontes = [FonteFunculturalTeste(), FonteExemplo()]
+
+    # sem a página 2 da Funcultural: a outra fonte termina, depois vem o erro
+    paginas = {}
+    for fonte in fontes:
+        paginas.update(paginas_da_fonte(fonte, listagem_html, artigo_html))
+    del paginas[fontes[0].url_pagina(2)]
+    reproduzir(paginas)
+
+    eventos = []
+    with pytest.raises(ColetaIncompleta, match="página 2"):
+        for ev in scrape_all(fontes=fontes):
+            eventos.append(ev)
+
+    assert len(eventos) == 4
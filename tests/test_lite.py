@@ -0,0 +1,51 @@
+"""
+Índice da coleta leve e hidratação: a imagem do evento hidratado é
+a mesma da coleta completa (URL como está no card).
+"""
+
+from bs4 import BeautifulSoup
+
+from scraping.images import RegistroImagens
+from scraping.lite import CheckpointHidratacao, Hidratador, imagem_do_card, registro_indice
+from scraping.runner import process_card
+from scraping.sources import FonteFuncultural
+
+IMAGEM_CARD = "/uploads/_thumbs/editor/capas/2025/12/1765480658img-3719.JPG"
+
+
+class FonteTeste(FonteFuncultural):
+    intervalo = 0
+
+
+def primeiro_card(listagem_html, fonte):
+    soup = BeautifulSoup(listagem_html, "html.parser")
+    return fonte.extrair_card(fonte.extrair_cards(soup)[0])
+
+
+def test_registro_indice_guarda_as_duas_urls(listagem_html):
+    fonte = FonteTeste()
+    registro = registro_indice(primeiro_card(listagem_html, fonte), fonte)
+
+    assert registro["imagem_url"] == "https://funcultural.portovelho.ro.gov.br" + IMAGEM_CARD
+    assert registro["imagem_card"] == IMAGEM_CARD
+
+
+def test_hidratacao_igual_a_coleta_completa(tmp_path, reproduzir, listagem_html, artigo_html):
+    fonte = FonteTeste()
+    card = primeiro_card(listagem_html, fonte)
+    reproduzir({card["link_evento"]: artigo_html})
+
+    hidratador = Hidratador(fontes=[fonte], checkpoint=CheckpointHidratacao(str(tmp_path / "h.jsonl")))
+    hidratado = hidratador.hidratar(registro_indice(card, fonte), RegistroImagens())
+    coletado = process_card(card, RegistroImagens(), fonte)
+
+    assert hidratado.imagem_url == IMAGEM_CARD
+    assert hidratado.para_dict() == coletado.para_dict()
+
+
+def test_imagem_de_registro_antigo():
+    fonte = FonteTeste()
+    antigo = {"imagem_url": "https://funcultural.portovelho.ro.gov.br" + IMAGEM_CARD}
+
+    assert imagem_do_card(antigo, fonte) == IMAGEM_CARD
+    assert imagem_do_card({"imagem_url": "https://cdn.test/a.jpg"}, fonte) == "https://cdn.test/a.jpg"
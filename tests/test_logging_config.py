@@ -0,0 +1,40 @@
+"""
+Logs em JSON: a exceção chega ao arquivo no campo "excecao".
+"""
+
+import json
+import logging
+
+import pytest
+
+from scraping import logging_config
+
+
+@pytest.fixture
+def log_em_arquivo(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_config, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(logging_config, "LOG_FILE", str(tmp_path / "scraper.log"))
+
+    handlers, nivel = logging.root.handlers[:], logging.root.level
+    logging_config.configurar_logging()
+
+    yield tmp_path / "scraper.log"
+
+    logging_config.encerrar_logging()
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(nivel)
+
+
+def test_excecao_no_json(log_em_arquivo):
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logging.exception("❌ Falha ao processar %s", "evento")
+    logging_config.encerrar_logging()
+
+    linhas = [json.loads(linha) for linha in log_em_arquivo.read_text(encoding="utf-8").splitlines()]
+    [registro] = [r for r in linhas if r["nivel"] == "ERROR"]
+
+    assert registro["mensagem"] == "❌ Falha ao processar evento"
+    assert registro["excecao"].startswith("Traceback")
+    assert "ZeroDivisionError" in registro["excecao"]
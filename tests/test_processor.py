@@ -0,0 +1,114 @@
+"""
+Sanitização do HTML dos blocos: o que é removido, o que é desembrulhado
+e o que sobrevive (marcação permitida e links absolutos).
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraping.models import PARAGRAFO, Bloco
+from scraping.processor import TAGS_REMOVIDAS, compactar_html, limpar_bloco, sanitizar_elemento
+
+BASE = "https://funcultural.portovelho.ro.gov.br"
+
+
+def sanitizar(html):
+    elem = BeautifulSoup(f"<div>{html}</div>", "html.parser").div
+    sanitizar_elemento(elem)
+    return compactar_html(elem.decode_contents())
+
+
+# ---------------------------------------------------------
+# Removido com o conteúdo
+# ---------------------------------------------------------
+def test_scripts_e_estilos_saem_com_o_conteudo():
+    html = "<p>Oi<script>alert(1)</script><style>p{color:red}</style></p><noscript>ative o JS</noscript>"
+
+    assert sanitizar(html) == "<p>Oi</p>"
+
+
+@pytest.mark.parametrize("tag", sorted(TAGS_REMOVIDAS - {"input", "embed"}))
+def test_tags_removidas(tag):
+    assert sanitizar(f"<p>fica</p><{tag}>some</{tag}>") == "<p>fica</p>"
+
+
+def test_formularios_e_vazias():
+    html = '<form><input name="q"><button>Enviar</button></form><embed src="/a.swf"><p>fica</p>'
+
+    assert sanitizar(html) == "<p>fica</p>"
+
+
+# ---------------------------------------------------------
+# Desembrulhado (a tag sai, o texto fica)
+# ---------------------------------------------------------
+def test_tags_fora_da_lista_sao_desembrulhadas():
+    html = '<div><section><p>Texto <span style="x">com</span> <font color="red">fonte</font></p></section></div>'
+
+    assert sanitizar(html) == "<p>Texto com fonte</p>"
+
+
+def test_atributos_e_handlers_saem():
+    html = '<p onclick="x()" class="a" style="color:red" id="i">Texto</p>'
+
+    assert sanitizar(html) == "<p>Texto</p>"
+
+
+def test_links_perigosos_viram_texto():
+    html = '<p><a href="javascript:alert(1)" onmouseover="x()">clique</a> <a href=" ">vazio</a></p>'
+
+    assert sanitizar(html) == "<p>clique vazio</p>"
+
+
+def test_imagem_com_data_uri_perde_o_src():
+    assert sanitizar('<p><img src="data:image/png;base64,AAA" alt="x"></p>') == '<p><img alt="x"/></p>'
+
+
+# ---------------------------------------------------------
+# Mantido
+# ---------------------------------------------------------
+def test_links_ficam_absolutos():
+    html = '<p><a href="/artigo/1" target="_blank" rel="nofollow">ok</a> <a href="#topo">topo</a></p>'
+
+    assert sanitizar(html) == f'<p><a href="{BASE}/artigo/1">ok</a> <a href="#topo">topo</a></p>'
+
+
+def test_imagem_guarda_dimensoes_do_style():
+    html = '<p><img src="/uploads/a.jpg" onerror="x()" style="width: 300px; height: 200px" class="c" alt="Foto"></p>'
+
+    assert sanitizar(html) == f'<p><img alt="Foto" height="200" src="{BASE}/uploads/a.jpg" width="300"/></p>'
+
+
+def test_iframe_mantem_atributos_permitidos():
+    html = '<iframe src="https://www.youtube.com/embed/x" width="560" height="315" allowfullscreen frameborder="0" onload="x()"></iframe>'
+
+    assert sanitizar(html) == '<iframe allowfullscreen="" height="315" src="https://www.youtube.com/embed/x" width="560"></iframe>'
+
+
+def test_marcacao_permitida_sobrevive():
+    html = (
+        "<h2>Título</h2><ul><li><strong>a</strong> <em>b</em> <b>c</b> <i>d</i> <u>e</u></li></ul>"
+        "<ol><li>f</li></ol><blockquote>g</blockquote>"
+        '<table><thead><tr><th rowspan="2">h</th></tr></thead>'
+        '<tbody><tr><td colspan="2" class="x">i</td></tr></tbody></table>'
+    )
+
+    assert sanitizar(html) == (
+        "<h2>Título</h2><ul><li><strong>a</strong> <em>b</em> <b>c</b> <i>d</i> <u>e</u></li></ul>"
+        "<ol><li>f</li></ol><blockquote>g</blockquote>"
+        '<table><thead><tr><th rowspan="2">h</th></tr></thead>'
+        '<tbody><tr><td colspan="2">i</td></tr></tbody></table>'
+    )
+
+
+def test_formatacao_vazia_e_br_sobrando():
+    assert sanitizar("<p><strong> </strong></p><p>a<br><br>b<br></p>") == "<p>a<br/>b</p>"
+
+
+def test_limpar_bloco_atualiza_o_conteudo():
+    html = '<p style="x">Show <script>x()</script><a href="/agenda">agenda</a></p>'
+    elem = BeautifulSoup(html, "html.parser")
+    bloco = Bloco(PARAGRAFO, html)
+
+    limpar_bloco(bloco, elem)
+
+    assert bloco.conteudo == f'<p>Show <a href="{BASE}/agenda">agenda</a></p>'
@@ -0,0 +1,212 @@
+"""
+API local: endpoints, ETag/304, gzip guardado com o corpo e recarga
+dos índices sem misturar versão e corpo de cargas diferentes.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from scraping import server
+from scraping.archiver import ArquivadorEventos
+from scraping.server import DadosIndice, IndiceEventos, ManipuladorAPI
+from scraping.storage import gerar_id_evento
+
+
+def evento(numero, titulo, data="10/03/2024", tag="Música", texto="Show na praça"):
+    return {
+        "titulo": titulo,
+        "tag_evento": tag,
+        "blocos_conteudo": [{"type": "PARAGRAPH", "content": f"<p>{texto}</p>"}],
+        "imagem_url": "/uploads/a.jpg",
+        "link_evento": f"https://funcultural.portovelho.ro.gov.br/artigo/{numero}/evento",
+        "fonte": "Funcultural",
+        "data_exibicao": data,
+    }
+
+
+def gravar(caminho, eventos):
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(eventos, f, ensure_ascii=False)
+
+
+class Cliente:
+    def __init__(self, porta):
+        self.porta = porta
+
+    def get(self, caminho, **cabecalhos):
+        conn = http.client.HTTPConnection("127.0.0.1", self.porta, timeout=5)
+        try:
+            conn.request("GET", caminho, headers={k.replace("_", "-"): v for k, v in cabecalhos.items()})
+            resposta = conn.getresponse()
+            return resposta.status, dict(resposta.getheaders()), resposta.read()
+        finally:
+            conn.close()
+
+    def json(self, caminho):
+        status, _, corpo = self.get(caminho)
+        return status, json.loads(corpo)
+
+
+@pytest.fixture
+def publicados(tmp_path):
+    gravar(tmp_path / "eventos.json", [
+        evento(1, "Roda de samba", texto="Apresentação na Praça das Caixas d'Água"),
+        evento(2, "Espetáculo infantil", data="05/04/2024", tag="Teatro"),
+    ])
+    (tmp_path / "arquivo").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def indice(publicados, monkeypatch):
+    # sem espera entre verificações do disco
+    monkeypatch.setattr(server, "INTERVALO_RECARGA", 0)
+    monkeypatch.setattr(server, "API_IMAGES_FILE", str(publicados / "images.json"))
+
+    indice = IndiceEventos(ArquivadorEventos(
+        caminho_principal=str(publicados / "eventos.json"),
+        pasta_arquivo=str(publicados / "arquivo"),
+        pasta_eventos=str(publicados / "eventos")
+    ))
+    indice.recarregar_se_mudou()
+    return indice
+
+
+@pytest.fixture
+def cliente(indice):
+    manipulador = type("Manipulador", (ManipuladorAPI,), {"indice": indice})
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), manipulador)
+    thread = threading.Thread(target=servidor.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    yield Cliente(servidor.server_address[1])
+
+    servidor.shutdown()
+    servidor.server_close()
+
+
+# ---------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------
+def test_listagem_e_filtros(cliente):
+    status, dados = cliente.json("/api/eventos")
+    assert status == 200
+    assert dados["total"] == 2
+    assert [ev["titulo"] for ev in dados["eventos"]] == ["Roda de samba", "Espetáculo infantil"]
+
+    assert cliente.json("/api/eventos?tag=MUSICA")[1]["total"] == 1
+    assert cliente.json("/api/eventos?mes=2024-04")[1]["eventos"][0]["titulo"] == "Espetáculo infantil"
+    assert cliente.json("/api/eventos?ano=2024&q=praca")[1]["eventos"][0]["titulo"] == "Roda de samba"
+    assert cliente.json("/api/eventos?q=inexistente")[1]["total"] == 0
+
+    paginado = cliente.json("/api/eventos?por_pagina=1&pagina=2")[1]
+    assert (paginado["paginas"], [ev["titulo"] for ev in paginado["eventos"]]) == (2, ["Espetáculo infantil"])
+
+
+def test_parametros_invalidos(cliente):
+    assert cliente.json("/api/eventos?pagina=0")[0] == 400
+    assert cliente.json("/api/eventos?mes=2024-4")[0] == 400
+    assert cliente.json("/api/nada")[0] == 404
+
+
+def test_evento_por_id(cliente):
+    ev_id = gerar_id_evento(evento(1, ""))
+
+    status, dados = cliente.json(f"/api/eventos/{ev_id}")
+    assert status == 200
+    assert (dados["id"], dados["titulo"], dados["mes"]) == (ev_id, "Roda de samba", "2024-03")
+
+    assert cliente.json("/api/eventos/" + "0" * 40)[0] == 404
+
+
+def test_tags_e_meses(cliente):
+    tags = cliente.json("/api/tags")[1]
+    assert [(t["tag"], t["rotulo"]) for t in tags["tags"]] == [("musica", "Música"), ("teatro", "Teatro")]
+
+    meses = cliente.json("/api/meses")[1]
+    assert meses["meses"] == [{"mes": "2024-04", "eventos": 1}, {"mes": "2024-03", "eventos": 1}]
+
+
+# ---------------------------------------------------------
+# ETag, 304 e gzip
+# ---------------------------------------------------------
+def test_etag_e_304(cliente):
+    status, cabecalhos, _ = cliente.get("/api/eventos")
+    etag = cabecalhos["ETag"]
+    assert status == 200
+
+    status, cabecalhos, corpo = cliente.get("/api/eventos", If_None_Match=etag)
+    assert (status, cabecalhos["ETag"], corpo) == (304, etag, b"")
+
+    assert cliente.get("/api/eventos", If_None_Match=f"W/{etag}")[0] == 304
+    assert cliente.get("/api/eventos", If_None_Match='"outra"')[0] == 200
+
+
+def test_gzip(cliente, monkeypatch):
+    monkeypatch.setattr(server, "GZIP_MINIMO", 100)
+
+    _, simples, corpo = cliente.get("/api/eventos")
+    status, cabecalhos, comprimido = cliente.get("/api/eventos", Accept_Encoding="gzip")
+
+    assert status == 200
+    assert cabecalhos["Content-Encoding"] == "gzip"
+    assert gzip.decompress(comprimido) == corpo
+    # representações diferentes, ETags diferentes
+    assert cabecalhos["ETag"] == simples["ETag"][:-1] + '-gz"'
+    assert cliente.get("/api/eventos", Accept_Encoding="gzip", If_None_Match=cabecalhos["ETag"])[0] == 304
+
+    # resposta pequena vai sem compressão
+    _, cabecalhos, _ = cliente.get("/api/meses", Accept_Encoding="gzip")
+    assert "Content-Encoding" not in cabecalhos
+
+
+def test_gzip_calculado_uma_vez(cliente, monkeypatch):
+    monkeypatch.setattr(server, "GZIP_MINIMO", 100)
+    chamadas = []
+    compress = gzip.compress
+    monkeypatch.setattr(server.gzip, "compress", lambda *a, **k: chamadas.append(1) or compress(*a, **k))
+
+    for _ in range(3):
+        assert cliente.get("/api/eventos", Accept_Encoding="gzip")[1]["Content-Encoding"] == "gzip"
+
+    assert len(chamadas) == 1
+
+
+# ---------------------------------------------------------
+# Recarga
+# ---------------------------------------------------------
+def test_recarga_troca_versao_e_corpo_juntos(cliente, indice, publicados):
+    _, antes = cliente.json("/api/saude")
+    _, cabecalhos, _ = cliente.get("/api/eventos")
+
+    gravar(publicados / "eventos.json", [evento(3, "Sarau de poesia")])
+    os.utime(publicados / "eventos.json", ns=(1, 1))
+
+    _, depois = cliente.json("/api/saude")
+    assert depois == {"eventos": 1, "versao": indice.dados.versao}
+    assert depois["versao"] != antes["versao"]
+
+    status, novos, corpo = cliente.get("/api/eventos", If_None_Match=cabecalhos["ETag"])
+    assert status == 200
+    assert novos["ETag"] != cabecalhos["ETag"]
+    assert [ev["titulo"] for ev in json.loads(corpo)["eventos"]] == ["Sarau de poesia"]
+
+
+def test_requisicao_usa_uma_unica_carga(indice):
+    # uma recarga no meio da requisição não muda a carga que ela já leu
+    antiga = indice.dados
+    indice.dados = DadosIndice.vazio()
+
+    manipulador = ManipuladorAPI.__new__(ManipuladorAPI)
+    manipulador.path = "/api/saude"
+    status, corpo, _, _ = manipulador.montar_resposta(antiga)
+
+    assert status == 200
+    assert json.loads(corpo) == {"eventos": 2, "versao": antiga.versao}
+    assert isinstance(antiga, tuple)
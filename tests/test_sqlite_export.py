@@ -0,0 +1,152 @@
+"""
+Exportação para SQLite: upsert incremental pelo hash, remoção dos
+eventos que saíram e busca textual (FTS5).
+"""
+
+import sqlite3
+
+import pytest
+
+from scraping.sqlite_export import _remover_ausentes, abrir_banco, exportar_sqlite
+from scraping.storage import gerar_id_evento
+
+
+def evento(numero, titulo, tag="Música", texto="Show na praça"):
+    return {
+        "titulo": titulo,
+        "tag_evento": tag,
+        "blocos_conteudo": [
+            {"type": "PARAGRAPH", "content": f"<p>{texto}</p>"},
+            {"type": "IMAGE_URL", "content": "https://funcultural.portovelho.ro.gov.br/uploads/a.jpg"},
+        ],
+        "imagem_url": "/uploads/a.jpg",
+        "link_evento": f"https://funcultural.portovelho.ro.gov.br/artigo/{numero}/evento",
+        "fonte": "Funcultural",
+        "data_exibicao": "01/01/2024",
+    }
+
+
+@pytest.fixture
+def banco(tmp_path):
+    return str(tmp_path / "db" / "eventos.sqlite")
+
+
+def consultar(caminho, sql, *parametros):
+    conn = sqlite3.connect(caminho)
+    try:
+        return conn.execute(sql, parametros).fetchall()
+    finally:
+        conn.close()
+
+
+def tem_fts(caminho):
+    conn, fts = abrir_banco(caminho)
+    conn.close()
+    return fts
+
+
+# ---------------------------------------------------------
+# Upsert incremental
+# ---------------------------------------------------------
+def test_primeira_exportacao(banco):
+    ev = evento(1, "Roda de samba", tag="  MÚSICA ")
+
+    assert exportar_sqlite({2024: [ev]}, banco) == (1, 0, 0)
+
+    ev_id = gerar_id_evento(ev)
+    assert consultar(banco, "SELECT id, titulo, ano FROM eventos") == [(ev_id, "Roda de samba", 2024)]
+    assert consultar(banco, "SELECT posicao, tipo FROM blocos ORDER BY posicao") == [(0, "PARAGRAPH"), (1, "IMAGE_URL")]
+    assert consultar(banco, "SELECT tag FROM tags") == [("musica",)]
+
+
+def test_evento_inalterado_nao_e_regravado(banco):
+    eventos = {2024: [evento(1, "Roda de samba"), evento(2, "Teatro")]}
+    exportar_sqlite(eventos, banco)
+
+    # uma linha mexida à mão só volta se o evento for regravado
+    conn = sqlite3.connect(banco)
+    with conn:
+        conn.execute("UPDATE eventos SET titulo = 'mexido'")
+    conn.close()
+
+    assert exportar_sqlite(eventos, banco) == (0, 2, 0)
+    assert consultar(banco, "SELECT DISTINCT titulo FROM eventos") == [("mexido",)]
+
+
+def test_evento_alterado_e_regravado(banco):
+    exportar_sqlite({2024: [evento(1, "Roda de samba"), evento(2, "Teatro")]}, banco)
+
+    alterado = evento(1, "Roda de samba", texto="Show adiado")
+    assert exportar_sqlite({2024: [alterado, evento(2, "Teatro")]}, banco) == (1, 1, 0)
+
+    # mudar só o ano também muda o hash
+    assert exportar_sqlite({2023: [alterado], 2024: [evento(2, "Teatro")]}, banco) == (1, 1, 0)
+    assert consultar(banco, "SELECT ano FROM eventos WHERE id = ?", gerar_id_evento(alterado)) == [(2023,)]
+
+
+def test_evento_repetido_entre_anos_vale_o_primeiro(banco):
+    ev = evento(1, "Roda de samba")
+
+    assert exportar_sqlite({2025: [ev], 2024: [evento(1, "Outra versão")]}, banco) == (1, 0, 0)
+    assert consultar(banco, "SELECT titulo, ano FROM eventos") == [("Roda de samba", 2025)]
+
+
+# ---------------------------------------------------------
+# Remoção dos ausentes
+# ---------------------------------------------------------
+def test_evento_que_saiu_e_removido(banco):
+    fica, sai = evento(1, "Roda de samba"), evento(2, "Teatro", tag="Teatro")
+    exportar_sqlite({2024: [fica, sai]}, banco)
+
+    assert exportar_sqlite({2024: [fica]}, banco) == (0, 1, 1)
+
+    sai_id = gerar_id_evento(sai)
+    assert consultar(banco, "SELECT id FROM eventos") == [(gerar_id_evento(fica),)]
+    # blocos e tags saem em cascata
+    assert consultar(banco, "SELECT count(*) FROM blocos WHERE evento_id = ?", sai_id) == [(0,)]
+    assert consultar(banco, "SELECT count(*) FROM tags WHERE evento_id = ?", sai_id) == [(0,)]
+    if tem_fts(banco):
+        assert consultar(banco, "SELECT count(*) FROM eventos_fts WHERE id = ?", sai_id) == [(0,)]
+
+
+def test_remover_ausentes(banco):
+    exportar_sqlite({2024: [evento(1, "a"), evento(2, "b"), evento(3, "c")]}, banco)
+    conn, fts = abrir_banco(banco)
+
+    with conn:
+        removidos = _remover_ausentes(conn, fts, {gerar_id_evento(evento(2, "b"))})
+    conn.close()
+
+    assert removidos == 2
+    assert consultar(banco, "SELECT count(*) FROM eventos") == [(1,)]
+
+
+# ---------------------------------------------------------
+# Busca textual
+# ---------------------------------------------------------
+def buscar(caminho, termo):
+    return {
+        linha[0] for linha in
+        consultar(caminho, "SELECT id FROM eventos_fts WHERE eventos_fts MATCH ?", termo)
+    }
+
+
+def test_busca_textual(banco):
+    if not tem_fts(banco):
+        pytest.skip("SQLite sem FTS5")
+
+    samba = evento(1, "Roda de samba", texto="Apresentação na Praça das Caixas d'Água")
+    teatro = evento(2, "Espetáculo infantil", tag="Teatro", texto="Entrada gratuita")
+    exportar_sqlite({2024: [samba, teatro]}, banco)
+
+    # título, texto dos blocos (sem HTML) e tag; sem diferenciar acentos
+    assert buscar(banco, "samba") == {gerar_id_evento(samba)}
+    assert buscar(banco, "praca") == {gerar_id_evento(samba)}
+    assert buscar(banco, "espetaculo") == {gerar_id_evento(teatro)}
+    assert buscar(banco, "teatro") == {gerar_id_evento(teatro)}
+    assert buscar(banco, "uploads") == set()
+
+    # o índice acompanha a regravação
+    exportar_sqlite({2024: [evento(1, "Roda de choro"), teatro]}, banco)
+    assert buscar(banco, "samba") == set()
+    assert buscar(banco, "choro") == {gerar_id_evento(samba)}
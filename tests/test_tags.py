@@ -0,0 +1,100 @@
+"""
+Tags canônicas e facetas publicadas em tags.json.
+"""
+
+import json
+
+import pytest
+
+from scraping.storage import gerar_id_evento
+from scraping.tags import canonicalizar_tag, gerar_facetas, salvar_facetas
+
+
+@pytest.mark.parametrize("tag, canonica", [
+    # acentos, caixa, pontuação e espaços
+    ("Música", "musica"),
+    ("  São João!! ", "sao joao"),
+    ("Lei Paulo-Gustavo", "lei paulo gustavo"),
+    ("Música/Teatro", "musica/teatro"),
+    # ano no final
+    ("CARNAVAL 2025", "carnaval"),
+    ("Carnaval", "carnaval"),
+    ("2024", "2024"),
+    # sinônimos (depois de tirar acento e ano)
+    ("Festa Julina", "festa junina"),
+    ("Paulo Gustavo 2024", "lei paulo gustavo"),
+    ("Ano Novo", "reveillon"),
+    ("Réveillon", "reveillon"),
+    ("PVH 111 ANOS", "aniversario de porto velho"),
+    # sem significado
+    ("Sem Tag", ""),
+    ("  ", ""),
+    ("", ""),
+    (None, ""),
+])
+def test_canonicalizar_tag(tag, canonica):
+    assert canonicalizar_tag(tag) == canonica
+
+
+def evento(numero, tag):
+    return {
+        "titulo": f"evento {numero}",
+        "tag_evento": tag,
+        "blocos_conteudo": [],
+        "imagem_url": "",
+        "link_evento": f"https://funcultural.portovelho.ro.gov.br/artigo/{numero}/evento",
+        "fonte": "Funcultural",
+        "data_exibicao": "01/01/2024",
+    }
+
+
+EVENTOS_POR_ANO = {
+    2024: [evento(1, "CARNAVAL 2024"), evento(2, "Música"), evento(3, "Sem tag")],
+    2025: [evento(4, "Carnaval 2025"), evento(5, "Carnaval 2025"), evento(6, "Musica"), evento(7, None)],
+}
+
+
+def test_facetas():
+    facetas = gerar_facetas(EVENTOS_POR_ANO)
+
+    assert facetas["quantidade_tags"] == 2
+    assert facetas["total"] == {"carnaval": 3, "musica": 2}
+    assert list(facetas["total"]) == ["carnaval", "musica"]
+    # anos do mais recente para o mais antigo; tags vazias ficam de fora
+    assert facetas["por_ano"] == {
+        "2025": {"carnaval": 2, "musica": 1},
+        "2024": {"carnaval": 1, "musica": 1},
+    }
+    assert list(facetas["por_ano"]) == ["2025", "2024"]
+
+
+def test_rotulo_e_a_forma_mais_frequente():
+    rotulos = gerar_facetas(EVENTOS_POR_ANO)["rotulos"]
+
+    # no empate vale a forma do ano mais recente
+
+    assert rotulos == {"carnaval": "Carnaval 2025", "musica": "Musica"}
+
+
+def test_indice_usa_os_ids_publicados():
+    indice = gerar_facetas(EVENTOS_POR_ANO)["indice"]
+
+    assert indice == {
+        "carnaval": [gerar_id_evento(evento(n, "")) for n in (4, 5, 1)],
+        "musica": [gerar_id_evento(evento(n, "")) for n in (6, 2)],
+    }
+
+
+def test_sem_eventos():
+    assert gerar_facetas({}) == {
+        "quantidade_tags": 0, "total": {}, "por_ano": {}, "rotulos": {}, "indice": {}
+    }
+
+
+def test_salvar_facetas(tmp_path):
+    caminho = tmp_path / "api" / "tags.json"
+    facetas = gerar_facetas(EVENTOS_POR_ANO)
+
+    salvar_facetas(facetas, str(caminho))
+
+    assert json.loads(caminho.read_text(encoding="utf-8")) == facetas
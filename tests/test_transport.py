@@ -0,0 +1,66 @@
+"""
+Gravação e reprodução: o corpo volta com os mesmos bytes e charset.
+"""
+
+import json
+
+from scraping.transport import Resposta, TransporteGravacao, TransporteReproducao
+
+URL = "https://funcultural.portovelho.ro.gov.br/artigo/1"
+HTML_LATIN1 = "<html><body><p>Programação</p></body></html>".encode("latin-1")
+
+
+class TransporteFixo:
+    """
+    Responde sempre com a mesma resposta (no lugar da rede).
+    """
+
+    def __init__(self, resposta):
+        self.resposta = resposta
+
+    def obter(self, url, headers=None):
+        return self.resposta
+
+
+def test_gravacao_guarda_os_bytes(tmp_path):
+    caminho = str(tmp_path / "gravacao.jsonl")
+    resposta = Resposta(200, HTML_LATIN1, {"Content-Type": "text/html; charset=ISO-8859-1"})
+
+    gravacao = TransporteGravacao(caminho, TransporteFixo(resposta))
+    gravacao.obter(URL)
+    gravacao.fechar()
+
+    reproduzida = TransporteReproducao(caminho).obter(URL)
+
+    assert reproduzida.status == 200
+    assert reproduzida.conteudo == HTML_LATIN1
+    assert reproduzida.encoding == "iso8859-1"
+    assert "Programação" in reproduzida.texto
+
+
+def test_gravacao_sem_charset(tmp_path):
+    caminho = str(tmp_path / "gravacao.jsonl")
+
+    gravacao = TransporteGravacao(caminho, TransporteFixo(Resposta(200, HTML_LATIN1, {"Content-Type": "text/html"})))
+    gravacao.obter(URL)
+    gravacao.fechar()
+
+    reproduzida = TransporteReproducao(caminho).obter(URL)
+
+    assert reproduzida.conteudo == HTML_LATIN1
+    assert reproduzida.encoding is None
+
+
+def test_reproducao_le_gravacoes_antigas(tmp_path):
+    caminho = tmp_path / "gravacao.jsonl"
+    caminho.write_text(json.dumps({
+        "url": URL,
+        "status": 200,
+        "headers": {"Content-Type": "text/html; charset=utf-8"},
+        "texto": "<p>Programação</p>"
+    }, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    reproduzida = TransporteReproducao(str(caminho)).obter(URL)
+
+    assert reproduzida.conteudo == "<p>Programação</p>".encode("utf-8")
+    assert reproduzida.encoding == "utf-8"
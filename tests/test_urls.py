@@ -0,0 +1,71 @@
+"""
+URLs canônicas: chave do cache, da deduplicação e do id dos eventos.
+"""
+
+import pytest
+
+from scraping.urls import canonicalizar_url, chave_url, id_artigo
+
+BASE = "https://funcultural.portovelho.ro.gov.br"
+
+
+@pytest.mark.parametrize("url, esperada", [
+    # esquema e host
+    ("http://Funcultural.PortoVelho.ro.gov.br/noticias", f"{BASE}/noticias"),
+    # porta padrão
+    ("https://funcultural.portovelho.ro.gov.br:443/noticias", f"{BASE}/noticias"),
+    ("http://funcultural.portovelho.ro.gov.br:80/noticias", f"{BASE}/noticias"),
+    ("https://funcultural.portovelho.ro.gov.br:8080/noticias", "https://funcultural.portovelho.ro.gov.br:8080/noticias"),
+    # barra final (a raiz continua "/")
+    (f"{BASE}/noticias/", f"{BASE}/noticias"),
+    (f"{BASE}", f"{BASE}/"),
+    # ordem da query
+    (f"{BASE}/noticias?page=2&busca=samba", f"{BASE}/noticias?busca=samba&page=2"),
+    # fragmento
+    (f"{BASE}/noticias#topo", f"{BASE}/noticias"),
+    # relativa, resolvida contra a base
+    ("/uploads/a.jpg", f"{BASE}/uploads/a.jpg"),
+])
+def test_canonicalizar_url(url, esperada):
+    assert canonicalizar_url(url) == esperada
+
+
+@pytest.mark.parametrize("url, esperada", [
+    # espaços e acentos são codificados; escapes em minúsculas vão para maiúsculas
+    ("/uploads/Foto Mercado.jpg", f"{BASE}/uploads/Foto%20Mercado.jpg"),
+    ("/uploads/programação.jpg", f"{BASE}/uploads/programa%C3%A7%C3%A3o.jpg"),
+    ("/uploads/programa%c3%a7%c3%a3o.jpg", f"{BASE}/uploads/programa%C3%A7%C3%A3o.jpg"),
+    # escapes de caracteres não reservados são decodificados
+    ("/uploads/%41rquivo%2Dfinal%7E.jpg", f"{BASE}/uploads/Arquivo-final~.jpg"),
+    # escapes de reservados mudam o caminho: ficam como estão
+    ("/uploads/a%2Fb.jpg", f"{BASE}/uploads/a%2Fb.jpg"),
+    ("/uploads/Jeise%20Gomes%2C.jpg", f"{BASE}/uploads/Jeise%20Gomes%2C.jpg"),
+    # % sem escape válido
+    ("/uploads/50%off.jpg", f"{BASE}/uploads/50%25off.jpg"),
+])
+def test_percent_encoding(url, esperada):
+    assert canonicalizar_url(url) == esperada
+
+
+def test_canonicalizar_e_idempotente():
+    url = canonicalizar_url("http://Funcultural.portovelho.ro.gov.br/uploads/a%2fb c%41.jpg?z=1&a=2#x")
+    assert canonicalizar_url(url) == url
+
+
+def test_url_que_nao_e_http():
+    assert canonicalizar_url("mailto:contato@exemplo.test") == "mailto:contato@exemplo.test"
+    assert canonicalizar_url("") == ""
+
+
+def test_chave_de_artigo_ignora_o_slug():
+    chave = f"{BASE}/artigo/52635"
+
+    assert chave_url(f"{BASE}/artigo/52635/folia-a-vista") == chave
+    assert chave_url("http://funcultural.portovelho.ro.gov.br/artigo/52635/titulo-editado/") == chave
+    assert chave_url(f"{BASE}/artigo/52635") == chave
+    assert id_artigo(f"{BASE}/artigo/52635/folia-a-vista") == "52635"
+
+
+def test_chave_de_outras_paginas():
+    assert chave_url(f"{BASE}/noticias?page=2") == f"{BASE}/noticias?page=2"
+    assert id_artigo(f"{BASE}/noticias") is None
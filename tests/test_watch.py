@@ -0,0 +1,107 @@
+"""
+Modo --watch: cards que falham são repetidos e os validadores da
+página 1 só são guardados depois da publicação.
+"""
+
+import pytest
+
+from scraping import cache, watch
+from scraping.sources import FonteFuncultural
+from scraping.watch import Vigia
+
+LISTAGEM = "https://funcultural.portovelho.ro.gov.br/noticias?page=1"
+ARTIGO_1 = (
+    "https://funcultural.portovelho.ro.gov.br/artigo/52635/"
+    "folia-a-vista-reuniao-no-predio-do-relogio-define-ultimos-ajustes-para-o-carnaval-2026"
+)
+ARTIGO_2 = (
+    "https://funcultural.portovelho.ro.gov.br/artigo/52471/"
+    "comemoracao-celebracao-ao-dia-do-samba-movimenta-o-mercado-cultural"
+)
+
+
+class FonteTeste(FonteFuncultural):
+    intervalo = 0
+
+
+class PipelineFalso:
+    """
+    Registra os eventos publicados em vez de gravar as saídas.
+    """
+
+    publicados = []
+    falhar = False
+    ttl_na_coleta = None
+
+    def __init__(self, arquivador=None):
+        pass
+
+    def incorporar(self, eventos, registro=None):
+        self.eventos = eventos
+        return self
+
+    def coletar(self, retomar=False):
+        PipelineFalso.ttl_na_coleta = cache._ttl_padrao
+        self.eventos = []
+        return self
+
+    def arquivar(self):
+        return self
+
+    def publicar(self):
+        if PipelineFalso.falhar:
+            raise OSError("disco cheio")
+        PipelineFalso.publicados.extend(ev.link_evento for ev in self.eventos)
+        return self
+
+
+@pytest.fixture
+def vigia(monkeypatch):
+    PipelineFalso.publicados = []
+    PipelineFalso.falhar = False
+    monkeypatch.setattr(watch, "Pipeline", PipelineFalso)
+    monkeypatch.setattr(Vigia, "carregar_links", lambda self: None)
+    return Vigia(fontes=[FonteTeste()])
+
+
+def test_card_com_falha_e_repetido(vigia, reproduzir, listagem_html, artigo_html):
+    # o segundo artigo ainda não está disponível (404)
+    reproduzir({LISTAGEM: listagem_html, ARTIGO_1: artigo_html})
+
+    assert vigia.verificar() == 1
+    assert PipelineFalso.publicados == [ARTIGO_1]
+    assert list(vigia.repetir["funcultural"]) == ["https://funcultural.portovelho.ro.gov.br/artigo/52471"]
+    assert vigia.estado["funcultural"]["hash"]
+
+    # a página 1 não mudou, mas o card que falhou é tentado de novo
+    reproduzir({LISTAGEM: listagem_html, ARTIGO_1: artigo_html, ARTIGO_2: artigo_html})
+
+    assert vigia.verificar() == 1
+    assert PipelineFalso.publicados == [ARTIGO_1, ARTIGO_2]
+    assert vigia.repetir["funcultural"] == {}
+
+    assert vigia.verificar() == 0
+
+
+def test_validadores_so_depois_da_publicacao(vigia, reproduzir, listagem_html, artigo_html):
+    reproduzir({LISTAGEM: listagem_html, ARTIGO_1: artigo_html, ARTIGO_2: artigo_html})
+
+    PipelineFalso.falhar = True
+    with pytest.raises(OSError):
+        vigia.verificar()
+    assert vigia.estado["funcultural"]["hash"] is None
+
+    # no ciclo seguinte a página 1 é comparada de novo e os cards voltam
+    PipelineFalso.falhar = False
+    assert vigia.verificar() == 2
+    assert vigia.estado["funcultural"]["hash"]
+
+
+def test_reconciliacao_ignora_o_cache(vigia):
+    vigia.repetir["funcultural"] = {"x": {}}
+
+    vigia.reconciliar()
+
+    assert PipelineFalso.ttl_na_coleta == 0
+    assert cache._ttl_padrao == cache.CACHE_TTL
+    assert vigia.repetir["funcultural"] == {}
@@ -0,0 +1,54 @@
+"""
+Fila da coleta distribuída: falhas mantêm a fila e voltam na retomada.
+"""
+
+from scraping.sources import FonteFuncultural
+from scraping.worker import Coordenador
+from scraping.workqueue import FALHOU, PENDENTE, FilaTrabalho
+
+
+def fila_com_falha(tmp_path):
+    fila = FilaTrabalho(str(tmp_path / "fila.sqlite"), tentativas=1)
+    fila.semear([FonteFuncultural()])
+
+    tarefa = fila.reservar("w1")
+    fila.falhar(tarefa, "w1")
+    return fila
+
+
+def test_falha_depois_das_tentativas(tmp_path):
+    fila = fila_com_falha(tmp_path)
+
+    assert fila.terminada()
+    assert fila.falhas() == [("pagina", "1")]
+
+
+def test_publicar_mantem_a_fila_com_falhas(tmp_path):
+    fila = fila_com_falha(tmp_path)
+    coordenador = Coordenador(fila=fila, fontes=[FonteFuncultural()])
+
+    assert coordenador.publicar() == 0
+    assert coordenador.falhas == [("pagina", "1")]
+    assert fila.existe()
+
+
+def test_publicar_remove_a_fila_sem_falhas(tmp_path):
+    fila = FilaTrabalho(str(tmp_path / "fila.sqlite"))
+    fila.semear([FonteFuncultural()])
+    tarefa = fila.reservar("w1")
+    fila.concluir(tarefa, "w1")
+
+    Coordenador(fila=fila, fontes=[FonteFuncultural()]).publicar()
+
+    assert not fila.existe()
+
+
+def test_reabrir_falhas(tmp_path):
+    fila = fila_com_falha(tmp_path)
+
+    assert fila.reabrir_falhas() == 1
+    assert fila.contagem()[FALHOU] == 0
+    assert fila.contagem()[PENDENTE] == 1
+
+    # as tentativas foram zeradas: a tarefa pode ser reservada de novo
+    assert fila.reservar("w2").chave == "1"